@@ -19,6 +19,7 @@ from utils.auth import (
     get_current_user
 )
 from services.google_auth_service import GoogleAuthService
+from services.executors import run_blocking
 
 logger = logging.getLogger(__name__)
 # router = APIRouter(prefix="/api/auth", tags=["Authentication"])
@@ -247,7 +248,8 @@ async def google_callback(code: str, state: str = None):
         logger.info(f"[Google OAuth] Code received: {code[:30]}...")
 
         # Exchange code for token & get user info
-        token_data = google_auth_service.exchange_code_for_token(code)
+        # Google SDK call is blocking; keep it off the event loop
+        token_data = await run_blocking("upstream", google_auth_service.exchange_code_for_token, code)
         user_info = token_data["user_info"]
         logger.info(f"[Google OAuth] User info received: {user_info}")
 
@@ -1,29 +1,55 @@
 # backend/api/knowledge.py
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from services.coci_service import COCIService
-from services.openalex_graph_service import OpenAlexGraphService
+from services.openalex_graph_service import OpenAlexGraphService, normalize_doi, MAX_GRAPH_DEPTH
 from services.crossref_service import CrossRefService
 from services.lens_service import LensService
-from services.cache_service import CacheService
+from services.cache_service import get_cache_service
+from services.http_client import get_async_client
+from services.executors import run_blocking
+from services.cooccurrence_service import cooccurrence_graph
+from services.graph_store import GraphStore
+from services.graph_analytics import analyze_graph
+from services.graph_layout import layout_graph, LAYOUTS, LayoutTooLargeError
 import logging
-import requests
+import json
 import re
-from typing import List, Dict
+import os
+import asyncio
+import math
+from datetime import datetime
+from typing import List, Dict, Optional
 
 OPENALEX_BASE = "https://api.openalex.org"
-SESSION = requests.Session()
-SESSION.headers.update({"User-Agent": "IC-Easy/knowledge-graph"})
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/knowledge", tags=["Knowledge Graph"])
 
 # Initialize service clients
+cache = get_cache_service()  # shared with the literature search; namespaces use NAMESPACE_TTLS
 coci = COCIService()
-openalex = OpenAlexGraphService()
+openalex = OpenAlexGraphService(cache=cache)
 lens = LensService()
 crossref = CrossRefService()
-cache = CacheService(ttl_seconds=86400)  # 1 day cache
+graph_store = GraphStore()  # local adjacency for neighbourhoods fetched before
+
+# Citation providers are raced: each one starts this many seconds after the
+# previous one (or immediately once an earlier provider fails or comes back empty)
+PROVIDER_HEDGE_DELAY = float(os.getenv("KNOWLEDGE_HEDGE_DELAY", "0.75"))
+# Overall budget for the provider race before falling back to CrossRef metadata
+PROVIDER_TIMEOUT = float(os.getenv("KNOWLEDGE_PROVIDER_TIMEOUT", "20"))
+# After the first provider returns edges, keep collecting others this long to merge them
+PROVIDER_MERGE_WINDOW = float(os.getenv("KNOWLEDGE_MERGE_WINDOW", "2.0"))
+# Maximum number of unlabelled nodes resolved by the bulk label lookup
+MAX_LABEL_ENRICHMENT = 200
+# Topic graphs: minimum works fetched per keyword (shared by all views) and fields needed
+TOPIC_WORKS_MIN = 25
+# Upper bound on works per topic query; OpenAlex pages hold at most 200 results
+TOPIC_WORKS_MAX = int(os.getenv("TOPIC_WORKS_MAX", "2000"))
+OPENALEX_MAX_PER_PAGE = 200
+TOPIC_WORK_FIELDS = "id,title,doi,cited_by_count,referenced_works,concepts"
 
 
 def clean_html_tags(text: str) -> str:
@@ -56,8 +82,17 @@ def normalize_graph(graph: dict, doi: str, source_name: str):
         group = node.get("type") or node.get("group") or "paper"
         meta = {
             "source": source_name,
-            "doi": node.get("doi") or (node_id if "10." in node_id else None)
+            "doi": normalize_doi(node.get("doi")) or (node_id.lower() if "10." in node_id else None)
         }
+        # Provider identifiers used to resolve the same work across sources
+        if node.get("openalex_id"):
+            meta["openalex_id"] = node["openalex_id"]
+        if node.get("lens_id"):
+            meta["lens_id"] = node["lens_id"]
+        if node.get("hop") is not None:
+            meta["hop"] = node["hop"]
+        if node.get("cited_by_count") is not None:
+            meta["cited_by"] = node["cited_by_count"]
         nodes.append({
             "id": node_id,
             "label": label[:150],
@@ -87,52 +122,334 @@ def normalize_graph(graph: dict, doi: str, source_name: str):
     }
 
 
+def _identity(value: str) -> str:
+    """Comparable form of a node identifier (DOIs are case-insensitive)."""
+    return value.lower() if value.startswith("10.") else value
+
+
+def merge_graphs(graphs: List[dict], doi: str) -> dict:
+    """
+    Union normalized graphs from several providers into one graph.
+
+    Nodes are matched across providers when they share a DOI, OpenAlex ID or
+    Lens ID (transitively, via union-find). Merged nodes use the DOI as their
+    ID when one is known; labels and groups come from the earliest graph
+    that has an informative value, so `graphs` should be in preference order.
+    """
+    graphs = [g for g in graphs if g]
+    if len(graphs) == 1:
+        return graphs[0]
+
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def identifiers(node):
+        meta = node["meta"]
+        ids = [node["id"], meta.get("doi"), meta.get("openalex_id"), meta.get("lens_id")]
+        return [_identity(i) for i in ids if i]
+
+    # Pass 1: link every identifier a node carries
+    for graph in graphs:
+        for node in graph["nodes"]:
+            ids = identifiers(node)
+            root = find(ids[0])
+            for other in ids[1:]:
+                other_root = find(other)
+                if other_root != root:
+                    parent[other_root] = root
+
+    # Pass 2: group nodes by identity, in preference order
+    groups = {}
+    for graph in graphs:
+        for node in graph["nodes"]:
+            groups.setdefault(find(_identity(node["id"])), []).append(node)
+
+    center_doi = normalize_doi(doi)
+    canonical = {}
+    nodes = []
+    for root, members in groups.items():
+        dois = [m["meta"].get("doi") for m in members if m["meta"].get("doi")]
+        openalex_ids = [m["meta"].get("openalex_id") for m in members if m["meta"].get("openalex_id")]
+        lens_ids = [m["meta"].get("lens_id") for m in members if m["meta"].get("lens_id")]
+        node_doi = center_doi if center_doi in dois else (dois[0] if dois else None)
+        node_id = node_doi or (openalex_ids[0] if openalex_ids else members[0]["id"])
+        canonical[root] = node_id
+
+        known_ids = {_identity(i) for m in members for i in identifiers(m)}
+        label = next(
+            (m["label"] for m in members
+             if m["label"] and m["label"] != "Untitled" and not m["label"].startswith("DOI:")
+             and _identity(m["label"]) not in known_ids),
+            members[0]["label"]
+        )
+        groups_seen = [m["group"] for m in members]
+        sources = list(dict.fromkeys(m["meta"]["source"] for m in members))
+        meta = {"source": sources[0], "sources": sources, "doi": node_doi}
+        if openalex_ids:
+            meta["openalex_id"] = openalex_ids[0]
+        if lens_ids:
+            meta["lens_id"] = lens_ids[0]
+        nodes.append({
+            "id": node_id,
+            "label": label,
+            "group": "center" if "center" in groups_seen or node_doi == center_doi else groups_seen[0],
+            "meta": meta
+        })
+
+    # Edges: re-point endpoints to canonical IDs and drop duplicates
+    edges = {}
+    for graph in graphs:
+        for edge in graph["edges"]:
+            src = canonical.get(find(_identity(edge["source"])))
+            tgt = canonical.get(find(_identity(edge["target"])))
+            if not src or not tgt or src == tgt:
+                continue
+            key = (src, tgt)
+            if key in edges:
+                if graph["source"] not in edges[key]["sources"]:
+                    edges[key]["sources"].append(graph["source"])
+                continue
+            edges[key] = {**edge, "source": src, "target": tgt, "sources": [graph["source"]]}
+
+    sources = [g["source"] for g in graphs]
+    return {
+        "nodes": nodes,
+        "edges": list(edges.values()),
+        "source": " + ".join(sources),
+        "message": f"Merged data from {', '.join(sources)}"
+    }
+
+
+async def _enrich_labels(graph: dict):
+    """
+    Replace DOI-only / placeholder labels with titles from one batched
+    OpenAlex DOI lookup (instead of one request per node).
+    """
+    missing = [
+        node for node in graph["nodes"]
+        if node["meta"].get("doi") and (
+            node["label"] in ("", "Untitled")
+            or node["label"].startswith("DOI:")
+            or _identity(node["label"]) in (node["meta"]["doi"], _identity(node["id"]))
+        )
+    ][:MAX_LABEL_ENRICHMENT]
+    if not missing:
+        return graph
+
+    try:
+        works = await openalex.works_by_dois([node["meta"]["doi"] for node in missing])
+    except Exception as e:
+        logger.warning(f"[KnowledgeGraph] Label enrichment failed: {e}")
+        return graph
+
+    for node in missing:
+        work = works.get(node["meta"]["doi"])
+        if work and work.get("display_name"):
+            node["label"] = clean_html_tags(work["display_name"])[:150]
+            node["meta"].setdefault("openalex_id", work.get("id"))
+    logger.info(f"[KnowledgeGraph] Enriched {sum(1 for n in missing if n['meta'].get('openalex_id'))}/{len(missing)} labels")
+    return graph
+
+
  
 # Unified Citation Graph Endpoint
  
 @router.get("/citation-graph/{doi:path}")
-async def get_citation_graph(doi: str, max_nodes: int = 60):
+async def get_citation_graph(doi: str, max_nodes: int = 60, merge: bool = True, depth: int = 1,
+                             analytics: bool = False, layout: Optional[str] = None):
     """
     Build a citation knowledge graph by combining multiple open data sources:
     1. OpenCitations (COCI)
     2. OpenAlex
     3. Lens.org
     4. CrossRef metadata fallback
+
+    With merge=true (default) the providers' graphs are unioned with node
+    identity resolved across DOI / OpenAlex / Lens IDs; otherwise the first
+    provider with edges wins.
+
+    depth > 1 expands references and citing works breadth-first (OpenAlex,
+    up to MAX_GRAPH_DEPTH hops); max_nodes is then a global node budget,
+    shared evenly by the hops so every requested level is present.
+
+    analytics=true adds pagerank, in/out degree, betweenness and community
+    to every node's meta (see services/graph_analytics.py); layout=fr|kk
+    adds precomputed x/y positions (see services/graph_layout.py); graphs above
+    LAYOUT_MAX_NODES get a 422 instead.
     """
+    _check_layout(layout)
 
     # Normalize DOI input
     doi = doi.replace("https://doi.org/", "").strip().lower()
     logger.info(f"[KnowledgeGraph] Building graph for {doi}")
 
-    # Step 1: Check cache
-    cached = cache.get(doi)
+    depth = max(1, min(depth, MAX_GRAPH_DEPTH))
+    key = f"{doi}|{max_nodes}|{'merged' if merge else 'first'}" + (f"|d{depth}" if depth > 1 else "")
+
+    # Cached per DOI, size, mode and depth; concurrent misses share one upstream build
+    async def fetch_graph():
+        return await cache.get_or_fetch(
+            "citation_graph", key,
+            lambda: _build_citation_graph(doi, max_nodes, merge, depth)
+        )
+
+    return await _annotated("citation", key, fetch_graph, analytics, layout)
+
+
+@router.get("/citation-graph-stream/{doi:path}")
+async def stream_citation_graph(doi: str, max_nodes: int = 60, format: str = "ndjson"):
+    """
+    Streaming variant of /citation-graph for progressive rendering.
+
+    Events (NDJSON lines with an "event" field, or SSE with format=sse):
+    - center / references / citing: nodes and edges to add, sent as each
+      OpenAlex call completes (the center usually arrives in well under a second)
+    - graph: a complete graph, sent instead when it is already cached or when
+      OpenAlex has no citation data (the full provider race then runs)
+    - done: final counts and source
+    - error: upstream failure message (the stream still ends with done; the
+      incomplete graph is not written to the graph store)
+    """
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+    doi = doi.replace("https://doi.org/", "").strip().lower()
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        _citation_graph_events(doi, max_nodes, format),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _citation_graph_events(doi: str, max_nodes: int, fmt: str):
+    def encode(event: str, payload: dict) -> str:
+        if fmt == "sse":
+            return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        return json.dumps({"event": event, **payload}) + "\n"
+
+    cached = cache.get(f"{doi}|{max_nodes}|merged", "citation_graph")
     if cached:
-        logger.info(f"[Cache] Hit for DOI: {doi}")
-        return cached
+        yield encode("graph", cached)
+        yield encode("done", {"source": cached.get("source"), "nodes": len(cached["nodes"]),
+                              "edges": len(cached["edges"])})
+        return
 
-    # Step 2: Data sources in priority order
+    nodes, edges = [], []
+    complete = False
+    try:
+        async for kind, piece in openalex.stream_citation_graph(doi, max_nodes):
+            normalized = normalize_graph(piece, doi, "OpenAlex")
+            nodes.extend(normalized["nodes"])
+            edges.extend(normalized["edges"])
+            yield encode(kind, {"nodes": normalized["nodes"], "edges": normalized["edges"]})
+        complete = True
+    except Exception as e:
+        logger.warning(f"[KnowledgeGraph] Streaming from OpenAlex failed for {doi}: {e}")
+        yield encode("error", {"message": f"OpenAlex failed: {e}"})
+
+    if edges:
+        graph = {"nodes": nodes, "edges": edges, "source": "OpenAlex", "message": "Data from OpenAlex"}
+        if complete:
+            # Only a stream that ran to the end reflects the whole depth-1 neighbourhood
+            await _store_graph(graph, [doi], max_nodes, "first")
+    else:
+        # No progressive data: run the regular (cached) build with all providers and fallbacks
+        graph = await get_citation_graph(doi, max_nodes)
+        yield encode("graph", graph)
+    yield encode("done", {"source": graph.get("source"), "nodes": len(graph["nodes"]), "edges": len(graph["edges"])})
+
+
+def _check_layout(layout: Optional[str]):
+    if layout and layout not in LAYOUTS:
+        raise HTTPException(status_code=400, detail=f"Unknown layout '{layout}'. Use one of: {', '.join(LAYOUTS)}")
+
+
+async def _annotated(kind: str, key: str, fetch_graph, analytics: bool, layout: Optional[str]) -> dict:
+    """
+    Graph from `fetch_graph`, optionally annotated with analytics and/or
+    layout positions. Each stage is cached under the graph's key, so repeat
+    views skip both the upstream build and the CPU work.
+    """
+    if analytics:
+        fetch_plain = fetch_graph
+
+        async def fetch_graph():
+            return await cache.get_or_fetch(
+                "graph_analytics", f"{kind}|{key}", lambda: _run_cpu(analyze_graph, fetch_plain())
+            )
+
+    if layout:
+        try:
+            return await cache.get_or_fetch(
+                "graph_layout", f"{kind}|{key}|{layout}|{'analytics' if analytics else 'plain'}",
+                lambda: _run_cpu(layout_graph, fetch_graph(), layout)
+            )
+        except LayoutTooLargeError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    return await fetch_graph()
+
+
+async def _run_cpu(func, graph_coro, *args) -> dict:
+    """Await a graph, then transform it on the CPU pool."""
+    graph = await graph_coro
+    return await run_blocking("cpu", func, graph, *args)
+
+
+async def _build_citation_graph(doi: str, max_nodes: int, merge: bool = True, depth: int = 1):
+    """
+    Answer from the local graph store when its neighbourhoods are fresh and
+    were built the same way (merged / first provider / multi-hop), otherwise
+    race the citation providers for a DOI (storing the result), then fall
+    back to CrossRef metadata. Fallback graphs skip the graph store, but the
+    caller's get_or_fetch caches them in "citation_graph" like any result.
+    """
+    mode = "multihop" if depth > 1 else ("merged" if merge else "first")
+    try:
+        local = await run_blocking("cpu", graph_store.neighbourhood, doi, depth, max_nodes, mode)
+        if local:
+            logger.info(f"[KnowledgeGraph] Served {doi} (depth {depth}) from local graph store")
+            return local
+    except Exception as e:
+        logger.warning(f"[GraphStore] Local lookup failed for {doi}: {e}")
+
+    if depth > 1:
+        # Multi-hop expansion relies on batched frontier lookups, which only OpenAlex offers
+        try:
+            graph = normalize_graph(await openalex.expand_citation_graph(doi, max_nodes, depth), doi, "OpenAlex")
+            if graph and graph["edges"]:
+                # Every level below the deepest one present was expanded
+                deepest = max(node["meta"].get("hop", 0) for node in graph["nodes"])
+                expanded = [node["id"] for node in graph["nodes"] if node["meta"].get("hop", 0) < deepest]
+                await _store_graph(graph, expanded, max_nodes, "multihop")
+                return graph
+            logger.info(f"[KnowledgeGraph] Multi-hop expansion empty for {doi}, using depth 1")
+        except Exception as e:
+            logger.warning(f"[KnowledgeGraph] Multi-hop expansion failed for {doi}: {e}")
+
+    # Step 1: Data sources in priority order, raced with hedging
     SOURCES = [
         ("OpenCitations (COCI)", lambda: coci.get_citation_graph(doi, max_nodes)),
         ("OpenAlex", lambda: openalex.build_citation_graph(doi, max_nodes)),
         ("Lens.org", lambda: lens.get_citation_graph(doi, max_nodes)),
     ]
 
-    for name, fetch_func in SOURCES:
-        try:
-            graph = fetch_func()
-            normalized = normalize_graph(graph, doi, name)
-            if normalized and normalized["edges"]:
-                logger.info(f"[KnowledgeGraph] Success with {name}")
-                cache.set(doi, normalized)
-                return normalized
-        except Exception as e:
-            logger.warning(f"[{name}] failed: {e}")
+    graphs = await _race_providers(doi, SOURCES, PROVIDER_MERGE_WINDOW if merge else 0)
+    if graphs:
+        graph = await _enrich_labels(merge_graphs(graphs, doi))
+        await _store_graph(graph, [doi], max_nodes, "merged" if merge else "first")
+        return graph
 
-    # Step 3: Fallback – CrossRef metadata only
+    # Step 2: Fallback – CrossRef metadata only
     try:
-        meta = crossref.get_by_doi(doi)
+        meta = await crossref.get_by_doi_async(doi)
         if meta:
-            graph = {
+            return {
                 "nodes": [
                     {
                         "id": doi,
@@ -145,13 +462,11 @@ async def get_citation_graph(doi: str, max_nodes: int = 60):
                 "source": "CrossRef",
                 "message": "No citation data — showing metadata from CrossRef."
             }
-            cache.set(doi, graph)
-            return graph
     except Exception as e:
         logger.warning(f"[CrossRef] failed: {e}")
 
-    # Step 4: No data available
-    graph = {
+    # Step 3: No data available
+    return {
         "nodes": [
             {"id": doi, "label": f"DOI: {doi}", "group": "paper", "meta": {"source": "None"}}
         ],
@@ -159,23 +474,114 @@ async def get_citation_graph(doi: str, max_nodes: int = 60):
         "source": "None",
         "message": "This paper is not indexed in any open database."
     }
-    cache.set(doi, graph)
-    return graph
 
 
+async def _store_graph(graph: dict, expanded: List[str], max_nodes: int, mode: str):
+    """Feed a freshly built graph into the local graph store (failures are only logged)."""
+    try:
+        await run_blocking("cpu", graph_store.add_graph, graph, expanded, max_nodes, mode)
+    except Exception as e:
+        logger.warning(f"[GraphStore] Failed to store graph: {e}")
+
+
+async def _race_providers(doi: str, sources, merge_window: float = 0) -> List[dict]:
+    """
+    Run citation providers concurrently with hedged starts.
+
+    Provider i starts after i * PROVIDER_HEDGE_DELAY seconds, or as soon as every
+    provider before it has failed. With merge_window=0 the first normalized
+    graph with edges wins (ties broken by list order); otherwise other providers
+    get `merge_window` more seconds to finish so their graphs can be merged.
+    Providers still running at the end are cancelled, so worst-case latency is
+    that of the slowest single provider.
+
+    Returns:
+        Normalized graphs with edges, in provider preference order (may be empty)
+    """
+    start_now = [asyncio.Event() for _ in sources]
+    failed = [False] * len(sources)
+
+    def release_next():
+        # Start every provider whose predecessors have all failed
+        for i in range(len(sources)):
+            if all(failed[:i]):
+                start_now[i].set()
+
+    async def run(index: int, name: str, fetch_func):
+        try:
+            await asyncio.wait_for(start_now[index].wait(), timeout=index * PROVIDER_HEDGE_DELAY)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            return normalize_graph(await fetch_func(), doi, name)
+        except Exception as e:
+            logger.warning(f"[{name}] failed: {e}")
+            return None
+
+    tasks = [
+        asyncio.create_task(run(i, name, fetch_func))
+        for i, (name, fetch_func) in enumerate(sources)
+    ]
+    start_now[0].set()
+    pending = set(tasks)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + PROVIDER_TIMEOUT
+    winners = {}
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                if not winners:
+                    logger.warning(f"[KnowledgeGraph] Provider race timed out for {doi}")
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                index = tasks.index(task)
+                normalized = task.result()
+                if normalized and normalized["edges"]:
+                    if not winners:
+                        # First success: give the others merge_window more seconds
+                        deadline = min(deadline, loop.time() + merge_window)
+                    winners[index] = normalized
+                    logger.info(f"[KnowledgeGraph] Success with {sources[index][0]}")
+                else:
+                    failed[index] = True
+            if winners and merge_window <= 0:
+                break
+            release_next()
+        return [winners[i] for i in sorted(winners)][: None if merge_window > 0 else 1]
+    finally:
+        for task in pending:
+            task.cancel()
+
  
 # Optional: Author Network (using OpenAlex)
  
 @router.get("/author-network/{author_id}")
-async def get_author_network(author_id: str, limit: int = 50):
+async def get_author_network(author_id: str, limit: int = 50, analytics: bool = False,
+                             layout: Optional[str] = None):
     """
     Build a co-author network for a given OpenAlex author ID.
     Example: A1969205039
+
+    All of the author's works are aggregated; `limit` caps the number of
+    co-authors returned (most frequent first). analytics and layout work
+    as in the citation graph endpoint.
     """
+    _check_layout(layout)
+    async def fetch():
+        graph = await openalex.build_author_network(author_id, limit)
+        return normalize_graph(graph, author_id, "OpenAlex Author Network")
+
+    async def fetch_network():
+        return await cache.get_or_fetch("author_network", f"{author_id}|{limit}", fetch)
+
     try:
-        graph = openalex.build_author_network(author_id, limit)
-        normalized = normalize_graph(graph, author_id, "OpenAlex Author Network")
-        return normalized
+        return await _annotated("author", f"{author_id}|{limit}", fetch_network, analytics, layout)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.warning(f"[AuthorNetwork] failed: {e}")
         return {"nodes": [], "edges": [], "message": "Unable to build author network."}
@@ -189,9 +595,14 @@ async def get_topic_evolution(keyword: str, years: int = 10):
     """
     Return publication trend for a given keyword (per year) using OpenAlex data.
     """
+    async def fetch():
+        return await openalex.topic_trend(keyword, years)
+
+    # Cached per keyword and year range (the range rolls over with the calendar year)
+    end = datetime.utcnow().year
+    key = f"{keyword.strip().lower()}|{end - years + 1}-{end}"
     try:
-        trend = openalex.topic_trend(keyword, years)
-        return trend
+        return await cache.get_or_fetch("topic_trend", key, fetch)
     except Exception as e:
         logger.warning(f"[TopicEvolution] failed: {e}")
         return {"keyword": keyword, "points": [], "message": "Trend data unavailable"}
@@ -203,7 +614,7 @@ async def author_search(name: str, per_page: int = 8):
     Search OpenAlex authors by display name and return a compact list.
     """
     params = {"search": name, "per-page": per_page}
-    r = SESSION.get(f"{OPENALEX_BASE}/authors", params=params, timeout=20)
+    r = await get_async_client().get(f"{OPENALEX_BASE}/authors", params=params, timeout=20)
     r.raise_for_status()
     data = r.json()
     results = []
@@ -219,15 +630,45 @@ async def author_search(name: str, per_page: int = 8):
         })
     return results
 
-def _top_cited_works(keyword: str, n: int = 10) -> List[Dict]:
+async def _top_cited_works(keyword: str, n: int = 10) -> List[Dict]:
     """
     Return top-cited works for a keyword using OpenAlex search.
+
+    Results are cached per keyword ("topic_works" namespace) and concurrent
+    misses share one request. At least TOPIC_WORKS_MIN works are fetched, so
+    the topic-graph views (n=10 / n=20) are all served from the same entry.
     """
-    params = {"search": keyword, "sort": "cited_by_count:desc", "per-page": n}
-    r = SESSION.get(f"{OPENALEX_BASE}/works", params=params, timeout=30)
-    r.raise_for_status()
+    n = min(n, TOPIC_WORKS_MAX)
+    size = max(n, TOPIC_WORKS_MIN)
+    key = f"{' '.join(keyword.lower().split())}|{size}"
+    works = await cache.get_or_fetch("topic_works", key, lambda: _fetch_top_cited_works(keyword, size))
+    return (works or [])[:n]
+
+
+async def _fetch_top_cited_works(keyword: str, n: int) -> Optional[List[Dict]]:
+    """
+    OpenAlex query with a field projection; more than one page of results is
+    fetched as concurrent page requests. Returns None when nothing matched,
+    so empty results are not cached.
+    """
+    per_page = min(n, OPENALEX_MAX_PER_PAGE)
+    client = get_async_client()
+    responses = await asyncio.gather(*[
+        client.get(
+            f"{OPENALEX_BASE}/works",
+            params={"search": keyword, "sort": "cited_by_count:desc", "per-page": per_page,
+                    "page": page, "select": TOPIC_WORK_FIELDS},
+            timeout=30
+        )
+        for page in range(1, math.ceil(n / per_page) + 1)
+    ])
+    results = []
+    for r in responses:
+        r.raise_for_status()
+        results.extend(r.json().get("results", []))
+
     works = []
-    for w in r.json().get("results", []):
+    for w in results[:n]:
         raw_title = w.get("title") or ""
         works.append({
             "id": w.get("id"),  # https://openalex.org/W...
@@ -236,8 +677,27 @@ def _top_cited_works(keyword: str, n: int = 10) -> List[Dict]:
             "cited_by_count": w.get("cited_by_count", 0),
             "referenced_works": w.get("referenced_works", []) or [],  # list of openalex ids
             "concepts": [clean_html_tags(c.get("display_name", "")) for c in (w.get("concepts") or [])],
+            "concept_scores": [c.get("score", 1.0) for c in (w.get("concepts") or [])],
         })
-    return works
+    return works or None
+
+
+@router.get("/topic-graph/{keyword}")
+async def topic_graph(keyword: str, n: int = 10, keyword_n: int = 20, min_cooc: int = 2,
+                      top_k: Optional[int] = None, weighted: bool = False):
+    """
+    All three topic-graph views for a keyword from one top-cited fetch:
+    top-cited mind map and cross-reference network over the top `n` works,
+    keyword co-occurrence over the top `keyword_n` works.
+    """
+    works = await _top_cited_works(keyword, max(n, keyword_n))
+    return {
+        "keyword": keyword,
+        "top_cited": _top_cited_graph(keyword, works[:n]),
+        "cross_ref": _cross_ref_graph(works[:n]),
+        "keywords": await run_blocking("cpu", _keyword_graph, works[:keyword_n], min_cooc, top_k, weighted),
+    }
+
 
 @router.get("/topic-graph/{keyword}/top-cited")
 async def topic_top_cited(keyword: str, n: int = 10):
@@ -246,7 +706,10 @@ async def topic_top_cited(keyword: str, n: int = 10):
     - center node = keyword
     - child nodes = top-cited papers under this keyword
     """
-    works = _top_cited_works(keyword, n)
+    return _top_cited_graph(keyword, await _top_cited_works(keyword, n))
+
+
+def _top_cited_graph(keyword: str, works: List[Dict]) -> dict:
     center_id = f"topic::{keyword.lower()}"
     nodes = [{"id": center_id, "label": keyword, "group": "topic", "meta": {"source": "OpenAlex"}}]
     edges = []
@@ -267,7 +730,10 @@ async def topic_cross_ref(keyword: str, n: int = 10):
     Build a cross-reference network among the top-cited papers.
     Edge exists when paper A references paper B inside the same top list.
     """
-    works = _top_cited_works(keyword, n)
+    return _cross_ref_graph(await _top_cited_works(keyword, n))
+
+
+def _cross_ref_graph(works: List[Dict]) -> dict:
     index = {w["id"]: w for w in works}
     # nodes
     nodes = [{
@@ -287,36 +753,38 @@ async def topic_cross_ref(keyword: str, n: int = 10):
 
 
 @router.get("/topic-graph/{keyword}/keywords")
-async def topic_keywords(keyword: str, n: int = 20):
+async def topic_keywords(keyword: str, n: int = 20, min_cooc: int = 2, top_k: Optional[int] = None,
+                         weighted: bool = False):
     """
     Build a keyword co-occurrence graph from top-cited works.
     Nodes = keywords (concept names), edges weighted by co-occurrence counts.
+
+    Args:
+        n: Number of top-cited works (up to TOPIC_WORKS_MAX)
+        min_cooc: Minimum number of shared works for an edge
+        top_k: Keep only the k strongest edges
+        weighted: Weight edges by OpenAlex concept scores instead of counts
     """
-    works = _top_cited_works(keyword, n)
-    # collect concepts per work
-    import itertools
-    concept_counts = {}
-    for w in works:
-        concepts = sorted(set(w["concepts"] or []))
-        # node freq
-        for c in concepts:
-            concept_counts[c] = concept_counts.get(c, 0) + 1
-        # co-occurrence edges
-        for a, b in itertools.combinations(concepts, 2):
-            key = tuple(sorted((a, b)))
-            concept_counts[key] = concept_counts.get(key, 0) + 1
-
-    # build nodes and edges
-    nodes = []
-    edges = []
-    for k, v in concept_counts.items():
-        if isinstance(k, tuple):
-            a, b = k
-            # only keep stronger co-occurrence
-            if v >= 2:
-                edges.append({"source": a, "target": b, "type": "cooc", "weight": v})
-        else:
-            # k is already cleaned from _top_cited_works
-            nodes.append({"id": k, "label": k, "group": "keyword", "meta": {"count": v}})
-
-    return {"nodes": nodes, "edges": edges, "source": "OpenAlex", "message": "Keyword co-occurrence (OpenAlex)"}
\ No newline at end of file
+    works = await _top_cited_works(keyword, n)
+    return await run_blocking("cpu", _keyword_graph, works, min_cooc, top_k, weighted)
+
+
+def _keyword_graph(works: List[Dict], min_cooc: int = 2, top_k: Optional[int] = None,
+                   weighted: bool = False) -> dict:
+    # (concept, score) pairs per work; entries cached before scores were kept weigh 1.0
+    docs = [
+        zip(w["concepts"] or [], w.get("concept_scores") or [1.0] * len(w["concepts"] or []))
+        for w in works
+    ]
+    graph = cooccurrence_graph(docs, min_count=min_cooc, top_k=top_k, weighted=weighted)
+
+    # concept names are already cleaned in _fetch_top_cited_works
+    nodes = [
+        {"id": c["id"], "label": c["id"], "group": "keyword", "meta": {"count": c["count"], "score": c["score"]}}
+        for c in graph["nodes"]
+    ]
+    edges = [
+        {"source": e["source"], "target": e["target"], "type": "cooc", "weight": e["weight"], "count": e["count"]}
+        for e in graph["edges"]
+    ]
+    return {"nodes": nodes, "edges": edges, "source": "OpenAlex", "message": "Keyword co-occurrence (OpenAlex)"}
@@ -1,6 +1,6 @@
 # api/literature.py
 from fastapi import APIRouter, HTTPException, Query, Depends, File, UploadFile
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from typing import List, Optional
 from models.schemas import (
     LiteratureAdvancedSearchRequest,
@@ -18,9 +18,10 @@ from services.history_service import HistoryService
 from utils.reference_formatter import ReferenceFormatter
 from utils.auth import get_current_user_optional
 from models.user_model import User
-from database import get_db
+from database import get_db, SessionLocal
 from typing import Optional
 from sqlalchemy.orm import Session
+import json
 import logging
 from datetime import datetime
 import PyPDF2
@@ -92,11 +93,11 @@ async def search_literature(request: LiteratureSearchRequest):
 
         # Route to appropriate service based on source
         if request.source == "crossref":
-            results = crossref_service.search_literature(request.keyword, request.limit, sort_by)
+            results = await crossref_service.search_literature_async(request.keyword, request.limit, sort_by)
         elif request.source == "arxiv":
-            results = arxiv_service.search_literature(request.keyword, request.limit, sort_by)
+            results = await arxiv_service.search_literature_async(request.keyword, request.limit, sort_by)
         elif request.source == "openalex":
-            results = openalex_service.search_literature(request.keyword, request.limit, sort_by)
+            results = await openalex_service.search_literature_async(request.keyword, request.limit, sort_by)
         else:
             logger.warning(f"[Literature Search] Unsupported source: {request.source}")
             raise HTTPException(status_code=400, detail=f"Unsupported source: {request.source}")
@@ -147,17 +148,17 @@ async def get_literature_by_doi(
 
         # Try CrossRef first
         if source == "crossref":
-            literature = crossref_service.get_by_doi(doi)
+            literature = await crossref_service.get_by_doi_async(doi)
             if not literature:
                 logger.warning(f"[DOI Lookup] CrossRef returned no result for {doi}, trying OpenAlex fallback...")
                 try:
-                    literature = openalex_service.get_by_doi(doi)
+                    literature = await openalex_service.get_by_doi_async(doi)
                 except Exception as e:
                     logger.error(f"[DOI Lookup] OpenAlex fallback failed: {e}")
 
         # Directly query OpenAlex if requested
         elif source == "openalex":
-            literature = openalex_service.get_by_doi(doi)
+            literature = await openalex_service.get_by_doi_async(doi)
         else:
             raise HTTPException(
                 status_code=400,
@@ -201,7 +202,7 @@ async def get_literature_by_arxiv_id(arxiv_id: str):
     logger.info(f"[arXiv Lookup] Fetching paper - arxiv_id={arxiv_id}")
 
     try:
-        literature = arxiv_service.get_by_id(arxiv_id)
+        literature = await arxiv_service.get_by_id_async(arxiv_id)
         
         if literature is None:
             raise HTTPException(status_code=404, detail=f"Paper with arXiv ID {arxiv_id} not found")
@@ -233,7 +234,7 @@ async def get_literature_by_openalex_id(openalex_id: str):
     logger.info(f"[OpenAlex Lookup] Fetching work - openalex_id={openalex_id}")
 
     try:
-        literature = openalex_service.get_by_openalex_id(openalex_id)
+        literature = await openalex_service.get_by_openalex_id_async(openalex_id)
         
         if literature is None:
             raise HTTPException(status_code=404, detail=f"Work with OpenAlex ID {openalex_id} not found")
@@ -318,6 +319,14 @@ async def search_all_sources(
 ):
     """
     Search literature across ALL sources with advanced filters
+
+    With deadline_ms, sources that have not answered within the budget are
+    cancelled and the response is flagged partial (see missing_sources).
+
+    Large result sets are paged: pass the response's next_page_token back as
+    page_token (with the same keyword, limit and source) to get the next
+    `limit` results from every source that has more. Each page is
+    deduplicated, filtered and sorted on its own.
     """
     if not request.keyword.strip():
         raise HTTPException(status_code=400, detail="Keyword cannot be empty")
@@ -337,15 +346,33 @@ async def search_all_sources(
         else:
             filters_dict = {"sort_by": request.sort_by}
         
-        # Perform aggregated search
-        results = await literature_aggregator.search_all_sources(
-            keyword=request.keyword,
-            limit_per_source=request.limit,
-            filters=filters_dict
-        )
+        # Perform aggregated search, within the latency budget if one was given
+        missing = []
+        if request.deadline_ms or request.page_token:
+            try:
+                results, missing, next_page_token = await literature_aggregator.search_page(
+                    keyword=request.keyword,
+                    limit_per_source=request.limit,
+                    filters=filters_dict,
+                    source=request.source,
+                    page_token=request.page_token,
+                    deadline_ms=request.deadline_ms
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        else:
+            results = await literature_aggregator.search_all_sources(
+                keyword=request.keyword,
+                limit_per_source=request.limit,
+                filters=filters_dict,
+                source=request.source
+            )
+            next_page_token = literature_aggregator.next_page_token(
+                request.keyword, request.limit, request.source
+            )
         
-        # Log to history if user is authenticated
-        if current_user:
+        # Log to history if user is authenticated (once per search, not per page)
+        if current_user and not request.page_token:
             try:
                 HistoryService(db).log_search(
                     keyword=request.keyword,
@@ -362,13 +389,102 @@ async def search_all_sources(
             total=len(results),
             results=results,
             source=request.source,
+            partial=bool(missing),
+            missing_sources=missing or None,
+            next_page_token=next_page_token,
             query=request.keyword,
             timestamp=datetime.now().isoformat()
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"[Advanced Search] Failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/search-all/stream")
+async def stream_search_all_sources(
+    request: LiteratureAdvancedSearchRequest,
+    format: str = Query("ndjson", description="ndjson | sse"),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Streaming variant of /search-all: results appear at the fastest source's latency
+
+    Events (NDJSON lines with an "event" field, or SSE with format=sse):
+    - source: one source's deduplicated, filtered and sorted batch, sent as
+      soon as that source answers (with "error" when it failed)
+    - final: the merged result set across all sources, re-sorted and limited
+      exactly like /search-all (replaces everything sent before), with next_page_token
+    """
+    if not request.keyword.strip():
+        raise HTTPException(status_code=400, detail="Keyword cannot be empty")
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+    if request.page_token:
+        raise HTTPException(status_code=400, detail="Streaming serves the first page; use /search-all for page_token")
+
+    logger.info(
+        f"[Advanced Search] Streaming keyword='{request.keyword}', "
+        f"Source={request.source}, Sort={request.sort_by}, "
+        f"Filters={request.filters}"
+    )
+    filters_dict = request.filters.dict(exclude_none=True) if request.filters else {}
+    filters_dict["sort_by"] = request.sort_by
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        _search_all_events(request, filters_dict, format, current_user.id if current_user else None),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _search_all_events(request: LiteratureAdvancedSearchRequest, filters: dict, fmt: str,
+                             user_id: Optional[int]):
+    def encode(event: str, payload: dict) -> str:
+        if fmt == "sse":
+            return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        return json.dumps({"event": event, **payload}) + "\n"
+
+    try:
+        async for event, frame in literature_aggregator.stream_all_sources(
+            keyword=request.keyword,
+            limit_per_source=request.limit,
+            filters=filters,
+            source=request.source
+        ):
+            results = [paper.dict() for paper in frame["results"]]
+            if event == "source":
+                yield encode(event, {**frame, "total": len(results), "results": results})
+                continue
+
+            yield encode(event, {
+                "total": len(results),
+                "results": results,
+                "source": request.source,
+                "next_page_token": frame["next_page_token"],
+                "query": request.keyword,
+                "timestamp": datetime.now().isoformat()
+            })
+            logger.info(f"[Advanced Search] Streamed {len(results)} results")
+            if user_id is not None:
+                # The request's session is closed once streaming starts, so use a fresh one
+                db = SessionLocal()
+                try:
+                    HistoryService(db).log_search(
+                        keyword=request.keyword,
+                        source=request.source,
+                        total_results=len(results),
+                        user_id=user_id
+                    )
+                except Exception as e:
+                    logger.warning(f"[Search History] Failed to log: {e}")
+                finally:
+                    db.close()
+    except Exception as e:
+        logger.error(f"[Advanced Search] Streaming failed: {e}", exc_info=True)
+        yield encode("error", {"message": str(e)})
     
 
 @router.post("/export-bibtex", response_class=PlainTextResponse)
@@ -414,7 +530,7 @@ async def export_ris_format(literature_list: List[LiteratureItem]):
         raise HTTPException(status_code=500, detail=str(e))
     
 @router.get("/latest")
-def get_latest(
+async def get_latest(
     source: str = Query("arxiv", description='arxiv | openalex'),
     topic_key: str = Query(..., description='e.g., ai, economics, biology'),
     limit: int = Query(3, ge=1, le=50),
@@ -430,7 +546,7 @@ def get_latest(
         cat = TOPIC_TO_ARXIV.get(topic_key)
         if not cat:
             raise HTTPException(status_code=400, detail=f"Unknown topic_key: {topic_key}")
-        items = arxiv_service.latest_by_category(cat, limit=fetch_limit)
+        items = await arxiv_service.latest_by_category_async(cat, limit=fetch_limit)
         
         items_dict = [i.dict() for i in items]
         items_dict = filter_valid_papers(items_dict)
@@ -458,7 +574,7 @@ def get_latest(
     
     logger.info(f"[Latest] Fetching from OpenAlex - keyword='{keyword}', mode='{mode}', sort_by='{sort_by}'")
     
-    items = openalex_service.search_literature(
+    items = await openalex_service.search_literature_async(
         keyword=keyword, 
         limit=fetch_limit, 
         sort_by=sort_by 
@@ -8,6 +8,7 @@ from typing import Optional, List
 from models.user_model import User
 from utils.auth import get_current_user_optional
 from database import get_db
+from services.executors import run_blocking
 import logging
 import requests
 import xml.etree.ElementTree as ET
@@ -254,7 +255,8 @@ async def get_personalized_recommendations(
     logger.info(f"[Recommendations] Fetching papers for topics: {topics[:3]}")
     
     try:
-        recommendations = get_recommendations_multi_source(topics, limit)
+        # Blocking requests-based fetchers run on the bounded upstream pool
+        recommendations = await run_blocking("upstream", get_recommendations_multi_source, topics, limit)
         
         return {
             "total": len(recommendations),
@@ -294,7 +296,7 @@ async def get_recommendations_by_interest(
     logger.info(f"[Recommendations] Fetching papers for interest '{interest}': {topics}")
     
     try:
-        recommendations = get_recommendations_multi_source(topics, limit)
+        recommendations = await run_blocking("upstream", get_recommendations_multi_source, topics, limit)
         
         return {
             "total": len(recommendations),
@@ -20,6 +20,11 @@ from database import engine, Base
 from sqlalchemy import text
 from fastapi.middleware.cors import CORSMiddleware
 from api import collections
+from services.cache_service import run_cache_sweeper, CACHE_SWEEP_INTERVAL
+from services.http_client import close_async_client
+from services.executors import shutdown_executors
+from utils.loop_monitor import monitor_event_loop, loop_lag_stats
+import asyncio
 
 # Load environment variables from .env file
 load_dotenv()
@@ -145,6 +150,13 @@ async def startup_event():
     except Exception as e:
         logger.error(f"[Startup] Database initialization failed: {e}")
         raise
+
+    # Background TTL sweeper / size-bounded eviction for the SQLite cache
+    app.state.cache_sweeper = asyncio.create_task(run_cache_sweeper(CACHE_SWEEP_INTERVAL))
+    logger.info(f"[Startup] Cache sweeper scheduled every {CACHE_SWEEP_INTERVAL}s")
+
+    # Warn whenever something blocks the event loop
+    app.state.loop_monitor = asyncio.create_task(monitor_event_loop())
     
     logger.info("[Startup] Application startup complete")
     logger.info("=" * 60)
@@ -164,6 +176,19 @@ async def shutdown_event():
     logger.info("=" * 60)
     logger.info("[Shutdown] Cleaning up resources...")
 
+    for name in ("cache_sweeper", "loop_monitor"):
+        task = getattr(app.state, name, None)
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            logger.info(f"[Shutdown] Background task '{name}' stopped")
+
+    await close_async_client()
+    shutdown_executors()
+
     logger.info("[Shutdown] Application shutdown complete")
     logger.info("=" * 60)
 
@@ -310,6 +335,11 @@ async def health_check():
         "version": "1.0.0",
         "timestamp": datetime.now().isoformat(),
         "uptime": "unknown",  # You can calculate actual uptime if needed
+        "event_loop": {
+            "last_lag_ms": round(loop_lag_stats["last_lag"] * 1000, 1),
+            "max_lag_ms": round(loop_lag_stats["max_lag"] * 1000, 1),
+            "blocked_count": loop_lag_stats["blocked_count"]
+        },
         "services": {
             "literature": "operational",
             "plagiarism": "operational"
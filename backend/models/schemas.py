@@ -61,6 +61,10 @@ class LiteratureAdvancedSearchRequest(BaseModel):
     source: str = Field("all", pattern="^(all|crossref|arxiv|openalex)$")
     sort_by: str = Field("relevance", pattern="^(relevance|year|citations)$")
     filters: Optional[AdvancedSearchFilters] = None
+    # Overall latency budget; sources still running when it passes are dropped
+    deadline_ms: Optional[int] = Field(None, ge=100, le=60000)
+    # next_page_token from the previous response, to continue the same search
+    page_token: Optional[str] = Field(None, max_length=4096)
 
 # Literature search request schema
 class LiteratureSearchRequest(BaseModel):
@@ -91,12 +95,17 @@ class LiteratureItem(BaseModel):
     url: Optional[str] = None
     citation_count: Optional[int] = None
     source: Optional[str] = None  # crossref, arxiv, or openalex
+    sources: Optional[List[str]] = None  # every source that returned this work
+    provenance: Optional[Dict[str, str]] = None  # field name -> source its value came from
 
 # Literature search response schema
 class LiteratureSearchResponse(BaseModel):
     total: int
     results: List[LiteratureItem]
     source: str
+    partial: bool = False  # True when some sources missed the deadline
+    missing_sources: Optional[List[str]] = None
+    next_page_token: Optional[str] = None  # None on the last page
 
 # Reference format request schema
 class ReferenceFormatRequest(BaseModel):
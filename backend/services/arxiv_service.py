@@ -1,8 +1,9 @@
 # services/arxiv_service.py
-import requests
+import httpx
 import feedparser
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from models.schemas import LiteratureItem, Author
+from services.http_client import get_async_client
 from datetime import datetime
 import html
 import xml.etree.ElementTree as ET
@@ -11,78 +12,86 @@ class ArXivService:
     """Service for interacting with arXiv API"""
     
     BASE_URL = "https://export.arxiv.org/api/query"
+    # arXiv asks for slices of at most 2000 results per request
+    MAX_RESULTS = 2000
     
-    def __init__(self):
-        self.session = requests.Session()
-    
-    def search_literature(self, keyword: str, limit: int = 10, sort_by: str = "relevance") -> List[LiteratureItem]:
-        """
-        Search literature using arXiv API
-        
-        Args:
-            keyword: Search query keyword
-            limit: Maximum number of results
-            sort_by: Sorting method (relevance | year | citations)
-            
-        Returns:
-            List of LiteratureItem objects
-        """
+    async def search_literature_async(self, keyword: str, limit: int = 10, sort_by: str = "relevance") -> List[LiteratureItem]:
+        """Search literature using the shared HTTP client"""
         try:
-            # Map sorting to arXiv API accepted fields
-            if sort_by == "year":
-                sort_field = "lastUpdatedDate"
-            elif sort_by == "citations":  # arXiv doesn’t have citation data
-                sort_field = "relevance"
-            else:
-                sort_field = "relevance"
-            
-            # Build query parameters
-            params = {
-                'search_query': f'all:{keyword}',
-                'start': 0,
-                'max_results': limit,
-                'sortBy': sort_field,
-                'sortOrder': 'descending'
-            }
-            
-            response = self.session.get(self.BASE_URL, params=params, timeout=15)
+            params = self._search_params(keyword, limit, sort_by)
+            response = await get_async_client().get(self.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
-            
-            # Parse RSS/Atom feed
-            feed = feedparser.parse(response.content)
-            
-            # Convert entries to LiteratureItem format
-            literature_items = []
-            for entry in feed.entries:
-                literature_items.append(self._parse_arxiv_entry(entry))
-            
-            return literature_items
-            
-        except requests.exceptions.RequestException as e:
+            return self._parse_feed(response.content)
+
+        except httpx.HTTPError as e:
             print(f"[ArXivService] Error fetching '{keyword}': {e}")
             return []
         except Exception as e:
             print(f"arXiv parsing error: {e}")
             return []
-    
-    def get_by_id(self, arxiv_id: str) -> Optional[LiteratureItem]:
+
+    async def search_page_async(
+        self, keyword: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> Tuple[List[LiteratureItem], Optional[str]]:
         """
-        Get specific paper by arXiv ID
+        Fetch `limit` results (relevance order) starting at a deep-paging cursor
+
+        The cursor is the `start` offset as a string; slices are requested one
+        after another since arXiv asks clients not to send parallel requests.
+        HTTP errors are raised to the caller.
+
+        Returns:
+            (items, next cursor or None when the results are exhausted)
         """
+        start = int(cursor or 0)
+        items = []
+        while len(items) < limit:
+            batch_size = min(limit - len(items), self.MAX_RESULTS)
+            params = {**self._search_params(keyword, batch_size, "relevance"), 'start': start}
+            response = await get_async_client().get(self.BASE_URL, params=params, timeout=15)
+            response.raise_for_status()
+            batch = self._parse_feed(response.content)
+            items.extend(batch)
+            start += batch_size
+            if len(batch) < batch_size:
+                return items, None
+        return items, str(start)
+
+    @staticmethod
+    def _search_params(keyword: str, limit: int, sort_by: str) -> dict:
+        """Build query parameters for an arXiv search"""
+        # Map sorting to arXiv API accepted fields
+        if sort_by == "year":
+            sort_field = "lastUpdatedDate"
+        elif sort_by == "citations":  # arXiv doesn’t have citation data
+            sort_field = "relevance"
+        else:
+            sort_field = "relevance"
+        
+        return {
+            'search_query': f'all:{keyword}',
+            'start': 0,
+            'max_results': limit,
+            'sortBy': sort_field,
+            'sortOrder': 'descending'
+        }
+
+    def _parse_feed(self, content: bytes) -> List[LiteratureItem]:
+        """Parse an arXiv Atom feed into LiteratureItem objects"""
+        feed = feedparser.parse(content)
+        return [self._parse_arxiv_entry(entry) for entry in feed.entries]
+    
+    async def get_by_id_async(self, arxiv_id: str) -> Optional[LiteratureItem]:
+        """Fetch a paper by arXiv ID using the shared HTTP client"""
         try:
-            clean_id = arxiv_id.split('v')[0]
             params = {
-                'id_list': clean_id,
+                'id_list': arxiv_id.split('v')[0],
                 'max_results': 1
             }
-            
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
+            response = await get_async_client().get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
-            feed = feedparser.parse(response.content)
-            
-            if feed.entries:
-                return self._parse_arxiv_entry(feed.entries[0])
-            return None
+            items = self._parse_feed(response.content)
+            return items[0] if items else None
         except Exception as e:
             print(f"arXiv ID lookup error: {e}")
             return None
@@ -146,23 +155,23 @@ class ArXivService:
             source="arxiv"
         )
     
-    def latest_by_category(self, category_code: str, limit: int = 3):
-        """
-        Fetch latest papers from arXiv by primary category, sorted by lastUpdatedDate (desc).
-        Example: category_code="cs.AI"
-        """
+    async def latest_by_category_async(self, category_code: str, limit: int = 3):
+        """Fetch the latest papers in an arXiv category, newest first (e.g. cs.AI)"""
         try:
-            params = {
-                "search_query": f"cat:{category_code}",
-                "start": 0,
-                "max_results": limit,
-                "sortBy": "lastUpdatedDate",
-                "sortOrder": "descending",
-            }
-            response = self.session.get(self.BASE_URL, params=params, timeout=15)
+            params = self._category_params(category_code, limit)
+            response = await get_async_client().get(self.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
-            feed = feedparser.parse(response.content)
-            return [self._parse_arxiv_entry(entry) for entry in feed.entries]
+            return self._parse_feed(response.content)
         except Exception as e:
             print(f"[ArXivService] latest_by_category error: {e}")
             return []
+
+    @staticmethod
+    def _category_params(category_code: str, limit: int) -> dict:
+        return {
+            "search_query": f"cat:{category_code}",
+            "start": 0,
+            "max_results": limit,
+            "sortBy": "lastUpdatedDate",
+            "sortOrder": "descending",
+        }
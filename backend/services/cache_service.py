@@ -1,57 +1,533 @@
 # backend/services/cache_service.py
-import time, json, sqlite3, os
+import time, json, sqlite3, os, threading, asyncio, logging, weakref, zlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+from services.executors import run_blocking
+
+logger = logging.getLogger(__name__)
+
+# Size limits for the on-disk cache (0 disables the limit)
+CACHE_MAX_ROWS = int(os.getenv("CACHE_MAX_ROWS", "50000"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# Eviction policy once a limit is exceeded: "lru" or "lfu"
+CACHE_EVICTION_POLICY = os.getenv("CACHE_EVICTION_POLICY", "lru").lower()
+# Seconds between background sweeps
+CACHE_SWEEP_INTERVAL = int(os.getenv("CACHE_SWEEP_INTERVAL", "300"))
+# Rows written per locked statement during a sweep; lookups on the event loop
+# wait for at most one such batch instead of the whole sweep
+CACHE_SWEEP_BATCH = int(os.getenv("CACHE_SWEEP_BATCH", "500"))
+# Shared cache file used by get_cache_service()
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", "cache.db")
+# Codec used for new rows (see CODECS)
+CACHE_CODEC = os.getenv("CACHE_CODEC", "zlib-json/1")
+
+# Default TTL (seconds) per key namespace; entries are fresh for this long
+NAMESPACE_TTLS = {
+    "citation_graph": 86400,    # 1 day
+    "author_network": 43200,    # 12 hours
+    "topic_trend": 86400,       # 1 day
+    "search": 900,              # 15 minutes
+    "citation_node": 3 * 86400, # 3 days - per-work neighbourhoods for multi-hop graphs
+    "topic_works": 21600,       # 6 hours - top-cited works behind the topic graphs
+    "author_works": 30 * 86400, # 30 days - refreshed incrementally by OpenAlexGraphService
+    "graph_analytics": 86400,   # 1 day - annotated copies of cached graphs
+    "graph_layout": 86400,      # 1 day - graphs with precomputed node positions
+}
+# Extra seconds past the TTL during which a stale entry is still served while
+# get_or_fetch() refreshes it in the background (stale-while-revalidate)
+NAMESPACE_STALE_TTLS = {
+    "citation_graph": 6 * 86400,
+    "author_network": 86400,
+    "topic_trend": 6 * 86400,
+    "search": 3600,
+    "citation_node": 7 * 86400,
+    "topic_works": 86400,
+    "graph_analytics": 6 * 86400,
+    "graph_layout": 6 * 86400,
+}
+
+
+# ---------- Value codecs ----------
+# Every row stores the name of the codec that wrote it, so the encoding can
+# change without invalidating existing rows. Rows written before codecs were
+# introduced have a NULL codec and hold plain JSON text.
+
+class JsonCodec:
+    """Plain JSON text (the original cache format)."""
+    name = "json/1"
+
+    def encode(self, value) -> str:
+        return json.dumps(value)
+
+    def decode(self, data):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+
+class ZlibJsonCodec:
+    """Compact JSON compressed with zlib, stored as a BLOB."""
+    name = "zlib-json/1"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def encode(self, value) -> bytes:
+        raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return zlib.compress(raw, self.level)
+
+    def decode(self, data):
+        return json.loads(zlib.decompress(data))
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec(), ZlibJsonCodec())}
+LEGACY_CODEC = JsonCodec.name
+
+
+class Uncached:
+    """
+    Wraps a get_or_fetch() result that is returned to every waiting caller
+    but not cached, e.g. results that are partial because a source failed.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
 
 class CacheService:
-    """Simple SQLite-based cache with time-to-live (TTL)."""
+    """
+    SQLite-based cache with time-to-live (TTL).
+
+    A single long-lived connection (WAL mode) is shared by all threads and
+    guarded by a lock, and a bounded in-memory LRU tier sits in front of it
+    so hot keys are served without touching disk. Expired rows and rows over
+    the configured size limits are removed by `sweep()`, which the background
+    task `run_cache_sweeper` calls for every live instance. Services share the
+    process-wide instance from `get_cache_service()`, so one cache file is
+    swept and evicted by one instance.
+
+    Keys may be grouped into namespaces ("citation_graph", "search", ...),
+    each with its own TTL, and `get_or_fetch()` coalesces concurrent misses
+    for the same key into a single upstream fetch.
+
+    Each entry has a soft expiry (`stale_at`, after the TTL) and a hard expiry
+    (`expiry`, after TTL + stale TTL). Between the two, `get_or_fetch()` returns
+    the stale value immediately and refreshes it in the background.
+    """
+
+    _instances = weakref.WeakSet()
 
-    def __init__(self, ttl_seconds: int = 86400, db_path: str = "cache.db"):
+    def __init__(self, ttl_seconds: int = 86400, db_path: str = "cache.db",
+                 memory_items: int = 512, max_rows: int = CACHE_MAX_ROWS,
+                 max_bytes: int = CACHE_MAX_BYTES, eviction: str = CACHE_EVICTION_POLICY,
+                 codec: str = CACHE_CODEC, namespace_ttls: Optional[Dict[str, int]] = None,
+                 namespace_stale_ttls: Optional[Dict[str, int]] = None):
         self.ttl = ttl_seconds
+        self.namespace_ttls = {**NAMESPACE_TTLS, **(namespace_ttls or {})}
+        self.namespace_stale_ttls = {**NAMESPACE_STALE_TTLS, **(namespace_stale_ttls or {})}
+        self.codec = CODECS.get(codec) or CODECS[ZlibJsonCodec.name]
         self.db_path = db_path
+        self.memory_items = memory_items
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.eviction = eviction if eviction in ("lru", "lfu") else "lru"
+        self._memory = OrderedDict()  # key -> (JSON text, stale_at, expiry)
+        self._touched = {}  # key -> [last_access, hits since last flush]
+        self._inflight = {}  # namespaced key -> asyncio.Task of the running fetch
+        self._waiters = {}  # fetch task -> number of callers awaiting it
+        self._refresh_tasks = set()  # background stale-while-revalidate refreshes
+        self._lock = threading.RLock()
+        self._conn = None
         self._init_db()
+        CacheService._instances.add(self)
 
     def _init_db(self):
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("""
+        # One connection for the lifetime of the service; access is serialized by self._lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
             CREATE TABLE IF NOT EXISTS cache (
                 key TEXT PRIMARY KEY,
-                value TEXT,
-                expiry REAL
+                value BLOB,
+                expiry REAL,
+                last_access REAL,
+                hits INTEGER DEFAULT 0,
+                codec TEXT,
+                stale_at REAL
             )
         """)
-        conn.commit()
-        conn.close()
+        # Older cache.db files were created without the access-tracking columns
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(cache)")}
+        if "last_access" not in columns:
+            self._conn.execute("ALTER TABLE cache ADD COLUMN last_access REAL")
+            self._conn.execute("UPDATE cache SET last_access = expiry - ?", (self.ttl,))
+        if "hits" not in columns:
+            self._conn.execute("ALTER TABLE cache ADD COLUMN hits INTEGER DEFAULT 0")
+        if "codec" not in columns:
+            # Existing rows keep their JSON text (codec NULL) until migrate_legacy_rows() rewrites them
+            self._conn.execute("ALTER TABLE cache ADD COLUMN codec TEXT")
+        if "stale_at" not in columns:
+            # NULL stale_at means the row is fresh until its hard expiry
+            self._conn.execute("ALTER TABLE cache ADD COLUMN stale_at REAL")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expiry ON cache (expiry)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache (last_access)")
 
-    def get(self, key: str):
-        now = time.time()
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT value, expiry FROM cache WHERE key=?", (key,))
-        row = cur.fetchone()
-        conn.close()
-        if not row:
+    # ---------- In-memory LRU tier ----------
+    # Values are kept as JSON text and decoded on every hit, so callers that
+    # mutate what they get (or what they passed to set()) can't change the
+    # cached copy, and hits behave exactly like SQLite hits.
+    def _memory_get(self, key: str, now: float):
+        entry = self._memory.get(key)
+        if entry is None:
             return None
-        value, expiry = row
+        text, stale_at, expiry = entry
         if now > expiry:
-            self.delete(key)
+            del self._memory[key]
             return None
-        return json.loads(value)
-
-    def set(self, key: str, value):
-        expiry = time.time() + self.ttl
-        data = json.dumps(value)
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "REPLACE INTO cache (key, value, expiry) VALUES (?, ?, ?)",
-            (key, data, expiry)
-        )
-        conn.commit()
-        conn.close()
-
-    def delete(self, key: str):
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("DELETE FROM cache WHERE key=?", (key,))
-        conn.commit()
-        conn.close()
+        self._memory.move_to_end(key)
+        return json.loads(text), stale_at
+
+    def _memory_put(self, key: str, value, stale_at: float, expiry: float):
+        if self.memory_items <= 0:
+            return
+        self._memory[key] = (json.dumps(value), stale_at, expiry)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key: str, now: float):
+        # Access stats are buffered in memory and written out by sweep()
+        touched = self._touched.get(key)
+        if touched is None:
+            self._touched[key] = [now, 1]
+        else:
+            touched[0] = now
+            touched[1] += 1
+
+    # ---------- Public API ----------
+    @staticmethod
+    def _full_key(key: str, namespace: Optional[str]) -> str:
+        return f"{namespace}:{key}" if namespace else key
+
+    def ttl_for(self, namespace: Optional[str]) -> int:
+        """TTL in seconds for a namespace (falls back to the instance default)."""
+        return self.namespace_ttls.get(namespace, self.ttl) if namespace else self.ttl
+
+    def stale_ttl_for(self, namespace: Optional[str]) -> int:
+        """Seconds a namespace's entries may be served stale past their TTL."""
+        return self.namespace_stale_ttls.get(namespace, 0) if namespace else 0
+
+    def get(self, key: str, namespace: Optional[str] = None):
+        """Return the cached value (fresh or stale), or None if missing or hard-expired."""
+        entry = self.get_entry(key, namespace)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str, namespace: Optional[str] = None):
+        """
+        Look up a key.
+
+        Returns:
+            Tuple (value, is_stale), or None if missing or hard-expired
+        """
+        key = self._full_key(key, namespace)
+        now = time.time()
+        with self._lock:
+            entry = self._memory_get(key, now)
+            if entry is not None:
+                self._touch(key, now)
+                value, stale_at = entry
+                return value, now > stale_at
+
+            row = self._conn.execute(
+                "SELECT value, expiry, codec, stale_at FROM cache WHERE key=?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            data, expiry, codec_name, stale_at = row
+            stale_at = stale_at if stale_at is not None else expiry
+            if now > expiry:
+                self._conn.execute("DELETE FROM cache WHERE key=?", (key,))
+                self._touched.pop(key, None)
+                return None
+
+            codec = CODECS.get(codec_name or LEGACY_CODEC)
+            if codec is None:
+                # Written by a codec this process doesn't know; treat as a miss
+                logger.warning(f"[Cache] Unknown codec '{codec_name}' for key {key}")
+                return None
+            value = codec.decode(data)
+            self._memory_put(key, value, stale_at, expiry)
+            self._touch(key, now)
+            return value, now > stale_at
+
+    def set(self, key: str, value, namespace: Optional[str] = None, ttl: Optional[int] = None,
+            stale_ttl: Optional[int] = None):
+        now = time.time()
+        stale_at = now + (ttl if ttl is not None else self.ttl_for(namespace))
+        expiry = stale_at + (stale_ttl if stale_ttl is not None else self.stale_ttl_for(namespace))
+        key = self._full_key(key, namespace)
+        data = self.codec.encode(value)
+        with self._lock:
+            self._conn.execute(
+                "REPLACE INTO cache (key, value, expiry, last_access, hits, codec, stale_at) "
+                "VALUES (?, ?, ?, ?, 0, ?, ?)",
+                (key, data, expiry, now, self.codec.name, stale_at)
+            )
+            self._touched.pop(key, None)
+            self._memory_put(key, value, stale_at, expiry)
+
+    def delete(self, key: str, namespace: Optional[str] = None):
+        key = self._full_key(key, namespace)
+        with self._lock:
+            self._memory.pop(key, None)
+            self._touched.pop(key, None)
+            self._conn.execute("DELETE FROM cache WHERE key=?", (key,))
+
+    async def get_or_fetch(
+        self,
+        namespace: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None
+    ):
+        """
+        Return the cached value for (namespace, key), or run `fetch` to produce it.
+
+        Concurrent misses for the same key share one in-flight fetch (single-flight),
+        so a burst of requests for a cold key triggers only one upstream call.
+        The fetch runs in its own task: a cancelled caller (e.g. a client
+        disconnect) does not cancel it for the others, and it is only cancelled
+        once no caller is waiting for it.
+        A stale entry (past its TTL but within the stale TTL) is returned
+        immediately while a background task refreshes it.
+        `None` results are returned but not cached, and so is the value of an
+        `Uncached(value)` result (a stale entry then stays in place).
+
+        Args:
+            namespace: Key namespace, selects the default TTLs
+            key: Key within the namespace
+            fetch: Zero-argument coroutine function producing the value (or Uncached)
+            ttl: Optional TTL override in seconds
+            stale_ttl: Optional stale TTL override in seconds
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        full_key = self._full_key(key, namespace)
+        entry = self.get_entry(key, namespace)
+        if entry is not None:
+            value, is_stale = entry
+            if is_stale and full_key not in self._inflight:
+                logger.info(f"[Cache] Serving stale {full_key}, refreshing in background")
+                task = self._start_flight(full_key, key, namespace, fetch, ttl, stale_ttl)
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._on_refresh_done)
+            return value
+
+        task = self._inflight.get(full_key)
+        if task is not None:
+            logger.debug(f"[Cache] Joining in-flight fetch for {full_key}")
+        else:
+            task = self._start_flight(full_key, key, namespace, fetch, ttl, stale_ttl)
+        return await self._await_flight(task)
+
+    def _start_flight(self, full_key, key, namespace, fetch, ttl, stale_ttl) -> asyncio.Task:
+        # Registered synchronously so callers arriving before the fetch starts can join it
+        task = asyncio.create_task(self._fetch_once(full_key, key, namespace, fetch, ttl, stale_ttl))
+        self._inflight[full_key] = task
+        return task
+
+    async def _await_flight(self, task: asyncio.Task):
+        """Wait for a shared fetch; cancel it only when its last waiter is cancelled."""
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done() and task not in self._refresh_tasks:
+                    task.cancel()
+
+    async def _fetch_once(self, full_key, key, namespace, fetch, ttl, stale_ttl):
+        try:
+            value = await fetch()
+            if isinstance(value, Uncached):
+                return value.value
+            if value is not None:
+                self.set(key, value, namespace, ttl, stale_ttl)
+            return value
+        finally:
+            if self._inflight.get(full_key) is asyncio.current_task():
+                del self._inflight[full_key]
+
+    def _on_refresh_done(self, task: asyncio.Task):
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"[Cache] Background refresh failed: {task.exception()}")
+
+    # ---------- Maintenance ----------
+    # Maintenance takes self._lock per statement or batch of CACHE_SWEEP_BATCH
+    # rows, never for a whole sweep: get_entry()/set() run on the event loop.
+    def _flush_access_stats(self):
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        rows = [(last, hits, key) for key, (last, hits) in touched.items()]
+        for i in range(0, len(rows), CACHE_SWEEP_BATCH):
+            with self._lock:
+                self._conn.executemany(
+                    "UPDATE cache SET last_access = ?, hits = hits + ? WHERE key = ?",
+                    rows[i:i + CACHE_SWEEP_BATCH]
+                )
+
+    def _delete_expired(self, now: float) -> int:
+        expired = 0
+        while True:
+            with self._lock:
+                deleted = self._conn.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache WHERE expiry < ? LIMIT ?)",
+                    (now, CACHE_SWEEP_BATCH)
+                ).rowcount
+            expired += deleted
+            if deleted < CACHE_SWEEP_BATCH:
+                return expired
+
+    def _evict(self, count: int) -> int:
+        order = "hits ASC, last_access ASC" if self.eviction == "lfu" else "last_access ASC"
+        evicted = 0
+        while evicted < count:
+            with self._lock:
+                victims = [row[0] for row in self._conn.execute(
+                    f"SELECT key FROM cache ORDER BY {order} LIMIT ?",
+                    (min(CACHE_SWEEP_BATCH, count - evicted),)
+                )]
+                if not victims:
+                    break
+                self._conn.executemany("DELETE FROM cache WHERE key=?", [(k,) for k in victims])
+                for key in victims:
+                    self._memory.pop(key, None)
+            evicted += len(victims)
+        return evicted
+
+    def migrate_legacy_rows(self, batch_size: int = 500) -> int:
+        """
+        Re-encode up to `batch_size` rows that are not stored with the current codec.
+
+        Rows are decoded and re-encoded outside the lock; a row rewritten by
+        set() in the meantime is left alone.
+
+        Returns:
+            Number of rows rewritten
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value, codec FROM cache WHERE codec IS NULL OR codec != ? LIMIT ?",
+                (self.codec.name, batch_size)
+            ).fetchall()
+        updates = []
+        unreadable = []
+        for key, data, codec_name in rows:
+            codec = CODECS.get(codec_name or LEGACY_CODEC)
+            try:
+                value = codec.decode(data)
+            except Exception:
+                codec = None
+            if codec is None:
+                unreadable.append((key, codec_name))
+                continue
+            updates.append((self.codec.encode(value), self.codec.name, key, codec_name))
+        with self._lock:
+            self._conn.executemany("DELETE FROM cache WHERE key = ? AND codec IS ?", unreadable)
+            self._conn.executemany(
+                "UPDATE cache SET value = ?, codec = ? WHERE key = ? AND codec IS ?", updates
+            )
+        return len(rows)
+
+    def _size(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(value)), 0), COUNT(*) FROM cache"
+            ).fetchone()
+
+    def sweep(self) -> dict:
+        """
+        Remove expired rows, re-encode a batch of rows written with an older
+        codec, then evict by LRU/LFU until the row and byte limits are satisfied.
+
+        Returns:
+            Dictionary with the number of expired, migrated and evicted rows
+        """
+        now = time.time()
+        self._flush_access_stats()
+        expired = self._delete_expired(now)
+        with self._lock:
+            for key in [k for k, (_, _, exp) in self._memory.items() if exp < now]:
+                del self._memory[key]
+        migrated = self.migrate_legacy_rows()
+
+        evicted = 0
+        if self.max_rows > 0:
+            _, rows = self._size()
+            evicted += self._evict(rows - self.max_rows)
+
+        if self.max_bytes > 0:
+            total, rows = self._size()
+            # Evict proportionally to the average row size, then re-check
+            while total > self.max_bytes and rows:
+                avg = total / rows
+                evicted += self._evict(max(1, int((total - self.max_bytes) / avg) + 1))
+                total, rows = self._size()
+
+        if expired or evicted or migrated:
+            with self._lock:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return {"expired": expired, "migrated": migrated, "evicted": evicted}
+
+    def close(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._flush_access_stats()
+                self._conn.close()
+                self._conn = None
+        CacheService._instances.discard(self)
+
+
+_shared: Optional[CacheService] = None
+
+
+def get_cache_service() -> CacheService:
+    """Return the process-wide CacheService on CACHE_DB_PATH, creating it on first use."""
+    global _shared
+    if _shared is None or _shared._conn is None:
+        _shared = CacheService(db_path=CACHE_DB_PATH)
+    return _shared
+
+
+async def run_cache_sweeper(interval_seconds: int = CACHE_SWEEP_INTERVAL):
+    """
+    Periodically sweep every live CacheService instance (runs until cancelled).
+    Instances on the same file are swept once per round.
+    """
+    logger.info(f"[CacheSweeper] Started - interval={interval_seconds}s")
+    while True:
+        await asyncio.sleep(interval_seconds)
+        swept = set()
+        for cache in list(CacheService._instances):
+            path = os.path.abspath(cache.db_path)
+            if path in swept or cache._conn is None:
+                continue
+            swept.add(path)
+            try:
+                stats = await run_blocking("cpu", cache.sweep)
+                if any(stats.values()):
+                    logger.info(
+                        f"[CacheSweeper] {cache.db_path}: expired={stats['expired']}, "
+                        f"migrated={stats['migrated']}, evicted={stats['evicted']}"
+                    )
+            except Exception as e:
+                logger.warning(f"[CacheSweeper] Sweep failed for {cache.db_path}: {e}")
@@ -1,16 +1,22 @@
-import requests, logging
+import asyncio, logging
+from services.http_client import get_async_client
 
 logger = logging.getLogger(__name__)
 
 class COCIService:
     BASE_URL = "https://opencitations.net/index/coci/api/v1"
 
-    def get_citation_graph(self, doi: str, max_nodes: int = 60):
+    async def get_citation_graph(self, doi: str, max_nodes: int = 60):
         nodes = [{"id": doi, "label": doi, "group": "paper"}]
         edges = []
 
-        # Get papers that CITE this DOI
-        cites = requests.get(f"{self.BASE_URL}/citations/{doi}", timeout=10)
+        client = get_async_client()
+        # Citations (papers that CITE this DOI) and references are independent lookups
+        cites, refs = await asyncio.gather(
+            client.get(f"{self.BASE_URL}/citations/{doi}", timeout=10),
+            client.get(f"{self.BASE_URL}/references/{doi}", timeout=10),
+        )
+
         if cites.status_code == 200:
             for c in cites.json()[:max_nodes]:
                 citing = c.get("citing")
@@ -18,8 +24,7 @@ class COCIService:
                     nodes.append({"id": citing, "label": citing, "group": "citation"})
                     edges.append({"source": citing, "target": doi})
 
-        #  Get papers this DOI REFERENCES
-        refs = requests.get(f"{self.BASE_URL}/references/{doi}", timeout=10)
+        #  Papers this DOI REFERENCES
         if refs.status_code == 200:
             for r in refs.json()[:max_nodes]:
                 cited = r.get("cited")
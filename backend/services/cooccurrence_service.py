@@ -0,0 +1,93 @@
+# backend/services/cooccurrence_service.py
+"""
+Keyword (concept) co-occurrence with sparse matrices.
+
+Works are encoded as a document-by-concept incidence matrix X, so that
+X.T @ X holds every pairwise co-occurrence count at once (the diagonal is the
+number of works per concept). Cost grows with the number of non-zeros rather
+than quadratically in concepts per work, which keeps thousands of works fast.
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+
+def cooccurrence_graph(
+    docs: Iterable[Iterable[Tuple[str, float]]],
+    min_count: int = 2,
+    top_k: Optional[int] = None,
+    weighted: bool = False,
+) -> Dict[str, List[dict]]:
+    """
+    Build a co-occurrence graph from per-document concept lists.
+
+    Args:
+        docs: For each work, (concept name, score) pairs; duplicates within a work count once
+        min_count: Minimum number of works two concepts must share to be linked
+        top_k: Keep only the k strongest edges (None keeps all above min_count)
+        weighted: Weight edges by sum over works of score_a * score_b instead of raw counts
+
+    Returns:
+        {"nodes": [{"id", "count", "score"}], "edges": [{"source", "target", "count", "weight"}]}
+    """
+    vocab: Dict[str, int] = {}
+    rows, cols, vals = [], [], []
+    n_docs = 0
+    for i, doc in enumerate(docs):
+        n_docs = i + 1
+        seen: Dict[int, float] = {}
+        for name, score in doc:
+            if not name:
+                continue
+            j = vocab.setdefault(name, len(vocab))
+            seen[j] = max(seen.get(j, 0.0), float(score if score is not None else 1.0))
+        rows.extend([i] * len(seen))
+        cols.extend(seen.keys())
+        vals.extend(seen.values())
+
+    if not vocab:
+        return {"nodes": [], "edges": []}
+
+    scores = sparse.csr_matrix((vals, (rows, cols)), shape=(n_docs, len(vocab)), dtype=np.float64)
+    incidence = scores.copy()
+    incidence.data[:] = 1.0
+
+    counts = (incidence.T @ incidence).tocsr()
+    doc_freq = counts.diagonal()
+    score_sum = np.asarray(scores.sum(axis=0)).ravel()
+
+    # Upper triangle only: each unordered pair once, no self-loops
+    pairs = sparse.triu(counts, k=1).tocoo()
+    keep = pairs.data >= min_count
+    src, tgt, cnt = pairs.row[keep], pairs.col[keep], pairs.data[keep]
+
+    if weighted and len(src):
+        weight_matrix = (scores.T @ scores).tocsr()
+        weight = np.asarray(weight_matrix[src, tgt]).ravel()
+    else:
+        weight = cnt
+
+    if top_k is not None and len(weight) > top_k:
+        order = np.argsort(-weight, kind="stable")[:top_k]
+        src, tgt, cnt, weight = src[order], tgt[order], cnt[order], weight[order]
+
+    names = list(vocab)
+    nodes = [
+        {"id": name, "count": int(doc_freq[j]), "score": round(float(score_sum[j]), 4)}
+        for name, j in vocab.items()
+    ]
+    edges = [
+        {
+            "source": names[a],
+            "target": names[b],
+            "count": int(c),
+            "weight": round(float(w), 4) if weighted else int(c),
+        }
+        for a, b, c, w in zip(src, tgt, cnt, weight)
+    ]
+    logger.info(f"[Cooccurrence] {n_docs} works, {len(nodes)} concepts, {len(edges)} edges")
+    return {"nodes": nodes, "edges": edges}
@@ -1,7 +1,8 @@
 # services/crossref_service.py
-import requests
-from typing import List, Dict, Optional
+import httpx
+from typing import List, Dict, Optional, Tuple
 from models.schemas import LiteratureItem, Author
+from services.http_client import get_async_client
 import logging
 import re
 
@@ -11,106 +12,137 @@ class CrossRefService:
     """Service for interacting with CrossRef API"""
     
     BASE_URL = "https://api.crossref.org/works"
+    SELECT_FIELDS = 'DOI,title,author,abstract,published,container-title,is-referenced-by-count'
+    # CrossRef's maximum rows per request (deep paging)
+    MAX_ROWS = 1000
+    # offset= paging only reaches this far; beyond it only cursors work
+    OFFSET_LIMIT = 10000
     
-    def __init__(self):
-        self.session = requests.Session()
-        # Set user agent for better API performance (CrossRef recommendation)
-        self.session.headers.update({
-            'User-Agent': 'ChromeAIChallenge/1.0 (mailto:your-email@example.com)'
-        })
-    
-    def search_literature(self, keyword: str, limit: int = 10, sort_by: str = "relevance") -> List[LiteratureItem]:
+    async def search_literature_async(self, keyword: str, limit: int = 10, sort_by: str = "relevance") -> List[LiteratureItem]:
+        """Search literature using the shared HTTP client"""
+        try:
+            response = await get_async_client().get(
+                self.BASE_URL, params=self._search_params(keyword, limit), timeout=10
+            )
+            response.raise_for_status()
+            return self._parse_search_response(response.json(), sort_by)
+
+        except httpx.HTTPError as e:
+            logger.error(f"CrossRef API Error: {e}")
+            return []
+
+    @staticmethod
+    def _search_params(keyword: str, limit: int) -> Dict:
+        """Build query parameters for a CrossRef works search"""
+        # Safety Constraints
+        limit = min(limit, 50)
+
+        return {
+            'query': keyword,
+            'rows': limit,
+            'select': CrossRefService.SELECT_FIELDS
+        }
+
+    async def search_page_async(
+        self, keyword: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> Tuple[List[LiteratureItem], Optional[str]]:
         """
-        Search literature using CrossRef API
+        Fetch `limit` results (relevance order) starting at a deep-paging cursor
+        
+        Unlike search_literature_async there is no 50-row cap: requests ask for
+        up to MAX_ROWS rows and follow CrossRef's next-cursor. Our cursor is
+        "<offset>:<CrossRef cursor>": CrossRef cursors expire a few minutes after
+        last use, so a rejected cursor is resumed with offset= as long as the
+        position is within OFFSET_LIMIT. Other HTTP errors are raised to the caller.
         
         Args:
             keyword: Search query keyword
-            limit: Maximum number of results to return
+            limit: Number of results to return
+            cursor: Cursor from a previous call, None for the first page
             
         Returns:
-            List of LiteratureItem objects
+            (items, next cursor or None when the results are exhausted)
         """
-        try:
-            # Safety Constraints
-            limit = min(limit, 50)
-
-            # Build API request URL
-            params = {
-                'query': keyword,
-                'rows': limit,
-                'select': 'DOI,title,author,abstract,published,container-title,is-referenced-by-count'
-            }
-            
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
+        position, _, upstream = (cursor or '0:*').partition(':')
+        position = int(position)
+        items = []
+        while len(items) < limit:
+            rows = min(limit - len(items), self.MAX_ROWS)
+            params = {'query': keyword, 'rows': rows, 'select': self.SELECT_FIELDS}
+            if upstream:
+                params['cursor'] = upstream
+            else:
+                params['offset'] = position
+            response = await get_async_client().get(self.BASE_URL, params=params, timeout=10)
+            if upstream and upstream != '*' and response.status_code in (400, 404) \
+                    and position + rows <= self.OFFSET_LIMIT:
+                logger.info(f"[CrossRef] Cursor rejected, resuming '{keyword}' at offset {position}")
+                upstream = ''
+                continue
             response.raise_for_status()
-            
-            data = response.json()
-            items = data.get('message', {}).get('items', [])
-            
-            # Parse and convert to LiteratureItem format
-            literature_items = []
-            for item in items:
-                literature_items.append(self._parse_crossref_item(item))
-            
-            seen_dois = set()
-            seen_titles = set()
-            unique_items = []
+            message = response.json().get('message', {})
+            batch = message.get('items', [])
+            items.extend(self._parse_crossref_item(item) for item in batch)
+            position += len(batch)
+            if upstream:
+                upstream = message.get('next-cursor')
+                if not upstream:
+                    return items, None
+            if len(batch) < rows:
+                return items, None
+        return items, f"{position}:{upstream}"
+
+    def _parse_search_response(self, data: Dict, sort_by: str) -> List[LiteratureItem]:
+        """Convert a CrossRef search response into LiteratureItem objects"""
+        items = data.get('message', {}).get('items', [])
+        
+        # Parse and convert to LiteratureItem format
+        literature_items = []
+        for item in items:
+            literature_items.append(self._parse_crossref_item(item))
+        
+        seen_dois = set()
+        seen_titles = set()
+        unique_items = []
 
-            for item in literature_items:
+        for item in literature_items:
 
-                if item.doi:
-                    if item.doi in seen_dois:
-                        logger.debug(f"[CrossRef] Skipping duplicate DOI: {item.doi}")
-                        continue
-                    seen_dois.add(item.doi)
+            if item.doi:
+                if item.doi in seen_dois:
+                    logger.debug(f"[CrossRef] Skipping duplicate DOI: {item.doi}")
+                    continue
+                seen_dois.add(item.doi)
  
-                else:
-                    normalized_title = item.title.lower().strip()[:100]
-                    if normalized_title in seen_titles:
-                        logger.debug(f"[CrossRef] Skipping duplicate title: {item.title[:50]}...")
-                        continue
-                    seen_titles.add(normalized_title)
-                
-                unique_items.append(item)
+            else:
+                normalized_title = item.title.lower().strip()[:100]
+                if normalized_title in seen_titles:
+                    logger.debug(f"[CrossRef] Skipping duplicate title: {item.title[:50]}...")
+                    continue
+                seen_titles.add(normalized_title)
             
-            logger.info(f"[CrossRef] Deduplication: {len(literature_items)} → {len(unique_items)} unique papers")
+            unique_items.append(item)
+        
+        logger.info(f"[CrossRef] Deduplication: {len(literature_items)} → {len(unique_items)} unique papers")
 
-            # Manual sorting (CrossRef doesn't support sort param)
-            if sort_by == "year":
-                literature_items.sort(
-                    key=lambda x: int(x.published_date[:4]) if x.published_date else 0, reverse=True
-                )
-            elif sort_by == "citations":
-                literature_items.sort(key=lambda x: x.citation_count or 0, reverse=True)
+        # Manual sorting (CrossRef doesn't support sort param)
+        if sort_by == "year":
+            literature_items.sort(
+                key=lambda x: int(x.published_date[:4]) if x.published_date else 0, reverse=True
+            )
+        elif sort_by == "citations":
+            literature_items.sort(key=lambda x: x.citation_count or 0, reverse=True)
 
-            return literature_items
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"CrossRef API Error: {e}")
-            return []
+        return literature_items
     
-    def get_by_doi(self, doi: str) -> Optional[LiteratureItem]:
-        """
-        Get specific literature by DOI
-        
-        Args:
-            doi: Digital Object Identifier
-            
-        Returns:
-            LiteratureItem object or None
-        """
+    async def get_by_doi_async(self, doi: str) -> Optional[LiteratureItem]:
+        """Fetch a work by DOI using the shared HTTP client"""
         try:
-            url = f"{self.BASE_URL}/{doi}"
-            response = self.session.get(url, timeout=10)
+            response = await get_async_client().get(f"{self.BASE_URL}/{doi}", timeout=10)
             response.raise_for_status()
-            
-            data = response.json()
-            item = data.get('message', {})
-            
-            return self._parse_crossref_item(item)
-            
-        except requests.exceptions.RequestException as e:
-            print(f"CrossRef DOI lookup error: {e}")
+            return self._parse_crossref_item(response.json().get('message', {}))
+
+        except httpx.HTTPError as e:
+            logger.warning(f"CrossRef DOI lookup error: {e}")
             return None
     
     def _parse_crossref_item(self, item: Dict) -> LiteratureItem:
@@ -0,0 +1,170 @@
+# backend/services/dedup_service.py
+"""
+Near-duplicate detection for merged search results.
+
+Titles are reduced to character shingles and MinHash signatures; LSH banding
+puts signatures that agree on a whole band into the same bucket, so only
+papers sharing a bucket are compared (roughly linear instead of all pairs).
+Buckets are additionally blocked by first-author surname, and candidates are
+confirmed on exact shingle overlap, identical number / part markers ("Part II",
+"8 TeV", "update 13"), a publication-year window and non-conflicting DOIs: a
+cluster never holds two different registered (non-arXiv) DOIs. Records with the
+same DOI are linked directly.
+"""
+import re
+import zlib
+import unicodedata
+from typing import Dict, List, Optional
+
+import numpy as np
+
+NUM_PERM = 64
+BANDS = 16                      # 16 bands x 4 rows: candidate threshold ~ (1/16) ** (1/4) ~ 0.5
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 4
+SIMILARITY_THRESHOLD = 0.8      # Jaccard of title shingles to confirm a match
+CONTAINMENT_THRESHOLD = 0.9     # ... or one title (nearly) inside the other, e.g. an added subtitle
+MIN_CONTAINED_SHINGLES = 20     # containment only counts for titles at least this long
+YEAR_WINDOW = 1                 # preprint and published version may straddle a year boundary
+
+_ROMAN = re.compile(r"^x{0,3}(ix|iv|v?i{0,3})$")  # i .. xxxix, enough for part / volume numbers
+
+_PRIME = np.uint64(4294967291)  # largest prime below 2**32
+_rng = np.random.default_rng(20240601)
+_A = _rng.integers(1, 2 ** 31, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 2 ** 31, size=NUM_PERM, dtype=np.uint64)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def shingles(title: str, size: int = SHINGLE_SIZE) -> set:
+    compact = normalize_text(title)
+    if len(compact) <= size:
+        return {compact} if compact else set()
+    return {compact[i:i + size] for i in range(len(compact) - size + 1)}
+
+
+def title_markers(title: str) -> tuple:
+    """Digit runs and roman-numeral tokens of a title, e.g. 'Part II ... at 8 TeV' -> ('8', 'ii')"""
+    compact = normalize_text(title)
+    digits = re.findall(r"\d+", compact)
+    numerals = [token for token in compact.split(" ") if token and _ROMAN.match(token)]
+    return tuple(sorted(digits + numerals))
+
+
+def is_registered_doi(doi: Optional[str]) -> bool:
+    """A DOI minted by a publisher, as opposed to an arXiv preprint DOI"""
+    return bool(doi) and "arxiv" not in doi.lower()
+
+
+def minhash(shingle_set: set) -> np.ndarray:
+    """MinHash signature: min over shingles of (a * crc32(s) + b) mod p for each permutation."""
+    if not shingle_set:
+        return np.full(NUM_PERM, _PRIME, dtype=np.uint64)
+    x = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingle_set), dtype=np.uint64)
+    return ((_A[:, None] * x[None, :] + _B[:, None]) % _PRIME).min(axis=1)
+
+
+def surname(name: Optional[str]) -> str:
+    """'Ashish Vaswani' / 'Vaswani, Ashish' -> 'vaswani'"""
+    if not name:
+        return ""
+    name = name.split(",")[0] if "," in name else name.strip().split(" ")[-1]
+    return normalize_text(name)
+
+
+def find_duplicate_clusters(
+    titles: List[str],
+    surnames: List[str],
+    years: List[int],
+    dois: List[Optional[str]],
+) -> List[List[int]]:
+    """
+    Group paper indexes that refer to the same work.
+
+    Args:
+        titles / surnames / years / dois: Parallel per-paper fields (year 0 = unknown)
+
+    Returns:
+        Clusters of indexes (each in input order), ordered by their first index;
+        papers without duplicates form singleton clusters
+    """
+    n = len(titles)
+    parent = list(range(n))
+    # Registered DOI held by each cluster root (at most one; see union)
+    registered = [dois[i].lower() if is_registered_doi(dois[i]) else None for i in range(n)]
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        ri, rj = find(i), find(j)
+        if ri == rj:
+            return
+        if registered[ri] and registered[rj] and registered[ri] != registered[rj]:
+            return  # two different registered DOIs are different works, even via a preprint
+        root, child = min(ri, rj), max(ri, rj)
+        parent[child] = root
+        registered[root] = registered[root] or registered[child]
+
+    # Exact links: same DOI
+    first_by_doi: Dict[str, int] = {}
+    for i in range(n):
+        if dois[i]:
+            key = dois[i].lower()
+            if key in first_by_doi:
+                union(first_by_doi[key], i)
+            else:
+                first_by_doi[key] = i
+
+    # Candidate buckets: LSH bands blocked by first-author surname, the main title
+    # (before ':') within the same surname, and identical normalized titles
+    shingle_sets = [shingles(t) for t in titles]
+    markers = [title_markers(t) for t in titles]
+    buckets: Dict[tuple, List[int]] = {}
+    for i in range(n):
+        if not shingle_sets[i]:
+            continue
+        signature = minhash(shingle_sets[i])
+        for band in range(BANDS):
+            key = (surnames[i], band, signature[band * ROWS:(band + 1) * ROWS].tobytes())
+            buckets.setdefault(key, []).append(i)
+        main_title = normalize_text((titles[i] or "").split(":")[0])
+        if len(main_title) >= 15:
+            buckets.setdefault((surnames[i], "main", main_title), []).append(i)
+        buckets.setdefault(("title", normalize_text(titles[i])), []).append(i)
+
+    checked = set()
+    for members in buckets.values():
+        for a_pos, a in enumerate(members):
+            for b in members[a_pos + 1:]:
+                if (a, b) in checked or find(a) == find(b):
+                    continue
+                checked.add((a, b))
+                if years[a] and years[b] and abs(years[a] - years[b]) > YEAR_WINDOW:
+                    continue
+                if markers[a] != markers[b]:
+                    continue  # "Part I" / "Part II", "7 TeV" / "8 TeV" are different works
+                sa, sb = shingle_sets[a], shingle_sets[b]
+                overlap = len(sa & sb)
+                jaccard = overlap / len(sa | sb)
+                shorter = min(len(sa), len(sb))
+                contained = shorter >= MIN_CONTAINED_SHINGLES and overlap / shorter >= CONTAINMENT_THRESHOLD
+                if jaccard >= SIMILARITY_THRESHOLD or contained:
+                    union(a, b)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(n):
+        clusters.setdefault(find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda c: c[0])
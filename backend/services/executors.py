@@ -0,0 +1,58 @@
+# backend/services/executors.py
+"""
+Bounded, named thread pools for work that must not run on the event loop.
+
+Execution model for `async def` route handlers:
+- Upstream HTTP calls use the shared async client (services/http_client.py).
+- Blocking calls with no async equivalent (third-party SDKs, legacy
+  requests-based helpers) go through `run_blocking("upstream", ...)`.
+- CPU-heavy work (graph analytics, layouts, parsing large payloads) goes
+  through `run_blocking("cpu", ...)`.
+
+Each pool has a fixed size and a thread-name prefix, so saturation is
+bounded and visible in thread dumps instead of silently consuming the
+default executor that asyncio.to_thread shares with everything else.
+"""
+import os
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_SIZES = {
+    "upstream": int(os.getenv("UPSTREAM_EXECUTOR_WORKERS", "16")),
+    "cpu": int(os.getenv("CPU_EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1)))),
+}
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+
+
+def get_executor(name: str) -> ThreadPoolExecutor:
+    """Return the named pool, creating it on first use."""
+    if name not in EXECUTOR_SIZES:
+        raise ValueError(f"Unknown executor '{name}'. Use one of: {', '.join(EXECUTOR_SIZES)}")
+    executor = _executors.get(name)
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=EXECUTOR_SIZES[name],
+            thread_name_prefix=f"{name}-pool"
+        )
+        _executors[name] = executor
+    return executor
+
+
+async def run_blocking(name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking callable on the named pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(name), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_executors():
+    """Shut down all named pools (called on application shutdown)."""
+    for name, executor in list(_executors.items()):
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"[Executors] '{name}' pool shut down")
+    _executors.clear()
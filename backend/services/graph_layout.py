@@ -0,0 +1,169 @@
+# backend/services/graph_layout.py
+"""
+Server-side node layouts for normalized graphs, so the browser can render
+large graphs without running its own force simulation.
+
+- "fr": Fruchterman-Reingold. Small graphs get exact repulsion, vectorized in
+  row blocks; above FR_EXACT_LIMIT nodes the grid variant from the original
+  paper is used: only pairs closer than 2k repel (found with a KD-tree), so an
+  iteration costs O(n log n) instead of O(n^2). Attraction runs over the
+  sparse edge list.
+- "kk": Kamada-Kawai style stress majorization on graph-theoretic distances
+  (scipy.sparse.csgraph). It is O(n^2) per iteration on the dense distance
+  matrix, so graphs above KK_MAX_NODES are laid out with "fr" instead.
+
+Graphs above LAYOUT_MAX_NODES are rejected with LayoutTooLargeError.
+
+Positions are scaled to [-LAYOUT_SCALE, LAYOUT_SCALE] and written to node
+x/y (and fx/fy, which pins them in react-force-graph).
+"""
+import os
+import logging
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import shortest_path
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
+
+logger = logging.getLogger(__name__)
+
+LAYOUTS = ("fr", "kk")
+LAYOUT_SCALE = float(os.getenv("LAYOUT_SCALE", "500"))
+FR_ITERATIONS = 100
+FR_BLOCK = 512
+FR_EXACT_LIMIT = 500
+KK_ITERATIONS = 200
+KK_MAX_NODES = int(os.getenv("KK_MAX_NODES", "500"))
+LAYOUT_MAX_NODES = int(os.getenv("LAYOUT_MAX_NODES", "3000"))
+
+
+class LayoutTooLargeError(ValueError):
+    """The graph has more nodes than LAYOUT_MAX_NODES."""
+
+
+def _undirected_edges(graph: dict):
+    # Index unique IDs; nodes repeated in the graph share one position
+    index = {node_id: i for i, node_id in enumerate(dict.fromkeys(node["id"] for node in graph["nodes"]))}
+    pairs = {
+        tuple(sorted((index[e["source"]], index[e["target"]])))
+        for e in graph["edges"]
+        if e["source"] in index and e["target"] in index and e["source"] != e["target"]
+    }
+    edges = np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2)
+    return edges, index
+
+
+def _scatter(disp: np.ndarray, first: np.ndarray, second: np.ndarray, force: np.ndarray):
+    """disp[first] += force and disp[second] -= force (bincount is much faster than np.add.at)."""
+    n = disp.shape[0]
+    for axis in range(2):
+        disp[:, axis] += np.bincount(first, force[:, axis], n) - np.bincount(second, force[:, axis], n)
+
+
+def fruchterman_reingold(n: int, edges: np.ndarray, iterations: int = FR_ITERATIONS, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(-1.0, 1.0, size=(n, 2))
+    if n < 2:
+        return pos
+    k = 2.0 / np.sqrt(n)  # ideal edge length for a 2 x 2 frame
+    temperature = 0.2
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        disp = np.zeros_like(pos)
+        if n <= FR_EXACT_LIMIT:
+            # Repulsion k^2 / d between all pairs, one block of rows at a time
+            for start in range(0, n, FR_BLOCK):
+                block = pos[start:start + FR_BLOCK]
+                delta = block[:, None, :] - pos[None, :, :]
+                dist2 = np.einsum("ijk,ijk->ij", delta, delta)
+                np.maximum(dist2, 1e-9, out=dist2)
+                disp[start:start + FR_BLOCK] = np.einsum("ijk,ij->ik", delta, (k * k) / dist2)
+        else:
+            # Grid variant: repulsion only between pairs closer than 2k
+            pairs = cKDTree(pos).query_pairs(2 * k, output_type="ndarray")
+            if len(pairs):
+                delta = pos[pairs[:, 0]] - pos[pairs[:, 1]]
+                dist2 = np.maximum(np.einsum("ij,ij->i", delta, delta), 1e-9)
+                force = delta * ((k * k) / dist2)[:, None]
+                _scatter(disp, pairs[:, 0], pairs[:, 1], force)
+
+        # Attraction d^2 / k along edges
+        if len(edges):
+            delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+            dist = np.maximum(np.linalg.norm(delta, axis=1), 1e-9)
+            force = delta * (dist / k)[:, None]
+            _scatter(disp, edges[:, 1], edges[:, 0], force)
+
+        length = np.maximum(np.linalg.norm(disp, axis=1), 1e-9)
+        pos += disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+    return pos
+
+
+def kamada_kawai(n: int, edges: np.ndarray, iterations: int = KK_ITERATIONS, seed: int = 0) -> np.ndarray:
+    """Stress majorization: place nodes so Euclidean distances match shortest-path lengths."""
+    if n < 2:
+        return np.zeros((n, 2))
+    adj = sparse.csr_matrix((np.ones(len(edges)), (edges[:, 0], edges[:, 1])), shape=(n, n)) if len(edges) \
+        else sparse.csr_matrix((n, n))
+    dist = shortest_path(adj, directed=False, unweighted=True)
+    # Disconnected components sit one hop beyond the graph's diameter from each other
+    finite = dist[np.isfinite(dist)]
+    dist[~np.isfinite(dist)] = (finite.max() if finite.size else 0) + 1
+    np.fill_diagonal(dist, 0)
+
+    weights = np.zeros_like(dist)
+    off_diag = dist > 0
+    weights[off_diag] = dist[off_diag] ** -2
+    weight_sum = weights.sum(axis=1)
+
+    pos = fruchterman_reingold(n, edges, iterations=30, seed=seed) * np.sqrt(n)
+    weighted_dist = weights * dist
+    for _ in range(iterations):
+        # x_i <- sum_j w_ij (x_j + d_ij (x_i - x_j) / |x_i - x_j|) / sum_j w_ij, as matrix products
+        norm = np.maximum(cdist(pos, pos), 1e-9)
+        pull = weighted_dist / norm
+        updated = (weights @ pos + pull.sum(axis=1)[:, None] * pos - pull @ pos) / weight_sum[:, None]
+        if np.abs(updated - pos).max() < 1e-4:
+            pos = updated
+            break
+        pos = updated
+    return pos
+
+
+def layout_graph(graph: dict, algorithm: str = "fr", seed: int = 0) -> dict:
+    """
+    Return a copy of `graph` with x/y (and fx/fy) on every node.
+
+    Args:
+        graph: Normalized graph
+        algorithm: "fr" (Fruchterman-Reingold) or "kk" (Kamada-Kawai)
+        seed: Random seed, so the same graph always gets the same layout
+    """
+    if algorithm not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{algorithm}'. Use one of: {', '.join(LAYOUTS)}")
+    if not graph or not graph.get("nodes"):
+        return graph
+
+    edges, index = _undirected_edges(graph)
+    n = len(index)
+    if n > LAYOUT_MAX_NODES:
+        raise LayoutTooLargeError(f"Graph has {n} nodes; layouts are computed for at most {LAYOUT_MAX_NODES}")
+    used = algorithm
+    if algorithm == "kk" and n > KK_MAX_NODES:
+        used = "fr"
+    pos = kamada_kawai(n, edges, seed=seed) if used == "kk" else fruchterman_reingold(n, edges, seed=seed)
+
+    pos -= pos.mean(axis=0)
+    extent = np.abs(pos).max()
+    if extent > 0:
+        pos *= LAYOUT_SCALE / extent
+
+    nodes = []
+    for node in graph["nodes"]:
+        x, y = (round(float(v), 2) for v in pos[index[node["id"]]])
+        nodes.append({**node, "x": x, "y": y, "fx": x, "fy": y})
+    logger.info(f"[GraphLayout] {used} layout for {n} nodes, {len(edges)} edges")
+    return {**graph, "nodes": nodes, "layout": used}
@@ -0,0 +1,350 @@
+# backend/services/graph_store.py
+"""
+Local citation graph store.
+
+Every citation graph built from COCI / OpenAlex / Lens is folded into a
+SQLite edge table (indexed on both endpoints), together with the works it
+mentions and the set of works whose neighbourhood has been fetched
+("expanded"), per build mode. Edges are recorded per mode and per provider
+that reported them. Later requests - including multi-hop ones - are answered
+by walking the local adjacency when every work that has to be expanded was
+fetched recently enough in the same mode, using only edges from that mode and
+the providers behind those expansions, and the same size limits the
+providers apply; otherwise the caller goes upstream and feeds the result back in.
+"""
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+GRAPH_STORE_PATH = os.getenv("GRAPH_STORE_PATH", "graph_store.db")
+# Expanded neighbourhoods older than this are revalidated upstream
+GRAPH_STORE_MAX_AGE = int(os.getenv("GRAPH_STORE_MAX_AGE", str(7 * 86400)))
+
+SOURCE_NAME = "Local graph store"
+
+# How an expansion was built; a request is only answered from expansions of its own mode
+MODES = (
+    "merged",    # depth 1, providers raced and merged
+    "first",     # depth 1, first provider to answer (merge=false, progressive stream)
+    "multihop",  # depth > 1, OpenAlex frontier expansion
+)
+
+# Depth-1 neighbourhood size each provider returns for a max_nodes budget,
+# as (references, citing works); see COCIService, OpenAlexGraphService, LensService
+PROVIDER_SIDE_LIMITS = {
+    "OpenCitations (COCI)": lambda n: (n, n),
+    "OpenAlex": lambda n: (n // 2, min(n // 2, 25)),
+    "Lens.org": lambda n: (n, n),
+}
+
+
+def _canonical_id(node: dict) -> str:
+    """DOI when known (the identity the merged graphs use), else the provider ID."""
+    meta = node.get("meta") or {}
+    return meta.get("doi") or node["id"]
+
+
+class GraphStore:
+    """
+    SQLite adjacency store for normalized citation graphs.
+
+    Tables:
+        works(id, doi, openalex_id, label, cited_by, updated_at)
+        edges(source, target, mode, provider, type, updated_at)  - source cites target
+        expanded(id, mode, provider, expanded_at, budget)        - neighbourhood fetched
+
+    Like CacheService, one WAL-mode connection is shared by all threads and
+    guarded by a lock.
+    """
+
+    def __init__(self, db_path: str = GRAPH_STORE_PATH, max_age: int = GRAPH_STORE_MAX_AGE):
+        self.db_path = db_path
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._conn = None
+        self._init_db()
+
+    def _init_db(self):
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS works (
+                id TEXT PRIMARY KEY,
+                doi TEXT,
+                openalex_id TEXT,
+                label TEXT,
+                cited_by INTEGER DEFAULT 0,
+                updated_at REAL
+            )
+        """)
+        edge_columns = {row[1] for row in self._conn.execute("PRAGMA table_info(edges)")}
+        if edge_columns and "mode" not in edge_columns:
+            # Edges recorded without mode / per-provider rows can't be filtered; refetch everything
+            logger.info("[GraphStore] Dropping edges and expansions recorded without a build mode")
+            self._conn.execute("DROP TABLE edges")
+            self._conn.execute("DROP TABLE IF EXISTS expanded")
+        # Primary key covers lookups by source; the second index serves lookups by target
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS edges (
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                type TEXT,
+                updated_at REAL,
+                PRIMARY KEY (source, target, mode, provider)
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_target ON edges (target, source)")
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(expanded)")}
+        if columns and "mode" not in columns:
+            # Expansions recorded without their build mode can't be matched to requests; refetch them
+            logger.info("[GraphStore] Dropping expansions recorded without a build mode")
+            self._conn.execute("DROP TABLE expanded")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS expanded (
+                id TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                provider TEXT,
+                expanded_at REAL,
+                budget INTEGER,
+                PRIMARY KEY (id, mode)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_works_openalex ON works (openalex_id)")
+
+    # ---------- Writes ----------
+    def add_graph(self, graph: dict, expanded: List[str], budget: int, mode: str = "merged"):
+        """
+        Fold a normalized graph into the store.
+
+        Args:
+            graph: Normalized graph ({"nodes", "edges", "source"})
+            expanded: IDs (DOI or provider ID) of the works whose neighbourhood
+                the graph reflects, e.g. [center DOI] for a depth-1 graph
+            budget: Node budget (max_nodes) the graph was built with; only
+                requests within it are answered from these neighbourhoods
+            mode: How the graph was built (see MODES)
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown graph store mode '{mode}'")
+        if not graph or not graph.get("edges"):
+            return
+        now = time.time()
+        provider = graph.get("source") or "unknown"
+        ids = {node["id"]: _canonical_id(node) for node in graph["nodes"]}
+
+        works = []
+        for node in graph["nodes"]:
+            meta = node.get("meta") or {}
+            label = node.get("label") or ""
+            # Placeholder labels must not overwrite a real title stored earlier
+            if label in ("Untitled", meta.get("doi")) or label.startswith("DOI:"):
+                label = None
+            works.append((ids[node["id"]], meta.get("doi"), meta.get("openalex_id"), label,
+                          meta.get("cited_by") or 0, now))
+        # One row per provider that reported the edge (merged graphs list them in "sources")
+        edges = [
+            (ids.get(e["source"], e["source"]), ids.get(e["target"], e["target"]), mode, name, e.get("type"), now)
+            for e in graph["edges"]
+            for name in (e.get("sources") or provider.split(" + "))
+        ]
+        resolved = [ids.get(i) or self._resolve(i) for i in expanded]
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("""
+                    INSERT INTO works (id, doi, openalex_id, label, cited_by, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        doi = COALESCE(excluded.doi, works.doi),
+                        openalex_id = COALESCE(excluded.openalex_id, works.openalex_id),
+                        label = COALESCE(excluded.label, works.label),
+                        cited_by = MAX(excluded.cited_by, works.cited_by),
+                        updated_at = excluded.updated_at
+                """, works)
+                self._conn.executemany("""
+                    INSERT INTO edges (source, target, mode, provider, type, updated_at) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(source, target, mode, provider) DO UPDATE SET updated_at = excluded.updated_at
+                """, edges)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO expanded (id, mode, provider, expanded_at, budget) VALUES (?, ?, ?, ?, ?)",
+                    [(i, mode, provider, now, budget) for i in resolved if i]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        logger.info(f"[GraphStore] Stored {len(works)} works, {len(edges)} edges from {provider}")
+
+    # ---------- Reads ----------
+    def _resolve(self, work_id: str) -> Optional[str]:
+        """Map a DOI / OpenAlex ID to the stored work ID."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM works WHERE id = ? OR openalex_id = ? LIMIT 1", (work_id, work_id)
+            ).fetchone()
+        return row[0] if row else work_id
+
+    def _fresh_expanded(self, ids: List[str], budget: int, mode: str) -> Dict[str, str]:
+        """Work ID -> provider(s) for the fresh expansions of `ids` in `mode`."""
+        cutoff = time.time() - self.max_age
+        fresh = {}
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                fresh.update(self._conn.execute(
+                    f"SELECT id, provider FROM expanded WHERE mode = ? AND expanded_at >= ? AND budget >= ? "
+                    f"AND id IN ({placeholders})",
+                    [mode, cutoff, budget, *chunk]
+                ))
+        return fresh
+
+    def _neighbours(self, ids: List[str], mode: str, providers: Set[str]):
+        """
+        (work, neighbour, relation, edge type) for the edges touching `ids` that
+        were recorded in `mode` by one of `providers`, via the two edge indexes.
+        """
+        rows = set()
+        provider_marks = ",".join("?" * len(providers))
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                params = [*chunk, mode, *providers]
+                rows.update(
+                    (src, tgt, "reference", etype) for src, tgt, etype in self._conn.execute(
+                        f"SELECT source, target, type FROM edges WHERE source IN ({placeholders}) "
+                        f"AND mode = ? AND provider IN ({provider_marks})", params)
+                )
+                rows.update(
+                    (tgt, src, "cited_by", etype) for src, tgt, etype in self._conn.execute(
+                        f"SELECT source, target, type FROM edges WHERE target IN ({placeholders}) "
+                        f"AND mode = ? AND provider IN ({provider_marks})", params)
+                )
+        return sorted(rows, key=lambda row: (row[0], row[1], row[2], row[3] or ""))
+
+    def _works(self, ids: List[str]) -> Dict[str, tuple]:
+        found = {}
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT id, doi, openalex_id, label, cited_by FROM works WHERE id IN ({placeholders})", chunk
+                ):
+                    found[row[0]] = row
+        return found
+
+    def neighbourhood(self, work_id: str, depth: int = 1, max_nodes: int = 60,
+                      mode: str = "merged") -> Optional[dict]:
+        """
+        Answer a citation graph request locally.
+
+        Walks references and citing works breadth-first over the edges the
+        expansions' providers reported in `mode`, keeping the most cited new
+        works. A depth-1 request keeps as many references and citing works as
+        its providers return upstream (PROVIDER_SIDE_LIMITS, e.g. up to
+        2 * max_nodes + 1 nodes with COCI); a multi-hop request splits the
+        `max_nodes` budget over the levels like
+        OpenAlexGraphService.expand_citation_graph.
+
+        Args:
+            mode: Build mode the request needs (see MODES); expansions and
+                edges recorded in another mode don't count
+
+        Returns:
+            Normalized graph, or None when some work that must be expanded
+            is missing, older than max_age, was fetched with a smaller
+            budget or in another mode (the caller should go upstream)
+        """
+        center = self._resolve(work_id)
+        hops = {center: 0}
+        groups = {center: "center"}
+        frontier = [center]
+        expanded = []
+        providers = set()
+
+        for hop in range(1, depth + 1):
+            if not frontier or len(hops) >= max_nodes:
+                break
+            fresh = self._fresh_expanded(frontier, max_nodes, mode)
+            if len(fresh) < len(frontier):
+                return None
+            for names in fresh.values():
+                providers.update((names or "unknown").split(" + "))
+            expanded.extend(frontier)
+            links = self._neighbours(frontier, mode, providers)
+            candidates = {}
+            for _, neighbour, relation, _ in links:
+                if neighbour not in hops:
+                    candidates.setdefault(neighbour, relation)
+            cited_by = {wid: row[4] for wid, row in self._works(list(candidates)).items()}
+            ranked = sorted(candidates, key=lambda wid: cited_by.get(wid, 0), reverse=True)
+            if depth == 1 and mode != "multihop":
+                ref_limit, citer_limit = self._side_limits(providers, max_nodes)
+                references = [wid for wid in ranked if candidates[wid] == "reference"][:ref_limit]
+                citers = [wid for wid in ranked if candidates[wid] == "cited_by"][:citer_limit]
+                frontier = references + citers
+            else:
+                frontier = ranked[:max(1, (max_nodes - len(hops)) // (depth - hop + 1))]
+            for wid in frontier:
+                hops[wid] = hop
+                groups[wid] = candidates[wid]
+
+        if len(hops) == 1:
+            return None
+
+        kept = list(hops)
+        works = self._works(kept)
+        nodes = []
+        for wid in kept:
+            _, doi, openalex_id, label, cited_by = works.get(wid, (wid, None, None, None, 0))
+            meta = {"source": SOURCE_NAME, "doi": doi, "hop": hops[wid], "cited_by": cited_by}
+            if openalex_id:
+                meta["openalex_id"] = openalex_id
+            nodes.append({"id": wid, "label": (label or wid)[:150], "group": groups[wid], "meta": meta})
+
+        # Like upstream, only edges reported by an expanded work's neighbourhood
+        kept_set = set(kept)
+        edges = {}
+        for wid, neighbour, relation, etype in self._neighbours(expanded, mode, providers):
+            if neighbour not in kept_set:
+                continue
+            src, tgt = (wid, neighbour) if relation == "reference" else (neighbour, wid)
+            edges[(src, tgt)] = {"source": src, "target": tgt, "type": etype or "cites", "weight": 1.0}
+
+        return {
+            "nodes": nodes,
+            "edges": list(edges.values()),
+            "source": SOURCE_NAME,
+            "message": f"Data from {SOURCE_NAME}"
+        }
+
+    @staticmethod
+    def _side_limits(providers: Set[str], max_nodes: int) -> tuple:
+        """Largest (references, citing works) any of `providers` returns at depth 1."""
+        limits = [PROVIDER_SIDE_LIMITS.get(name, lambda n: (n, n))(max_nodes) for name in providers]
+        return max(refs for refs, _ in limits), max(citers for _, citers in limits)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("works", "edges", "expanded")
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,56 @@
+# backend/services/http_client.py
+"""
+Shared asynchronous HTTP client for upstream APIs (CrossRef, arXiv, OpenAlex, ...).
+
+One httpx.AsyncClient (HTTP/2, pooled keep-alive connections) is created lazily
+and reused by every service, so a single worker can keep hundreds of upstream
+requests in flight without a thread per request. It is closed on app shutdown.
+"""
+import os
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool tuning
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "200"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "50"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("HTTP_DEFAULT_TIMEOUT", "30"))
+
+USER_AGENT = "IC-Easy/1.0 (mailto:your-email@example.com)"
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(HTTP_DEFAULT_TIMEOUT, connect=10.0),
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+        )
+        logger.info(
+            f"[HTTPClient] Created shared AsyncClient - http2=True, "
+            f"max_connections={HTTP_MAX_CONNECTIONS}, max_keepalive={HTTP_MAX_KEEPALIVE}"
+        )
+    return _client
+
+
+async def close_async_client():
+    """Close the shared AsyncClient (called on application shutdown)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("[HTTPClient] Shared AsyncClient closed")
+    _client = None
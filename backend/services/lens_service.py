@@ -1,7 +1,7 @@
 # backend/services/lens_service.py
-import requests
 import re
 import logging
+from services.http_client import get_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +18,10 @@ def clean_html_tags(text: str) -> str:
 class LensService:
     BASE_URL = "https://api.lens.org/scholarly/search"
 
-    def get_citation_graph(self, doi: str, max_nodes: int = 60):
+    async def get_citation_graph(self, doi: str, max_nodes: int = 60):
         headers = {"Accept": "application/json"}
         query = {"query": {"term": {"ids.doi": doi}}, "size": 1}
-        resp = requests.post(self.BASE_URL, json=query, headers=headers, timeout=10)
+        resp = await get_async_client().post(self.BASE_URL, json=query, headers=headers, timeout=10)
         if resp.status_code != 200:
             return None
 
@@ -30,25 +30,32 @@ class LensService:
             return None
 
         paper = data[0]
-        nodes = [{"id": doi, "label": clean_html_tags(paper.get("title", doi)), "group": "paper"}]
+        nodes = [{
+            "id": doi, "label": clean_html_tags(paper.get("title", doi)), "group": "paper",
+            "doi": doi, "lens_id": paper.get("lens_id")
+        }]
         edges = []
 
-        # Citations
+        # Citations: citing -> this paper
         for c in paper.get("citations", [])[:max_nodes]:
             nodes.append({
                 "id": c.get("doi", c.get("id")), 
                 "label": clean_html_tags(c.get("title", "Cited")), 
-                "group": "citation"
+                "group": "citation",
+                "doi": c.get("doi"),
+                "lens_id": c.get("lens_id") or c.get("id")
             })
-            edges.append({"source": doi, "target": c.get("doi", c.get("id"))})
+            edges.append({"source": c.get("doi", c.get("id")), "target": doi})
 
-        # References
+        # References: this paper -> reference
         for r in paper.get("references", [])[:max_nodes]:
             nodes.append({
                 "id": r.get("doi", r.get("id")), 
                 "label": clean_html_tags(r.get("title", "Ref")), 
-                "group": "ref"
+                "group": "ref",
+                "doi": r.get("doi"),
+                "lens_id": r.get("lens_id") or r.get("id")
             })
-            edges.append({"source": r.get("doi", r.get("id")), "target": doi})
+            edges.append({"source": doi, "target": r.get("doi", r.get("id"))})
 
         return {"nodes": nodes, "edges": edges}
\ No newline at end of file
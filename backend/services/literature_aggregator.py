@@ -1,188 +1,600 @@
 # services/literature_aggregator.py
 import asyncio
-from typing import List, Dict, Set, Optional
+import base64
+import hashlib
+import json
+import os
+import time
+import zlib
+from typing import AsyncIterator, List, Dict, Optional, Tuple, Union
 from models.schemas import LiteratureItem
 from services.crossref_service import CrossRefService
 from services.arxiv_service import ArXivService
 from services.openalex_service import OpenAlexService
+from services.cache_service import CacheService, Uncached, get_cache_service
+from services.dedup_service import find_duplicate_clusters, surname
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# Source precedence per field when merging duplicate records (first non-empty wins):
+# CrossRef for bibliographic metadata, arXiv for abstracts and open full-text links,
+# OpenAlex for citation counts
+FIELD_PRECEDENCE = {
+    "title": ("crossref", "openalex", "arxiv"),
+    "authors": ("crossref", "openalex", "arxiv"),
+    "abstract": ("arxiv", "openalex", "crossref"),
+    "journal": ("crossref", "openalex", "arxiv"),
+    "volume": ("crossref", "openalex"),
+    "issue": ("crossref", "openalex"),
+    "pages": ("crossref", "openalex"),
+    "month": ("crossref", "openalex", "arxiv"),
+    "published_date": ("crossref", "openalex", "arxiv"),
+    "doi": ("crossref", "openalex", "arxiv"),
+    "url": ("arxiv", "openalex", "crossref"),
+    "citation_count": ("openalex", "crossref", "arxiv"),
+}
+
+# Weight of the newest sample in each source's latency EWMA
+SEARCH_LATENCY_ALPHA = float(os.getenv("SEARCH_LATENCY_ALPHA", "0.3"))
+# A source cancelled at the deadline took at least that long; it is recorded as this multiple
+SEARCH_TIMEOUT_PENALTY = 2.0
+# Sources expected to miss a deadline are skipped, but still probed this often (seconds)
+# so their latency estimate can recover
+SEARCH_PROBE_INTERVAL = int(os.getenv("SEARCH_PROBE_INTERVAL", "60"))
+
+
+class SourceLatencyTracker:
+    """Exponentially weighted moving average of each source's search latency"""
+
+    def __init__(self, alpha: float = SEARCH_LATENCY_ALPHA, probe_interval: int = SEARCH_PROBE_INTERVAL):
+        self.alpha = alpha
+        self.probe_interval = probe_interval
+        self._ewma_ms: Dict[str, float] = {}
+        self._last_attempt: Dict[str, float] = {}
+
+    def started(self, source: str):
+        self._last_attempt[source] = time.monotonic()
+
+    def record(self, source: str, elapsed_ms: float, timed_out: bool = False):
+        sample = elapsed_ms * SEARCH_TIMEOUT_PENALTY if timed_out else elapsed_ms
+        previous = self._ewma_ms.get(source)
+        self._ewma_ms[source] = sample if previous is None else previous + self.alpha * (sample - previous)
+
+    def expected_ms(self, source: str) -> Optional[float]:
+        return self._ewma_ms.get(source)
+
+    def should_try(self, source: str, deadline_ms: int) -> bool:
+        """False for a source expected to miss the deadline, unless it is due for a probe"""
+        expected = self._ewma_ms.get(source)
+        if expected is None or expected <= deadline_ms:
+            return True
+        return time.monotonic() - self._last_attempt.get(source, 0) >= self.probe_interval
+
+    def snapshot(self) -> Dict[str, int]:
+        return {source: int(ms) for source, ms in self._ewma_ms.items()}
+
+
 class LiteratureAggregator:
     """Aggregate and deduplicate literature from multiple sources"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[CacheService] = None):
         """Initialize services for all data sources"""
         self.crossref = CrossRefService()
         self.arxiv = ArXivService()
         self.openalex = OpenAlexService()
+        # Merged, pre-filter result sets are cached in the "search" namespace
+        self.cache = cache or get_cache_service()
+        self.latency = SourceLatencyTracker()
         logger.info("[LiteratureAggregator] Initialized with CrossRef, arXiv, and OpenAlex services")
     
     async def search_all_sources(
         self, 
         keyword: str, 
         limit_per_source: int = 10,
-        filters: Optional[dict] = None
+        filters: Optional[dict] = None,
+        source: str = "all"
     ) -> List[LiteratureItem]:
         """
         Search all available sources and merge results with filtering and sorting
+
+        The merged, deduplicated result set is cached per (keyword, limit, source)
+        before filtering, so changing filters or sort order never refetches.
         
         Args:
             keyword: Search query
             limit_per_source: Maximum results per source
             filters: Optional advanced filters (year_min, year_max, min_citations, 
                      authors, journals, open_access_only, sort_by)
+            source: "all" or a single source (crossref | arxiv | openalex)
             
         Returns:
             Deduplicated, filtered, and sorted list of literature items
         """
         try:
-            # Define source names for better logging
-            sources = ["CrossRef", "ArXiv", "OpenAlex"]
-            
             logger.info(
                 f"[LiteratureAggregator] Starting multi-source search - "
-                f"keyword='{keyword}', limit_per_source={limit_per_source}, "
+                f"keyword='{keyword}', limit_per_source={limit_per_source}, source={source}, "
                 f"filters={'enabled' if filters else 'none'}"
             )
-            
-            # Create concurrent tasks for all sources
-            crossref_task = asyncio.to_thread(
-                self.crossref.search_literature, keyword, limit_per_source
-            )
-            arxiv_task = asyncio.to_thread(
-                self.arxiv.search_literature, keyword, limit_per_source
-            )
-            openalex_task = asyncio.to_thread(
-                self.openalex.search_literature, keyword, limit_per_source
+
+            cache_key = self._search_cache_key(keyword, limit_per_source, source)
+            merged = await self.cache.get_or_fetch(
+                "search", cache_key,
+                lambda: self._fetch_merged(keyword, limit_per_source, source)
             )
+            if not merged:
+                return []
+            deduplicated = [LiteratureItem(**paper) for paper in merged]
             
-            # Execute all searches concurrently
-            results = await asyncio.gather(
-                crossref_task, 
-                arxiv_task, 
-                openalex_task,
-                return_exceptions=True
-            )
+            return self._finalize(deduplicated, filters, limit_per_source)
             
-            # Collect valid results and log errors
-            all_papers = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.warning(
-                        f"[LiteratureAggregator] {sources[i]} search failed - "
-                        f"error: {str(result)}"
-                    )
-                    continue
-                
-                if result:
-                    logger.info(
-                        f"[LiteratureAggregator] {sources[i]} returned "
-                        f"{len(result)} papers"
-                    )
-                    all_papers.extend(result)
-                else:
-                    logger.warning(f"[LiteratureAggregator] {sources[i]} returned empty results")
+        except Exception as e:
+            logger.error(
+                f"[LiteratureAggregator] Aggregation failed for keyword '{keyword}' - "
+                f"error: {str(e)}", 
+                exc_info=True
+            )
+            return []
+    
+    async def search_page(
+        self,
+        keyword: str,
+        limit_per_source: int = 10,
+        filters: Optional[dict] = None,
+        source: str = "all",
+        page_token: Optional[str] = None,
+        deadline_ms: Optional[int] = None
+    ) -> Tuple[List[LiteratureItem], List[str], Optional[str]]:
+        """
+        One page of search_all_sources, optionally within a latency budget
+        
+        Without a page_token this is the first page (sharing its cache entry
+        with search_all_sources and stream_all_sources, which like this method
+        only cache complete sets, so a cached page is never partial); a
+        page_token continues every source from the upstream cursor it reached
+        on the previous page.
+        
+        With deadline_ms, sources still running when the deadline passes are
+        cancelled and the results merged so far are returned. Sources whose
+        latency average already exceeds the budget are not queried at all
+        (apart from an occasional probe). Skipped and cancelled sources resume
+        from the same cursor on the next page. Only complete pages are cached,
+        so a token always returns the same page while it is cached.
+        
+        Args:
+            Same as search_all_sources, plus
+            page_token: next_page_token from the previous page of the same search
+            deadline_ms: Overall budget for the upstream searches in milliseconds
             
-            if not all_papers:
-                logger.warning(
-                    f"[LiteratureAggregator] No papers found for keyword '{keyword}'"
-                )
-                return []
+        Returns:
+            (results, missing sources, next page token or None on the last page);
+            a non-empty missing list means the results are partial
             
-            # Deduplicate by DOI and title
-            deduplicated = self._deduplicate_papers(all_papers)
+        Raises:
+            ValueError: page_token is malformed or belongs to a different search
+        """
+        cache_key = self._search_cache_key(keyword, limit_per_source, source)
+        cursors = None
+        page_key = cache_key
+        if page_token:
+            cursors = self._decode_page_token(page_token, cache_key)
+            page_key = f"{cache_key}|{hashlib.sha1(page_token.encode()).hexdigest()[:16]}"
+
+        try:
             logger.info(
-                f"[LiteratureAggregator] Deduplication: "
-                f"{len(all_papers)} → {len(deduplicated)} unique papers"
+                f"[LiteratureAggregator] Starting multi-source search - "
+                f"keyword='{keyword}', limit_per_source={limit_per_source}, source={source}, "
+                f"page={'next' if page_token else 'first'}, deadline={deadline_ms or 'none'}"
             )
-            
-            # Apply advanced filters
-            if filters:
-                filtered = self._apply_advanced_filters(deduplicated, filters)
-                logger.info(
-                    f"[LiteratureAggregator] Filtering applied: "
-                    f"{len(deduplicated)} → {len(filtered)} papers "
-                    f"(filters: {self._format_filter_summary(filters)})"
-                )
+            cached = self.cache.get(page_key, "search")
+            next_cursors = self.cache.get(f"{page_key}|cursors", "search")
+            missing = []
+            if cached and next_cursors is not None:
+                deduplicated = [LiteratureItem(**paper) for paper in cached]
             else:
-                filtered = deduplicated
-            
-            # Apply sorting
-            sorted_papers = self._apply_sorting(filtered, filters)
-            sort_by = filters.get('sort_by', 'citations') if filters else 'citations'
-            logger.info(f"[LiteratureAggregator] Sorted by: {sort_by}")
-            
-            # Limit final results
-            max_results = limit_per_source * 3
-            final_results = sorted_papers[:max_results]
-            
-            logger.info(
-                f"[LiteratureAggregator] Final results: {len(final_results)} papers "
-                f"(aggregated: {len(all_papers)}, unique: {len(deduplicated)}, "
-                f"filtered: {len(filtered)})"
+                all_papers, missing, next_cursors = await self._gather_sources(
+                    keyword, limit_per_source, source, deadline_ms, cursors
+                )
+                deduplicated = self._deduplicate_papers(all_papers)
+                if deduplicated and not missing:
+                    self.cache.set(page_key, [paper.dict() for paper in deduplicated], "search")
+                    self.cache.set(f"{page_key}|cursors", next_cursors, "search")
+            if missing:
+                logger.warning(
+                    f"[LiteratureAggregator] Partial results for '{keyword}' - "
+                    f"missing {', '.join(missing)} (latency ms: {self.latency.snapshot()})"
+                )
+            return (
+                self._finalize(deduplicated, filters, limit_per_source),
+                missing,
+                self._encode_page_token(cache_key, next_cursors),
             )
-            
-            return final_results
-            
+
         except Exception as e:
             logger.error(
                 f"[LiteratureAggregator] Aggregation failed for keyword '{keyword}' - "
-                f"error: {str(e)}", 
+                f"error: {str(e)}",
                 exc_info=True
             )
-            return []
-    
+            return [], [], None
+
+    def next_page_token(self, keyword: str, limit_per_source: int, source: str) -> Optional[str]:
+        """
+        Token for the page after the cached first page of a search (None if unknown or last)
+
+        Cached cursors can outlive CrossRef's ~5 minute cursor lifetime; the
+        CrossRef cursor carries its result offset, so CrossRefService resumes
+        a rejected cursor with offset= instead of dropping out.
+        """
+        cache_key = self._search_cache_key(keyword, limit_per_source, source)
+        return self._encode_page_token(cache_key, self.cache.get(f"{cache_key}|cursors", "search"))
+
+    @staticmethod
+    def _encode_page_token(cache_key: str, cursors: Optional[Dict[str, Optional[str]]]) -> Optional[str]:
+        """Opaque token carrying each remaining source's upstream cursor"""
+        if not cursors:
+            return None
+        payload = json.dumps({"k": cache_key, "c": cursors}, sort_keys=True, separators=(",", ":"))
+        return base64.urlsafe_b64encode(zlib.compress(payload.encode())).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_page_token(page_token: str, cache_key: str) -> Dict[str, Optional[str]]:
+        try:
+            padded = page_token + "=" * (-len(page_token) % 4)
+            payload = json.loads(zlib.decompress(base64.urlsafe_b64decode(padded)))
+            key, cursors = payload["k"], payload["c"]
+        except (ValueError, KeyError, TypeError, zlib.error) as e:
+            raise ValueError(f"Malformed page_token: {e}")
+        if key != cache_key or not isinstance(cursors, dict):
+            raise ValueError("page_token belongs to a different search (keyword, limit or source changed)")
+        return cursors
+
+    async def _fetch_merged(
+        self,
+        keyword: str,
+        limit_per_source: int,
+        source: str
+    ) -> Union[List[dict], Uncached, None]:
+        """
+        Query the selected sources concurrently and return the merged,
+        deduplicated (pre-filter) result set as plain dicts for caching.
+
+        Returns None when no source produced results, and the results wrapped
+        in Uncached when a source failed, so neither a miss nor a partial set
+        is cached (the next search retries the failed source).
+        """
+        all_papers, missing, cursors = await self._gather_sources(keyword, limit_per_source, source)
+        
+        if not all_papers:
+            logger.warning(
+                f"[LiteratureAggregator] No papers found for keyword '{keyword}'"
+            )
+            return None
+        
+        # Deduplicate by DOI and title
+        deduplicated = self._deduplicate_papers(all_papers)
+        logger.info(
+            f"[LiteratureAggregator] Deduplication: "
+            f"{len(all_papers)} → {len(deduplicated)} unique papers"
+        )
+        if missing:
+            logger.warning(
+                f"[LiteratureAggregator] Partial results for '{keyword}' - "
+                f"missing {', '.join(missing)}, not cached"
+            )
+            return Uncached([paper.dict() for paper in deduplicated])
+        # Where each source stopped, for next_page_token()
+        cache_key = self._search_cache_key(keyword, limit_per_source, source)
+        self.cache.set(f"{cache_key}|cursors", cursors, "search")
+        return [paper.dict() for paper in deduplicated]
+
+    async def stream_all_sources(
+        self,
+        keyword: str,
+        limit_per_source: int = 10,
+        filters: Optional[dict] = None,
+        source: str = "all"
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Progressive variant of search_all_sources
+        
+        Sources are awaited with asyncio.as_completed, so each one's batch is
+        yielded as soon as it arrives instead of waiting for the slowest
+        provider. A cached merged result set is yielded directly as the final frame;
+        a fresh one is cached only when every source answered.
+        
+        Args:
+            Same as search_all_sources
+            
+        Yields:
+            ("source", {"source", "results", "elapsed_ms"}) - one source's deduplicated,
+                filtered and sorted batch (empty results when it failed, plus "error")
+            ("final", {"results", "unique", "next_page_token"}) - the merged result set
+                across all sources, deduplicated, filtered, sorted and limited like
+                search_all_sources
+        """
+        cache_key = self._search_cache_key(keyword, limit_per_source, source)
+        cached = self.cache.get(cache_key, "search")
+        if cached:
+            deduplicated = [LiteratureItem(**paper) for paper in cached]
+            yield "final", {
+                "results": self._finalize(deduplicated, filters, limit_per_source),
+                "unique": len(deduplicated),
+                "next_page_token": self.next_page_token(keyword, limit_per_source, source),
+            }
+            return
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        all_papers = []
+        cursors = {}
+        failed = []
+        pending = [
+            self._timed_search(name, svc, keyword, limit_per_source)
+            for name, svc in self._selected_services(source).items()
+        ]
+        for next_done in asyncio.as_completed(pending):
+            name, papers, next_cursor, error = await next_done
+            elapsed_ms = int((loop.time() - started) * 1000)
+            frame = {"source": name, "elapsed_ms": elapsed_ms}
+            if error is not None:
+                logger.warning(f"[LiteratureAggregator] {name} search failed - error: {str(error)}")
+                frame["error"] = str(error)
+                failed.append(name)
+            else:
+                logger.info(f"[LiteratureAggregator] {name} returned {len(papers)} papers in {elapsed_ms}ms")
+                if next_cursor:
+                    cursors[name] = next_cursor
+            all_papers.extend(papers)
+            frame["results"] = self._finalize(self._deduplicate_papers(papers), filters, limit_per_source)
+            yield "source", frame
+
+        deduplicated = self._deduplicate_papers(all_papers)
+        if deduplicated and not failed:
+            self.cache.set(cache_key, [paper.dict() for paper in deduplicated], "search")
+            self.cache.set(f"{cache_key}|cursors", cursors, "search")
+        elif failed:
+            logger.warning(
+                f"[LiteratureAggregator] Partial results for '{keyword}' - "
+                f"missing {', '.join(failed)}, not cached"
+            )
+        yield "final", {
+            "results": self._finalize(deduplicated, filters, limit_per_source),
+            "unique": len(deduplicated),
+            "next_page_token": self._encode_page_token(cache_key, cursors),
+        }
+
+    async def _gather_sources(
+        self,
+        keyword: str,
+        limit_per_source: int,
+        source: str,
+        deadline_ms: Optional[int] = None,
+        cursors: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[List[LiteratureItem], List[str], Dict[str, Optional[str]]]:
+        """
+        Query the selected sources concurrently on the shared async HTTP client
+
+        Args:
+            cursors: Upstream cursor per source to continue from (None = first page);
+                sources missing from the dict are exhausted and not queried
+
+        Returns:
+            (all papers in source order, sources skipped, cancelled at the deadline or
+             failed, next cursor per source that has more results). Missing sources
+            keep their current cursor, so the next page retries them.
+        """
+        services = self._selected_services(source)
+        if cursors is not None:
+            services = {name: svc for name, svc in services.items() if name in cursors}
+        cursors = cursors or {}
+        skipped = []
+        if deadline_ms:
+            skipped = [name for name in services if not self.latency.should_try(name, deadline_ms)]
+            if len(skipped) == len(services):
+                skipped = []  # Every source is slow: try them all rather than return nothing
+            for name in skipped:
+                logger.info(
+                    f"[LiteratureAggregator] Skipping {name} - expected "
+                    f"{int(self.latency.expected_ms(name))}ms exceeds {deadline_ms}ms budget"
+                )
+
+        tasks = {
+            name: asyncio.ensure_future(
+                self._timed_search(name, svc, keyword, limit_per_source, cursors.get(name))
+            )
+            for name, svc in services.items() if name not in skipped
+        }
+        _, pending = await asyncio.wait(
+            tasks.values(), timeout=deadline_ms / 1000 if deadline_ms else None
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Collect valid results and log errors
+        all_papers = []
+        missing = list(skipped)
+        next_cursors = {name: cursors.get(name) for name in skipped}
+        for name, task in tasks.items():
+            if task in pending:
+                logger.warning(f"[LiteratureAggregator] {name} cancelled at the {deadline_ms}ms deadline")
+                missing.append(name)
+                next_cursors[name] = cursors.get(name)
+                continue
+            _, result, next_cursor, error = task.result()
+            if error is not None:
+                logger.warning(
+                    f"[LiteratureAggregator] {name} search failed - "
+                    f"error: {str(error)}"
+                )
+                missing.append(name)
+                next_cursors[name] = cursors.get(name)
+                continue
+            
+            if next_cursor:
+                next_cursors[name] = next_cursor
+            if result:
+                logger.info(
+                    f"[LiteratureAggregator] {name} returned "
+                    f"{len(result)} papers"
+                )
+                all_papers.extend(result)
+            else:
+                logger.warning(f"[LiteratureAggregator] {name} returned empty results")
+        return all_papers, missing, next_cursors
+
+    async def _timed_search(
+        self, name: str, svc, keyword: str, limit_per_source: int, cursor: Optional[str] = None
+    ):
+        """
+        Fetch one page from one source and record its latency
+
+        Returns:
+            (name, papers, next cursor, error); failures are returned rather than raised
+        """
+        self.latency.started(name)
+        started = time.monotonic()
+        try:
+            papers, next_cursor = await svc.search_page_async(keyword, limit_per_source, cursor)
+            result = name, papers, next_cursor, None
+        except asyncio.CancelledError:
+            self.latency.record(name, (time.monotonic() - started) * 1000, timed_out=True)
+            raise
+        except Exception as e:
+            result = name, [], None, e
+        self.latency.record(name, (time.monotonic() - started) * 1000)
+        return result
+
+    def _selected_services(self, source: str) -> dict:
+        """Services to query: all of them, or the single one named by `source`"""
+        services = {
+            "CrossRef": self.crossref,
+            "ArXiv": self.arxiv,
+            "OpenAlex": self.openalex,
+        }
+        if source != "all":
+            services = {name: svc for name, svc in services.items() if name.lower() == source}
+        return services
+
+    def _finalize(
+        self,
+        deduplicated: List[LiteratureItem],
+        filters: Optional[dict],
+        limit_per_source: int
+    ) -> List[LiteratureItem]:
+        """Filter, sort and limit a deduplicated result set"""
+        # Apply advanced filters
+        if filters:
+            filtered = self._apply_advanced_filters(deduplicated, filters)
+            logger.info(
+                f"[LiteratureAggregator] Filtering applied: "
+                f"{len(deduplicated)} → {len(filtered)} papers "
+                f"(filters: {self._format_filter_summary(filters)})"
+            )
+        else:
+            filtered = deduplicated
+        
+        # Apply sorting
+        sorted_papers = self._apply_sorting(filtered, filters)
+        sort_by = filters.get('sort_by', 'citations') if filters else 'citations'
+        logger.info(f"[LiteratureAggregator] Sorted by: {sort_by}")
+        
+        # Limit final results
+        max_results = limit_per_source * 3
+        final_results = sorted_papers[:max_results]
+        
+        logger.info(
+            f"[LiteratureAggregator] Final results: {len(final_results)} papers "
+            f"(unique: {len(deduplicated)}, filtered: {len(filtered)})"
+        )
+        return final_results
+
+    @staticmethod
+    def _search_cache_key(keyword: str, limit_per_source: int, source: str) -> str:
+        """Cache key for a merged result set: normalized keyword, limit and source"""
+        normalized = re.sub(r'\s+', ' ', keyword.strip().lower())
+        return f"{source}|{limit_per_source}|{normalized}"
+
     def _deduplicate_papers(
         self, 
         papers: List[LiteratureItem]
     ) -> List[LiteratureItem]:
         """
-        Remove duplicate papers based on DOI and title similarity
+        Collapse records describing the same work into one merged record
         
-        1. First pass: deduplicate by DOI (exact match)
-        2. Second pass: deduplicate by normalized title
+        Duplicates are exact DOI / normalized-title matches plus near-duplicate
+        titles (preprint vs. published, added subtitle, punctuation) found with
+        MinHash + LSH over title shingles, blocked by first-author surname and
+        publication year (see services/dedup_service.py).
         
         Args:
             papers: List of papers potentially containing duplicates
             
         Returns:
-            List of unique papers
+            List of unique papers, in order of first appearance
         """
-        seen_dois: Set[str] = set()
-        seen_titles: Set[str] = set()
-        unique_papers = []
-        
-        duplicates_by_doi = 0
-        duplicates_by_title = 0
-        
-        for paper in papers:
-            # Check DOI uniqueness
-            if paper.doi:
-                if paper.doi in seen_dois:
-                    duplicates_by_doi += 1
-                    continue
-                seen_dois.add(paper.doi)
-            
-            # Check title uniqueness (normalized)
-            normalized_title = self._normalize_title(paper.title)
-            if normalized_title in seen_titles:
-                duplicates_by_title += 1
-                continue
-            seen_titles.add(normalized_title)
-            
-            unique_papers.append(paper)
+        clusters = find_duplicate_clusters(
+            [paper.title for paper in papers],
+            [surname(paper.authors[0].name) if paper.authors else "" for paper in papers],
+            [self._extract_year(paper.published_date) for paper in papers],
+            [paper.doi for paper in papers],
+        )
+        unique_papers = [self._merge_duplicates([papers[i] for i in cluster]) for cluster in clusters]
         
-        if duplicates_by_doi > 0 or duplicates_by_title > 0:
+        if len(unique_papers) < len(papers):
             logger.debug(
-                f"[LiteratureAggregator] Removed duplicates: "
-                f"{duplicates_by_doi} by DOI, {duplicates_by_title} by title"
+                f"[LiteratureAggregator] Merged {len(papers) - len(unique_papers)} duplicates "
+                f"into {sum(1 for c in clusters if len(c) > 1)} records"
             )
         
         return unique_papers
 
+    @staticmethod
+    def _merge_duplicates(group: List[LiteratureItem]) -> LiteratureItem:
+        """
+        Merge one group of duplicate records field by field
+        
+        Each field takes the first non-empty value across all records, visiting
+        sources in FIELD_PRECEDENCE order (then any other source) and every
+        record of a source in turn; a registered DOI wins over an arXiv DOI,
+        and `provenance` records which source supplied each field.
+        
+        Args:
+            group: Records describing the same work
+            
+        Returns:
+            Canonical record
+        """
+        by_source: Dict[str, List[dict]] = {}
+        for paper in group:
+            by_source.setdefault(paper.source or "unknown", []).append(paper.dict())
+        sources = list(by_source)
+        
+        merged = {"sources": sources, "provenance": {}}
+        for field in LiteratureItem.__fields__:
+            if field in ("source", "sources", "provenance"):
+                continue
+            order = [src for src in FIELD_PRECEDENCE.get(field, ()) if src in by_source]
+            order += [src for src in sources if src not in order]
+            # Every record of a source is a candidate (a source can return the same work twice)
+            candidates = [(src, record.get(field)) for src in order for record in by_source[src]]
+            candidates = [(src, value) for src, value in candidates if value not in (None, "", [])]
+            if field == "doi":
+                # arXiv DOIs (10.48550/arXiv...) only when no registered DOI exists
+                candidates.sort(key=lambda c: "arxiv" in c[1].lower())
+            if candidates:
+                src, value = candidates[0]
+                merged[field] = value
+                merged["provenance"][field] = src
+        
+        merged["source"] = merged["provenance"].get("title", sources[0])
+        return LiteratureItem(**merged)
+
     def _apply_advanced_filters(
         self,
         papers: List[LiteratureItem],
@@ -360,28 +772,6 @@ class LiteratureAggregator:
             )
             return papers
     
-    @staticmethod
-    def _normalize_title(title: str) -> str:
-        """
-        Normalize title for comparison
-        
-        Removes punctuation, converts to lowercase, and normalizes whitespace
-        
-        Args:
-            title: Original title string
-            
-        Returns:
-            Normalized title string
-        """
-        if not title:
-            return ""
-        
-        # Remove special characters (keep only alphanumeric and spaces)
-        normalized = re.sub(r'[^\w\s]', '', title.lower())
-        # Collapse multiple spaces into single space
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
-    
     @staticmethod
     def _extract_year(date_str: Optional[str]) -> int:
         """
@@ -1,11 +1,50 @@
 # backend/services/openalex_graph_service.py
-import requests
+import os
 import re
+import math
+import time
+import asyncio
 from datetime import datetime
-from collections import defaultdict
 import urllib.parse
+import httpx
+from services.http_client import get_async_client
 
 BASE = "https://api.openalex.org"
+# Entity IDs in OpenAlex responses look like https://openalex.org/A1969205039
+ENTITY_BASE = "https://openalex.org"
+
+# OpenAlex accepts up to 50 OR'ed values in one filter
+BATCH_SIZE = 50
+# Fields needed to render a graph node
+NODE_FIELDS = "id,doi,display_name,cited_by_count"
+# Node fields plus what is needed to expand the work one more hop
+EXPAND_FIELDS = NODE_FIELDS + ",referenced_works"
+
+# Multi-hop expansion limits
+MAX_GRAPH_DEPTH = 3
+REFS_PER_NODE = 25       # references followed per work
+CITER_BATCH_SIZE = 10    # works per batched cites: query (results are shared between them)
+CITERS_PER_BATCH = 200   # top-cited citing works returned per batched query
+
+# Author networks page through every work of the author
+PAGE_SIZE = 200                 # OpenAlex maximum per_page
+PAGE_NUMBER_LIMIT = 10000       # beyond this OpenAlex only supports cursor paging
+PAGE_CONCURRENCY = 5            # /works requests in flight per service (paged queries and frontier batches)
+# 429 / 5xx / transport errors are retried with exponential backoff (or Retry-After)
+PAGE_RETRIES = 3
+PAGE_RETRY_BACKOFF = 1.0        # seconds before the first retry, doubled each time
+AUTHOR_WORK_FIELDS = "id,authorships"
+# Cached per-author aggregates are refreshed incrementally after this many seconds
+AUTHOR_REFRESH_AFTER = int(os.getenv("AUTHOR_REFRESH_AFTER", "43200"))
+# from_updated_date is an OpenAlex Premium filter; incremental refresh needs a key
+OPENALEX_API_KEY = os.getenv("OPENALEX_API_KEY")
+
+def normalize_doi(doi):
+    """'https://doi.org/10.1/X' -> '10.1/x' (None stays None)"""
+    if not doi:
+        return None
+    return doi.strip().lower().replace("https://doi.org/", "").replace("http://doi.org/", "")
+
 
 def clean_html_tags(text: str) -> str:
     """
@@ -17,115 +56,503 @@ def clean_html_tags(text: str) -> str:
     return re.sub(r'<[^>]*>', '', text)
 
 
+def _graph_node(oid, label, ntype, work_doi=None):
+    """Citation graph node for an OpenAlex work (label cleaned of HTML tags)."""
+    return {
+        "id": oid, "label": clean_html_tags(label or "Untitled")[:120], "type": ntype,
+        "openalex_id": oid, "doi": normalize_doi(work_doi)
+    }
+
+
 class OpenAlexGraphService:
 
+    def __init__(self, cache=None):
+        # Optional CacheService holding per-work neighbourhoods for multi-hop expansion
+        self.cache = cache
+        # /works request limiter, created per event loop (see _request_slots)
+        self._slots = None
+        self._slots_loop = None
+
+    def _request_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(PAGE_CONCURRENCY)
+            self._slots_loop = loop
+        return self._slots
 
-    def _work_by_doi(self, doi: str):
+    async def _work_by_doi(self, doi: str):
         # Normalize + encode DOI
         doi = doi.strip().lower().replace("https://doi.org/", "")
         encoded = urllib.parse.quote(f"https://doi.org/{doi}", safe="")
         url = f"{BASE}/works/{encoded}"
-        r = requests.get(url, timeout=15)
+        r = await get_async_client().get(url, timeout=15)
         if r.status_code != 200:
             print(f"[OpenAlexGraphService] Failed DOI lookup: {url} -> {r.status_code}")
             return None
         return r.json()
 
-    def _works(self, params: dict):
-        r = requests.get(f"{BASE}/works", params=params, timeout=20)
-        r.raise_for_status()
-        return r.json().get("results", [])
+    async def _works(self, params: dict):
+        return (await self._works_page(params)).get("results", [])
+
+    async def _works_batches(self, queries):
+        """
+        Run several /works queries concurrently (bounded and retried by _works_page).
+        The first failure cancels the remaining queries and is raised.
+        """
+        tasks = [asyncio.create_task(self._works(params)) for params in queries]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _works_by_ids(self, ids, select: str = NODE_FIELDS):
+        """
+        Resolve many works in batched, concurrent requests using
+        filter=openalex:W1|W2|... with a field projection.
+        Returns the works in the order of `ids` (unresolved IDs are skipped);
+        raises if a batch still fails after retries.
+        """
+        short_ids = list(dict.fromkeys(i.rsplit("/", 1)[-1] for i in ids if i))
+        if not short_ids:
+            return []
+        batches = [short_ids[i:i + BATCH_SIZE] for i in range(0, len(short_ids), BATCH_SIZE)]
+        results = await self._works_batches(
+            {"filter": f"openalex:{'|'.join(batch)}", "per_page": len(batch), "select": select}
+            for batch in batches
+        )
+        by_id = {}
+        for batch_result in results:
+            for w in batch_result:
+                by_id[w["id"].rsplit("/", 1)[-1]] = w
+        return [by_id[i] for i in short_ids if i in by_id]
+
+    async def works_by_dois(self, dois, select: str = NODE_FIELDS):
+        """
+        Resolve many DOIs in batched, concurrent requests using filter=doi:A|B|...
+        Returns a dict of normalized DOI -> work.
+        """
+        unique = list(dict.fromkeys(normalize_doi(d) for d in dois if d))
+        batches = [unique[i:i + BATCH_SIZE] for i in range(0, len(unique), BATCH_SIZE)]
+        results = await asyncio.gather(
+            *[
+                self._works({"filter": f"doi:{'|'.join(batch)}", "per_page": len(batch), "select": select})
+                for batch in batches
+            ],
+            return_exceptions=True
+        )
+        by_doi = {}
+        for batch_result in results:
+            if isinstance(batch_result, Exception):
+                print(f"[OpenAlexGraphService] DOI batch lookup failed: {batch_result}")
+                continue
+            for w in batch_result:
+                if w.get("doi"):
+                    by_doi[normalize_doi(w["doi"])] = w
+        return by_doi
+
+    async def _citers_of(self, ids):
+        """
+        Top-cited works citing any of `ids`, via batched filter=cites:W1|W2|...
+        Citing works carry referenced_works so callers can tell which ID they cite.
+        Raises if a batch still fails after retries.
+        """
+        short_ids = list(dict.fromkeys(i.rsplit("/", 1)[-1] for i in ids if i))
+        batches = [short_ids[i:i + CITER_BATCH_SIZE] for i in range(0, len(short_ids), CITER_BATCH_SIZE)]
+        results = await self._works_batches(
+            {
+                "filter": f"cites:{'|'.join(batch)}",
+                "sort": "cited_by_count:desc",
+                "per_page": CITERS_PER_BATCH,
+                "select": EXPAND_FIELDS,
+            }
+            for batch in batches
+        )
+        citers = {}
+        for batch_result in results:
+            for w in batch_result:
+                citers.setdefault(w["id"], w)
+        return list(citers.values())
+
+    async def _expand_frontier(self, frontier: dict):
+        """
+        Neighbourhoods for one BFS level.
 
-    def _authors_works(self, author_id: str, per_page=25):
-        # author_id like A1969205039
-        params = {"filter": f"authorships.author.id:{BASE}/authors/{author_id}", "per_page": per_page}
-        return self._works(params)
+        Args:
+            frontier: work ID -> work (with referenced_works)
+
+        Returns:
+            work ID -> {"references": [works], "citers": [works]}
+
+        Neighbourhoods are cached per work ("citation_node" namespace), so
+        overlapping expansions share them. Cache misses are resolved together:
+        one batched reference lookup and one batched citer query for the level.
+        If any batch fails (after retries) the error is raised and nothing is
+        cached, so an incomplete neighbourhood is never served as complete.
+        """
+        expansions = {}
+        missing = []
+        for wid in frontier:
+            cached = self.cache.get(wid, "citation_node") if self.cache is not None else None
+            if cached is not None:
+                expansions[wid] = cached
+            else:
+                missing.append(wid)
+        if not missing:
+            return expansions
+
+        ref_ids = {wid: (frontier[wid].get("referenced_works") or [])[:REFS_PER_NODE] for wid in missing}
+        references, citers = await asyncio.gather(
+            self._works_by_ids([r for refs in ref_ids.values() for r in refs], select=EXPAND_FIELDS),
+            self._citers_of(missing),
+        )
+
+        by_id = {w["id"]: w for w in references}
+        for wid in missing:
+            expansions[wid] = {"references": [by_id[r] for r in ref_ids[wid] if r in by_id], "citers": []}
+        missing_set = set(missing)
+        for cw in citers:
+            for ref in cw.get("referenced_works") or []:
+                if ref in missing_set:
+                    expansions[ref]["citers"].append(cw)
+
+        if self.cache is not None:
+            for wid in missing:
+                self.cache.set(wid, expansions[wid], namespace="citation_node")
+        print(f"[OpenAlexGraphService] Expanded {len(frontier)} works ({len(missing)} uncached)")
+        return expansions
+
+    async def _works_page(self, params: dict):
+        """One raw /works response (results + meta), retrying rate limits and server errors."""
+        if OPENALEX_API_KEY:
+            params = {**params, "api_key": OPENALEX_API_KEY}
+        for attempt in range(PAGE_RETRIES + 1):
+            delay = PAGE_RETRY_BACKOFF * 2 ** attempt
+            try:
+                async with self._request_slots():
+                    r = await get_async_client().get(f"{BASE}/works", params=params, timeout=30)
+            except httpx.TransportError:
+                if attempt == PAGE_RETRIES:
+                    raise
+            else:
+                if (r.status_code != 429 and r.status_code < 500) or attempt == PAGE_RETRIES:
+                    r.raise_for_status()
+                    return r.json()
+                retry_after = r.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+            print(f"[OpenAlexGraphService] /works attempt {attempt + 1} failed, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _iter_work_pages(self, params: dict):
+        """
+        Yield every page of results for a /works query as it arrives.
+
+        The first page reports the total count. Up to PAGE_NUMBER_LIMIT results
+        the remaining pages are requested concurrently (page=N, bounded by the
+        service-wide PAGE_CONCURRENCY limit) and yielded in completion order; larger
+        result sets are walked with cursor paging, requesting the next page
+        before the current one is yielded.
+        """
+        first = await self._works_page({**params, "per_page": PAGE_SIZE, "page": 1})
+        count = first.get("meta", {}).get("count", 0)
+
+        if count <= PAGE_NUMBER_LIMIT:
+            yield first.get("results", [])
+            tasks = [
+                asyncio.create_task(self._works_page({**params, "per_page": PAGE_SIZE, "page": page}))
+                for page in range(2, math.ceil(count / PAGE_SIZE) + 1)
+            ]
+            try:
+                for next_page in asyncio.as_completed(tasks):
+                    yield (await next_page).get("results", [])
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return
+
+        # Too many results for page numbers: restart with a cursor (sequential by design)
+        print(f"[OpenAlexGraphService] {count} works, switching to cursor paging")
+        pending = asyncio.create_task(self._works_page({**params, "per_page": PAGE_SIZE, "cursor": "*"}))
+        try:
+            while pending:
+                page = await pending
+                cursor = page.get("meta", {}).get("next_cursor")
+                results = page.get("results", [])
+                pending = None
+                if cursor and results:
+                    pending = asyncio.create_task(
+                        self._works_page({**params, "per_page": PAGE_SIZE, "cursor": cursor})
+                    )
+                yield results
+        finally:
+            if pending:
+                pending.cancel()
 
     # ---------- Citation Graph ----------
-    def build_citation_graph(self, doi: str, max_nodes: int = 60):
-        center = self._work_by_doi(doi)
+    async def build_citation_graph(self, doi: str, max_nodes: int = 60):
+        """
+        The depth-1 citation graph of a DOI (see stream_citation_graph).
+
+        Raises:
+            httpx.HTTPError: A reference batch or the citing query failed after
+                retries; a partial graph is never returned
+        """
+        nodes = {}
+        edges = []
+        async for _, piece in self.stream_citation_graph(doi, max_nodes):
+            for node in piece["nodes"]:
+                nodes.setdefault(node["id"], node)
+            edges.extend(piece["edges"])
+        return {"nodes": list(nodes.values()), "edges": edges}
+
+    async def stream_citation_graph(self, doi: str, max_nodes: int = 60):
+        """
+        The depth-1 citation graph in pieces, yielded as each upstream call completes.
+
+        Yields:
+            ("center", piece) first, then ("references", piece) per batched
+            reference lookup and ("citing", piece), in completion order. Each
+            piece is {"nodes": [...], "edges": [...]} holding only nodes not
+            yielded before. Nothing is yielded if the DOI is unknown.
+
+        Raises:
+            httpx.HTTPError: An upstream call failed after retries (pieces
+                yielded before it are then an incomplete graph)
+        """
+        center = await self._work_by_doi(doi)
         if not center:
-            return {"nodes": [], "edges": []}
+            return
 
         center_id = center["id"]
-        center_title = clean_html_tags(center.get("display_name", "Unknown"))
-        center_doi = center.get("doi") or doi
+        seen = {center_id}
+
+        def new_nodes(works, ntype):
+            nodes = []
+            for w in works:
+                if w["id"] not in seen:
+                    seen.add(w["id"])
+                    nodes.append(_graph_node(w["id"], w.get("display_name"), ntype, w.get("doi")))
+            return nodes
+
+        yield "center", {
+            "nodes": [_graph_node(center_id, center.get("display_name", "Unknown"), "center", center.get("doi") or doi)],
+            "edges": [],
+        }
+
+        async def tagged(kind, coro):
+            return kind, await coro
+
+        # Reference batches and citing works are requested concurrently
+        ref_ids = (center.get("referenced_works") or [])[: max_nodes // 2]
+        params = {"filter": f"cites:{center_id}", "per_page": min(max_nodes // 2, 25), "select": NODE_FIELDS}
+        tasks = [
+            asyncio.create_task(tagged("references", self._works_by_ids(ref_ids[i:i + BATCH_SIZE])))
+            for i in range(0, len(ref_ids), BATCH_SIZE)
+        ]
+        tasks.append(asyncio.create_task(tagged("citing", self._works(params))))
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                kind, works = await next_done
+                if kind == "references":
+                    # references: center -> reference
+                    edges = [{"source": center_id, "target": w["id"], "type": "cites"} for w in works]
+                    yield kind, {"nodes": new_nodes(works, "reference"), "edges": edges}
+                else:
+                    # cited_by: citing -> center
+                    edges = [{"source": w["id"], "target": center_id, "type": "cited_by"} for w in works]
+                    yield kind, {"nodes": new_nodes(works, "cited_by"), "edges": edges}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def expand_citation_graph(self, doi: str, max_nodes: int = 60, depth: int = 2):
+        """
+        Multi-hop citation graph: breadth-first over references and citing works.
+
+        Each level is expanded with batched lookups for the whole frontier
+        (see _expand_frontier). New works found at a level are ranked by
+        cited_by_count and the most cited are kept; the kept works form the
+        next frontier. The max_nodes budget is split evenly over the levels
+        still to expand (a level may use what earlier levels left over), so
+        the first hop cannot use up the whole budget on its own.
+
+        Args:
+            doi: DOI of the center work
+            max_nodes: Total node budget (including the center)
+            depth: Number of hops (clamped to 1..MAX_GRAPH_DEPTH)
+
+        Returns:
+            {"nodes": [...], "edges": [...]}; nodes carry their hop distance
+
+        Raises:
+            httpx.HTTPError: A frontier lookup failed after retries
+        """
+        depth = max(1, min(depth, MAX_GRAPH_DEPTH))
+        center = await self._work_by_doi(doi)
+        if not center:
+            return {"nodes": [], "edges": []}
 
         nodes = {}
-        edges = []
+        edges = {}
 
-        def add_node(oid, label, ntype):
-            if oid not in nodes:
-                # Clean HTML tags from label
-                clean_label = clean_html_tags(label or "Untitled")
-                nodes[oid] = {"id": oid, "label": clean_label[:120], "type": ntype}
+        def add_node(work, ntype, hop):
+            nodes[work["id"]] = {
+                "id": work["id"],
+                "label": clean_html_tags(work.get("display_name") or "Untitled")[:120],
+                "type": ntype,
+                "openalex_id": work["id"],
+                "doi": normalize_doi(work.get("doi")),
+                "cited_by_count": work.get("cited_by_count") or 0,
+                "hop": hop,
+            }
 
-        # center node
-        add_node(center_id, center_title, "center")
+        add_node(center, "center", 0)
+        frontier = {center["id"]: center}
 
-        # references: center -> reference
-        for ref in (center.get("referenced_works") or [])[: max_nodes // 2]:
-            ref_url = f"{BASE}/works/{ref}"
-            r = requests.get(ref_url, timeout=15)
-            if r.status_code != 200: 
-                continue
-            refw = r.json()
-            add_node(refw["id"], refw.get("display_name"), "reference")
-            edges.append({"source": center_id, "target": refw["id"], "type": "cites"})
+        for hop in range(1, depth + 1):
+            if not frontier or len(nodes) >= max_nodes:
+                break
+            expansions = await self._expand_frontier(frontier)
 
-        # cited_by: citing -> center
-        params = {"filter": f"cites:{center_id}", "per_page": min(max_nodes // 2, 25)}
-        citing = self._works(params)
-        for cw in citing:
-            add_node(cw["id"], cw.get("display_name"), "cited_by")
-            edges.append({"source": cw["id"], "target": center_id, "type": "cited_by"})
+            candidates = {}
+            links = []
+            for wid, neighbourhood in expansions.items():
+                for ref in neighbourhood["references"]:
+                    candidates.setdefault(ref["id"], (ref, "reference"))
+                    links.append((wid, ref["id"], "cites"))
+                for cw in neighbourhood["citers"]:
+                    candidates.setdefault(cw["id"], (cw, "cited_by"))
+                    links.append((cw["id"], wid, "cited_by"))
 
-        return {"nodes": list(nodes.values()), "edges": edges}
+            # Spend this level's share of the remaining budget on the most cited new works
+            share = max(1, (max_nodes - len(nodes)) // (depth - hop + 1))
+            new = [c for wid, c in candidates.items() if wid not in nodes]
+            new.sort(key=lambda c: c[0].get("cited_by_count") or 0, reverse=True)
+            kept = new[:share]
+            for work, ntype in kept:
+                add_node(work, ntype, hop)
+
+            for src, tgt, etype in links:
+                if src in nodes and tgt in nodes and (src, tgt) not in edges:
+                    edges[(src, tgt)] = {"source": src, "target": tgt, "type": etype}
+
+            frontier = {work["id"]: work for work, _ in kept}
+
+        return {"nodes": list(nodes.values()), "edges": list(edges.values())}
 
     # ---------- Author Network ----------
-    def build_author_network(self, author_id: str, limit: int = 50):
-        results = self._authors_works(author_id, per_page=limit)
-        co_map = defaultdict(int)
-        names = {}
-
-        center = f"{BASE}/authors/{author_id}"
-        names[center] = None  # will fill from one of the works if possible
-
-        for w in results:
-            for a in w.get("authorships", []):
-                aid = a.get("author", {}).get("id")
-                aname = clean_html_tags(a.get("author", {}).get("display_name", ""))
-                if not aid:
-                    continue
-                names[aid] = aname or names.get(aid)
-            # count co-auth occurrences
-            ids = [a.get("author", {}).get("id") for a in w.get("authorships", []) if a.get("author", {}).get("id")]
-            for aid in ids:
-                if aid != center:
-                    co_map[aid] += 1
+    async def build_author_network(self, author_id: str, limit: int = 50):
+        """
+        Co-author network over all of an author's works.
+
+        Args:
+            author_id: OpenAlex author ID, e.g. A1969205039
+            limit: Maximum number of co-authors (the most frequent ones are kept)
+        """
+        state = await self.author_coauthors(author_id)
+        center = f"{ENTITY_BASE}/{author_id}"
+        names = state["names"]
 
+        top = sorted(state["counts"].items(), key=lambda item: item[1], reverse=True)[:limit]
         nodes = [{"id": center, "label": names.get(center) or "Author", "type": "center"}]
         edges = []
-        for aid, cnt in co_map.items():
+        for aid, cnt in top:
             nodes.append({"id": aid, "label": names.get(aid) or aid.split("/")[-1], "type": "coauthor", "weight": cnt})
             edges.append({"source": center, "target": aid, "type": "coauthor", "weight": cnt})
 
-        return {"nodes": nodes, "edges": edges}
+        return {"nodes": nodes, "edges": edges, "work_count": len(state["works"])}
+
+    async def author_coauthors(self, author_id: str):
+        """
+        Per-author co-authorship aggregate, cached ("author_works" namespace).
+
+        Returns:
+            {"works": {work_id: [coauthor ids]}, "counts": {coauthor id: shared works},
+             "names": {author id: name}, "updated": "YYYY-MM-DD", "fetched_at": epoch}
+
+        A cached aggregate older than AUTHOR_REFRESH_AFTER is refreshed with only
+        the works updated since its last fetch (from_updated_date) when an
+        OpenAlex API key is configured; otherwise it is rebuilt from scratch.
+        """
+        state = self.cache.get(author_id, "author_works") if self.cache is not None else None
+        if state and time.time() - state["fetched_at"] < AUTHOR_REFRESH_AFTER:
+            return state
+
+        started = datetime.utcnow()
+        author_filter = f"authorships.author.id:{author_id}"
+        refreshed = False
+        if state and OPENALEX_API_KEY:
+            try:
+                changed = await self._aggregate_author_works(
+                    state, author_id, f"{author_filter},from_updated_date:{state['updated']}"
+                )
+                print(f"[OpenAlexGraphService] Author {author_id}: {changed} works updated since {state['updated']}")
+                refreshed = True
+            except httpx.HTTPError as e:
+                print(f"[OpenAlexGraphService] Incremental refresh failed for {author_id}, rebuilding: {e}")
+        if not refreshed:
+            state = {"works": {}, "counts": {}, "names": {}}
+            total = await self._aggregate_author_works(state, author_id, author_filter)
+            print(f"[OpenAlexGraphService] Author {author_id}: aggregated {total} works")
+
+        state["updated"] = started.strftime("%Y-%m-%d")
+        state["fetched_at"] = time.time()
+        if self.cache is not None:
+            self.cache.set(author_id, state, namespace="author_works")
+        return state
+
+    async def _aggregate_author_works(self, state: dict, author_id: str, work_filter: str) -> int:
+        """
+        Fold every work matching `work_filter` into `state` page by page.
+        A work seen before replaces its previous contribution, so re-fetched
+        (updated) works are not double counted. Returns the number of works.
+        """
+        center = f"{ENTITY_BASE}/{author_id}"
+        works, counts, names = state["works"], state["counts"], state["names"]
+        seen = 0
+        async for page in self._iter_work_pages({"filter": work_filter, "select": AUTHOR_WORK_FIELDS}):
+            for w in page:
+                coauthors = []
+                for a in w.get("authorships") or []:
+                    author = a.get("author") or {}
+                    aid = author.get("id")
+                    if not aid:
+                        continue
+                    names[aid] = clean_html_tags(author.get("display_name") or "") or names.get(aid)
+                    if aid != center and aid not in coauthors:
+                        coauthors.append(aid)
+
+                for aid in works.get(w["id"], []):
+                    counts[aid] -= 1
+                    if counts[aid] <= 0:
+                        del counts[aid]
+                for aid in coauthors:
+                    counts[aid] = counts.get(aid, 0) + 1
+                works[w["id"]] = coauthors
+                seen += 1
+        return seen
 
     # ---------- Topic Trend ----------
-    def topic_trend(self, keyword: str, years: int = 10):
+    async def topic_trend(self, keyword: str, years: int = 10):
         end = datetime.utcnow().year
         start = end - years + 1
-        points = []
 
-        # Use OpenAlex search + count for each year
-        for y in range(start, end + 1):
-            params = {"search": keyword, "filter": f"from_publication_date:{y}-01-01,to_publication_date:{y}-12-31", "per_page": 1}
-            r = requests.get(f"{BASE}/works", params=params, timeout=15)
-            if r.status_code != 200:
+        # One grouped aggregation returns the per-year histogram for the whole range
+        params = {
+            "search": keyword,
+            "filter": f"from_publication_date:{start}-01-01,to_publication_date:{end}-12-31",
+            "group_by": "publication_year",
+        }
+        r = await get_async_client().get(f"{BASE}/works", params=params, timeout=15)
+        r.raise_for_status()
+
+        counts = {}
+        for group in r.json().get("group_by", []):
+            try:
+                counts[int(group.get("key"))] = group.get("count", 0)
+            except (TypeError, ValueError):
                 continue
-            meta = r.json().get("meta", {})
-            total = meta.get("count", 0)
-            points.append({"year": y, "count": total})
 
-        return {"keyword": keyword, "points": points, "range": {"start": start, "end": end}}
\ No newline at end of file
+        points = [{"year": y, "count": counts.get(y, 0)} for y in range(start, end + 1)]
+        return {"keyword": keyword, "points": points, "range": {"start": start, "end": end}}
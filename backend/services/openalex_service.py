@@ -1,7 +1,9 @@
 # backend/services/openalex_service.py
-import requests
-from typing import List, Optional
+import httpx
+import urllib.parse
+from typing import List, Optional, Tuple
 from models.schemas import LiteratureItem, Author
+from services.http_client import get_async_client
 import logging
 import re
 import html
@@ -12,79 +14,113 @@ class OpenAlexService:
     """Service for interacting with OpenAlex API"""
 
     BASE_URL = "https://api.openalex.org/works" 
+    # OpenAlex maximum per-page (deep paging)
+    MAX_PER_PAGE = 200
 
-    def __init__(self):
-        self.session = requests.Session()
-
-    def search_literature(self, keyword: str, limit: int = 10, sort_by: str = "relevance") -> List[LiteratureItem]:
-        """Search literature using OpenAlex API"""
+    async def search_literature_async(self, keyword: str, limit: int = 10, sort_by: str = "relevance") -> List[LiteratureItem]:
+        """Search literature using the shared HTTP client"""
         try:
-
-            sort_param = None
-            if sort_by == "year":
-                sort_param = "publication_year:desc"
-            elif sort_by == "citations":
-                sort_param = "cited_by_count:desc" 
-
-            params = {
-                "search": keyword,
-                "per-page": limit,
-            }
-            
-            if sort_param:
-                params["sort"] = sort_param
-
+            params = self._search_params(keyword, limit, sort_by)
             logger.info(f"[OpenAlex] Searching keyword='{keyword}', sort_by='{sort_by}', params={params}")
-            
-            response = self.session.get(
-                self.BASE_URL, 
-                params=params,
-                timeout=30
-            )
-            
+
+            response = await get_async_client().get(self.BASE_URL, params=params, timeout=30)
             response.raise_for_status()
-            
-            logger.info(f"[OpenAlex] Response status: {response.status_code}")
 
-            data = response.json()
-            results = data.get("results", [])
-            meta = data.get("meta", {})
-            
-            total_count = meta.get("count", 0)
-            logger.info(f"[OpenAlex] API returned {len(results)} results (total available: {total_count})")
-
-            if not results:
-                logger.warning(f"[OpenAlex] No results found for keyword='{keyword}'")
-                return []
-
-            # Parse results and filter out invalid ones (None)
-            parsed_results = []
-            for work in results:
-                parsed = self._parse_openalex_work(work)
-                if parsed is not None:  # Only add valid results
-                    parsed_results.append(parsed)
-            
-            logger.info(f"[OpenAlex] Returning {len(parsed_results)} valid results (filtered from {len(results)})")
-            
-            if sort_by == "citations":
-                parsed_results.sort(
-                    key=lambda x: x.citation_count if x.citation_count is not None else 0, 
-                    reverse=True
-                )
-                logger.info(f"[OpenAlex] Applied client-side sorting by citations")
-            
-            return parsed_results
+            logger.info(f"[OpenAlex] Response status: {response.status_code}")
+            return self._parse_search_response(response.json(), keyword, sort_by)
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error(f"[OpenAlex] Request timeout for keyword='{keyword}'")
             return []
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"[OpenAlex] HTTP Error: {e}")
             return []
         except Exception as e:
             logger.error(f"[OpenAlex] Unknown error: {e}", exc_info=True)
             return []
 
+    async def search_page_async(
+        self, keyword: str, limit: int = 10, cursor: Optional[str] = None
+    ) -> Tuple[List[LiteratureItem], Optional[str]]:
+        """
+        Fetch `limit` results (relevance order) starting at a deep-paging cursor
+
+        Pages of up to MAX_PER_PAGE are walked with OpenAlex cursor paging,
+        which (unlike page=N) is not limited to the first 10,000 results.
+        HTTP errors are raised to the caller.
+
+        Args:
+            keyword: Search query keyword
+            limit: Number of results to return
+            cursor: Cursor from a previous call, None for the first page
+
+        Returns:
+            (items, next cursor or None when the results are exhausted)
+        """
+        cursor = cursor or "*"
+        items = []
+        while len(items) < limit:
+            per_page = min(limit - len(items), self.MAX_PER_PAGE)
+            params = {**self._search_params(keyword, per_page, "relevance"), "cursor": cursor}
+            response = await get_async_client().get(self.BASE_URL, params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            results = data.get("results", [])
+            items.extend(work for work in map(self._parse_openalex_work, results) if work is not None)
+            cursor = data.get("meta", {}).get("next_cursor")
+            if len(results) < per_page or not cursor:
+                return items, None
+        logger.info(f"[OpenAlex] Deep page for '{keyword}': {len(items)} results")
+        return items, cursor
+
+    @staticmethod
+    def _search_params(keyword: str, limit: int, sort_by: str) -> dict:
+        """Build query parameters for an OpenAlex works search"""
+        sort_param = None
+        if sort_by == "year":
+            sort_param = "publication_year:desc"
+        elif sort_by == "citations":
+            sort_param = "cited_by_count:desc" 
+
+        params = {
+            "search": keyword,
+            "per-page": limit,
+        }
+        
+        if sort_param:
+            params["sort"] = sort_param
+        return params
+
+    def _parse_search_response(self, data: dict, keyword: str, sort_by: str) -> List[LiteratureItem]:
+        """Convert an OpenAlex works response into LiteratureItem objects"""
+        results = data.get("results", [])
+        meta = data.get("meta", {})
+        
+        total_count = meta.get("count", 0)
+        logger.info(f"[OpenAlex] API returned {len(results)} results (total available: {total_count})")
+
+        if not results:
+            logger.warning(f"[OpenAlex] No results found for keyword='{keyword}'")
+            return []
+
+        # Parse results and filter out invalid ones (None)
+        parsed_results = []
+        for work in results:
+            parsed = self._parse_openalex_work(work)
+            if parsed is not None:  # Only add valid results
+                parsed_results.append(parsed)
+        
+        logger.info(f"[OpenAlex] Returning {len(parsed_results)} valid results (filtered from {len(results)})")
+        
+        if sort_by == "citations":
+            parsed_results.sort(
+                key=lambda x: x.citation_count if x.citation_count is not None else 0, 
+                reverse=True
+            )
+            logger.info(f"[OpenAlex] Applied client-side sorting by citations")
+        
+        return parsed_results
+
     def _parse_openalex_work(self, work: dict) -> LiteratureItem:
         """Parse OpenAlex work JSON into LiteratureItem schema"""
         try:
@@ -185,25 +221,36 @@ class OpenAlexService:
             logger.warning(f"[OpenAlex] Abstract reconstruction failed: {e}")
             return None
 
-    def get_by_openalex_id(self, openalex_id: str) -> Optional[LiteratureItem]:
-        """Fetch specific work by OpenAlex ID"""
+    @staticmethod
+    def _work_url(openalex_id: str) -> str:
+        """Build the works URL for a bare, W-prefixed or full-URL OpenAlex ID"""
+        if not openalex_id.startswith("https://"):
+            if not openalex_id.startswith("W"):
+                openalex_id = f"W{openalex_id}"
+            return f"https://api.openalex.org/works/{openalex_id}"
+        work_id = openalex_id.split("/")[-1]
+        return f"https://api.openalex.org/works/{work_id}"
+
+    async def get_by_openalex_id_async(self, openalex_id: str) -> Optional[LiteratureItem]:
+        """Fetch a work by OpenAlex ID using the shared HTTP client"""
         try:
-            if not openalex_id.startswith("https://"):
-                if not openalex_id.startswith("W"):
-                    openalex_id = f"W{openalex_id}"
-                url = f"https://api.openalex.org/works/{openalex_id}"
-            else:
-                work_id = openalex_id.split("/")[-1]
-                url = f"https://api.openalex.org/works/{work_id}"
-            
             logger.info(f"[OpenAlex] Fetching work by ID: {openalex_id}")
-            
-            response = self.session.get(url, timeout=10)
+            response = await get_async_client().get(self._work_url(openalex_id), timeout=10)
             response.raise_for_status()
-            
-            work = response.json()
-            return self._parse_openalex_work(work)
-            
+            return self._parse_openalex_work(response.json())
+
         except Exception as e:
             logger.error(f"[OpenAlex] Failed to fetch work {openalex_id}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def get_by_doi_async(self, doi: str) -> Optional[LiteratureItem]:
+        """Fetch a work by DOI using the shared HTTP client"""
+        try:
+            encoded = urllib.parse.quote(f"https://doi.org/{doi}", safe="")
+            response = await get_async_client().get(f"{self.BASE_URL}/{encoded}", timeout=10)
+            response.raise_for_status()
+            return self._parse_openalex_work(response.json())
+
+        except Exception as e:
+            logger.error(f"[OpenAlex] Failed to fetch DOI {doi}: {e}")
+            return None
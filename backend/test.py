@@ -129,6 +129,53 @@ def test_with_auth(token):
         return False
 
 
+def test_event_loop_not_blocked(threshold_ms: float = 250.0):
+    """
+    Check that slow upstream requests don't block the event loop:
+    while recommendation and knowledge-graph requests are in flight,
+    /health must keep answering within the threshold.
+    """
+    print("=" * 60)
+    print("TEST 5: Event Loop Responsiveness")
+    print("=" * 60)
+    
+    import time
+    import random
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Uncached, upstream-bound requests (random max_nodes bypasses the graph cache)
+    slow_urls = [
+        f"{BASE_URL}/api/recommendations/by-interest/AI?limit=5",
+        f"{BASE_URL}/api/knowledge/citation-graph/10.1038/nature14539?max_nodes={random.randint(61, 999)}",
+        f"{BASE_URL}/api/knowledge/topic-graph/transformers/top-cited?n={random.randint(11, 50)}",
+    ]
+    
+    try:
+        with ThreadPoolExecutor(max_workers=len(slow_urls)) as pool:
+            futures = [pool.submit(requests.get, url, timeout=120) for url in slow_urls]
+            
+            latencies = []
+            while not all(f.done() for f in futures):
+                start = time.perf_counter()
+                requests.get(f"{BASE_URL}/health", timeout=10)
+                latencies.append((time.perf_counter() - start) * 1000)
+                time.sleep(0.05)
+        
+        worst = max(latencies) if latencies else 0.0
+        loop_stats = requests.get(f"{BASE_URL}/health").json().get("event_loop", {})
+        print(f"Health probes: {len(latencies)}, worst latency: {worst:.0f}ms")
+        print(f"Server-side loop lag: {loop_stats}")
+        
+        if worst > threshold_ms:
+            print(f"✗ Event loop blocked: /health took {worst:.0f}ms (threshold {threshold_ms:.0f}ms)\n")
+            return False
+        print("✓ Event loop stayed responsive\n")
+        return True
+    except Exception as e:
+        print(f"✗ Failed: {e}\n")
+        return False
+
+
 def main():
     import sys
     
@@ -144,7 +191,8 @@ def main():
         "health": test_health(),
         "personalized_no_auth": test_personalized_no_auth(),
         "by_interest": test_by_interest() or True,  # This doesn't return bool
-        "with_auth": test_with_auth(token) if token else None
+        "with_auth": test_with_auth(token) if token else None,
+        "event_loop_not_blocked": test_event_loop_not_blocked()
     }
     
     print("=" * 60)
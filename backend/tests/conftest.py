@@ -0,0 +1,27 @@
+# backend/tests/conftest.py
+import os
+import sys
+
+import pytest
+
+# Modules import each other as top-level packages (services, models, ...), as when run from backend/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def knowledge(tmp_path, monkeypatch):
+    """api.knowledge with its cache and graph store on temporary files."""
+    # The module opens cache.db / graph_store.db in the working directory on import
+    monkeypatch.chdir(tmp_path)
+    from api import knowledge as module
+    from services.cache_service import CacheService
+    from services.graph_store import GraphStore
+
+    cache = CacheService(db_path=str(tmp_path / "cache.db"))
+    store = GraphStore(db_path=str(tmp_path / "graph_store.db"))
+    monkeypatch.setattr(module, "cache", cache)
+    monkeypatch.setattr(module.openalex, "cache", cache)
+    monkeypatch.setattr(module, "graph_store", store)
+    yield module
+    cache.close()
+    store.close()
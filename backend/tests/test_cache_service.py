@@ -0,0 +1,197 @@
+# backend/tests/test_cache_service.py
+import asyncio
+import json
+import sqlite3
+import time
+import zlib
+
+import pytest
+
+from services import cache_service
+from services.cache_service import CacheService, Uncached
+
+
+@pytest.fixture
+def cache(tmp_path):
+    service = CacheService(db_path=str(tmp_path / "cache.db"))
+    yield service
+    service.close()
+
+
+def test_cancelled_leader_does_not_cancel_joiners(cache):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"value": 1}
+
+    async def scenario():
+        leader = asyncio.create_task(cache.get_or_fetch("search", "k", fetch))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(cache.get_or_fetch("search", "k", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await joiner
+
+    assert asyncio.run(scenario()) == {"value": 1}
+    assert len(calls) == 1
+    assert cache.get("k", "search") == {"value": 1}
+
+
+def test_fetch_is_cancelled_when_last_waiter_leaves(cache):
+    cancelled = []
+
+    async def fetch():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario():
+        caller = asyncio.create_task(cache.get_or_fetch("search", "k", fetch))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+    assert cancelled == [True]
+    assert not cache._inflight
+
+
+def test_memory_hits_are_isolated_from_caller_mutations(cache):
+    value = {"nodes": [{"id": "A1"}]}
+    cache.set("author", value, "author_network")
+    value["nodes"].append({"id": "mutated by setter"})
+
+    hit = cache.get("author", "author_network")
+    hit["nodes"].append({"id": "mutated by reader"})
+
+    assert cache.get("author", "author_network") == {"nodes": [{"id": "A1"}]}
+
+
+def test_uncached_results_reach_every_caller_but_are_not_stored(cache):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return Uncached(["partial"])
+
+    async def burst():
+        return await asyncio.gather(*[cache.get_or_fetch("search", "k", fetch) for _ in range(3)])
+
+    assert asyncio.run(burst()) == [["partial"]] * 3
+    assert len(calls) == 1
+    assert cache.get("k", "search") is None
+
+
+def test_sweep_deletes_and_evicts_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_service, "CACHE_SWEEP_BATCH", 3)
+    cache = CacheService(db_path=str(tmp_path / "cache.db"), max_rows=5, memory_items=0)
+    try:
+        for i in range(10):
+            cache.set(f"old{i}", i, ttl=-10)
+        for i in range(12):
+            cache.set(f"new{i}", i)
+        stats = cache.sweep()
+        assert (stats["expired"], stats["evicted"]) == (10, 7)
+        assert sum(cache.get(f"new{i}") is not None for i in range(12)) == 5
+    finally:
+        cache.close()
+
+
+def test_services_share_one_cache_instance(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_service, "CACHE_DB_PATH", str(tmp_path / "shared.db"))
+    monkeypatch.setattr(cache_service, "_shared", None)
+    from services.literature_aggregator import LiteratureAggregator
+
+    shared = cache_service.get_cache_service()
+    try:
+        assert LiteratureAggregator().cache is shared
+        assert cache_service.get_cache_service() is shared
+    finally:
+        shared.close()
+
+
+def _legacy_db(path, rows):
+    """cache.db in the original format: JSON text values, no codec / access columns."""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value TEXT, expiry REAL)")
+    conn.executemany("INSERT INTO cache VALUES (?, ?, ?)", [(k, v, time.time() + 3600) for k, v in rows])
+    conn.commit()
+    conn.close()
+
+
+def _stored(path):
+    conn = sqlite3.connect(path)
+    try:
+        return {key: (codec, value) for key, value, codec in conn.execute("SELECT key, value, codec FROM cache")}
+    finally:
+        conn.close()
+
+
+def test_legacy_rows_are_read_and_migrated(tmp_path):
+    path = str(tmp_path / "cache.db")
+    _legacy_db(path, [("graph", json.dumps({"nodes": [1, 2]})), ("broken", "{not json")])
+    cache = CacheService(db_path=path, memory_items=0)
+    try:
+        assert _stored(path)["graph"][0] is None
+        assert cache.get("graph") == {"nodes": [1, 2]}  # NULL codec rows decode as JSON text
+
+        assert cache.migrate_legacy_rows() == 2
+        stored = _stored(path)
+        assert set(stored) == {"graph"}  # unreadable rows are dropped
+        assert stored["graph"][0] == "zlib-json/1"
+        assert json.loads(zlib.decompress(stored["graph"][1])) == {"nodes": [1, 2]}
+        assert cache.get("graph") == {"nodes": [1, 2]}
+        assert cache.migrate_legacy_rows() == 0
+    finally:
+        cache.close()
+
+
+def test_migration_does_not_overwrite_a_concurrent_set(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.db")
+    _legacy_db(path, [("racy", json.dumps("old"))])
+    cache = CacheService(db_path=path, memory_items=0)
+    decode = cache_service.JsonCodec.decode
+
+    def decode_then_race(self, data):
+        value = decode(self, data)
+        if value == "old":
+            cache.set("racy", "new")  # written between the migration's read and its write-back
+        return value
+
+    monkeypatch.setattr(cache_service.JsonCodec, "decode", decode_then_race)
+    try:
+        cache.migrate_legacy_rows()
+        assert cache.get("racy") == "new"
+    finally:
+        cache.close()
+
+
+@pytest.mark.parametrize("policy, survivors", [("lru", {"a", "c"}), ("lfu", {"a", "b"})])
+def test_eviction_policies(tmp_path, monkeypatch, policy, survivors):
+    clock = [1000.0]
+    monkeypatch.setattr(cache_service.time, "time", lambda: clock[0])
+    cache = CacheService(db_path=str(tmp_path / "cache.db"), max_rows=2, eviction=policy)
+    try:
+        for key in ("a", "b", "c"):
+            clock[0] += 1
+            cache.set(key, key)
+        for key in ("a", "a", "b", "a", "b"):  # a: 3 hits, b: 2 hits, c: none; b is least recent
+            clock[0] += 1
+            cache.get(key)
+        clock[0] += 1
+        cache.get("c")
+        cache.get("a")
+
+        assert cache.sweep()["evicted"] == 1
+        assert {key for key in ("a", "b", "c") if cache.get(key) is not None} == survivors
+    finally:
+        cache.close()
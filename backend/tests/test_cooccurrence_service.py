@@ -0,0 +1,57 @@
+# backend/tests/test_cooccurrence_service.py
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from services.cooccurrence_service import cooccurrence_graph
+
+DOCS = [
+    [("a", 1.0), ("b", 0.5), ("c", 1.0)],
+    [("a", 0.5), ("b", 1.0)],
+    [("a", 1.0), ("b", 1.0), ("c", 0.5), ("a", 0.2)],  # duplicate concept counts once (best score)
+    [("c", 1.0), ("d", 1.0)],
+]
+
+
+def _edges(graph):
+    return {(e["source"], e["target"]): e["weight"] for e in graph["edges"]}
+
+
+def test_counts_and_threshold():
+    graph = cooccurrence_graph(DOCS, min_count=2)
+
+    nodes = {n["id"]: (n["count"], n["score"]) for n in graph["nodes"]}
+    assert nodes == {"a": (3, 2.5), "b": (3, 2.5), "c": (3, 2.5), "d": (1, 1.0)}
+    assert _edges(graph) == {("a", "b"): 3, ("a", "c"): 2, ("b", "c"): 2}
+    assert ("c", "d") in _edges(cooccurrence_graph(DOCS, min_count=1))
+
+
+def test_weighted_edges_and_top_k():
+    graph = cooccurrence_graph(DOCS, min_count=2, weighted=True)
+    assert _edges(graph) == pytest.approx({("a", "b"): 2.0, ("a", "c"): 1.5, ("b", "c"): 1.0})
+    assert all(isinstance(e["count"], int) for e in graph["edges"])
+
+    strongest = cooccurrence_graph(DOCS, min_count=2, top_k=2, weighted=True)
+    assert list(_edges(strongest)) == [("a", "b"), ("a", "c")]
+    assert list(_edges(cooccurrence_graph(DOCS, min_count=2, top_k=1))) == [("a", "b")]
+
+
+def test_matches_pairwise_counting():
+    rng = random.Random(7)
+    concepts = [f"c{i}" for i in range(30)]
+    docs = [[(name, 1.0) for name in rng.sample(concepts, rng.randint(0, 8))] for _ in range(300)]
+
+    expected = Counter()
+    for doc in docs:
+        expected.update(frozenset(pair) for pair in combinations(sorted({name for name, _ in doc}), 2))
+
+    graph = cooccurrence_graph(docs, min_count=3)
+    found = {frozenset((e["source"], e["target"])): e["count"] for e in graph["edges"]}
+    assert found == {pair: count for pair, count in expected.items() if count >= 3}
+
+
+def test_empty_input():
+    assert cooccurrence_graph([]) == {"nodes": [], "edges": []}
+    assert cooccurrence_graph([[("", 1.0)]]) == {"nodes": [], "edges": []}
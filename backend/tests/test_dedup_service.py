@@ -0,0 +1,40 @@
+from services.dedup_service import find_duplicate_clusters
+
+
+def _clusters(records):
+    titles, surnames, years, dois = zip(*records)
+    return find_duplicate_clusters(list(titles), list(surnames), list(years), list(dois))
+
+
+def test_numbered_titles_stay_separate():
+    records = [
+        ("Convolutional networks for large scale handwriting recognition: Part I", "lecun", 2019, None),
+        ("Convolutional networks for large scale handwriting recognition: Part II", "lecun", 2019, None),
+        ("Measurement of the inclusive jet cross section in pp collisions at 7 TeV", "chatrchyan", 2013, None),
+        ("Measurement of the inclusive jet cross section in pp collisions at 8 TeV", "chatrchyan", 2013, None),
+        ("COVID-19 weekly epidemiological update 12", "", 2020, None),
+        ("COVID-19 weekly epidemiological update 13", "", 2020, None),
+    ]
+    assert _clusters(records) == [[0], [1], [2], [3], [4], [5]]
+
+
+def test_preprint_does_not_bridge_two_registered_dois():
+    records = [
+        ("Deep residual learning for image recognition", "he", 2016, "10.1109/CVPR.2016.90"),
+        ("Deep Residual Learning for Image Recognition", "he", 2015, "10.48550/arXiv.1512.03385"),
+        ("Deep residual learning for image recognition.", "he", 2016, "10.9999/other.2016.1"),
+    ]
+    clusters = _clusters(records)
+    assert not any(0 in cluster and 2 in cluster for cluster in clusters)
+    assert [0, 1] in clusters
+
+
+def test_preprint_and_published_version_merge():
+    records = [
+        ("BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding",
+         "devlin", 2018, "10.48550/arXiv.1810.04805"),
+        ("Unrelated survey of graph neural networks", "wu", 2020, None),
+        ("BERT: Pre-training of deep bidirectional transformers for language understanding.",
+         "devlin", 2019, "10.18653/v1/N19-1423"),
+    ]
+    assert _clusters(records) == [[0, 2], [1]]
@@ -0,0 +1,82 @@
+# backend/tests/test_event_loop.py
+"""
+The async route handlers must not block the event loop: with upstream APIs
+answering slowly (mocked), utils/loop_monitor.monitor_event_loop runs next
+to the handlers and its worst measured lag has to stay under the threshold.
+"""
+import asyncio
+import json
+
+import httpx
+
+from services import http_client
+from utils import loop_monitor
+
+LAG_THRESHOLD = 0.1   # seconds, the monitor's default LOOP_LAG_THRESHOLD
+UPSTREAM_DELAY = 0.05
+
+
+def _work(n, refs=0):
+    return {
+        "id": f"https://openalex.org/W{n}", "display_name": f"Work {n}", "title": f"Work {n}",
+        "doi": f"https://doi.org/10.1/w{n}", "cited_by_count": n % 997,
+        "referenced_works": [f"https://openalex.org/W{n * 10 + i}" for i in range(1, refs + 1)],
+        "concepts": [{"display_name": f"Concept {(n + i) % 40}", "score": 0.5} for i in range(8)],
+        "authorships": [{"author": {"id": f"https://openalex.org/A{(n + i) % 300}", "display_name": f"Author {i}"}}
+                        for i in range(6)],
+    }
+
+
+async def _upstream(request):
+    """Slow but well-behaved COCI / Lens / OpenAlex / CrossRef."""
+    await asyncio.sleep(UPSTREAM_DELAY)
+    host, path, params = request.url.host, request.url.path, request.url.params
+    if host == "opencitations.net":
+        key = "citing" if "/citations/" in path else "cited"
+        return httpx.Response(200, json=[{key: f"10.2/{key}{i}"} for i in range(300)])
+    if host == "api.lens.org":
+        return httpx.Response(200, json={"data": []})
+    if host != "api.openalex.org":
+        return httpx.Response(404)
+    if path.startswith("/works/"):
+        return httpx.Response(200, json=_work(1, refs=150))
+    if "page" in params and "filter" in params:  # author works, paged
+        page = int(params["page"])
+        works = [_work(page * 1000 + i) for i in range(int(params["per_page"]))]
+        return httpx.Response(200, json={"results": works, "meta": {"count": 1000}})
+    if "search" in params:  # topic works
+        return httpx.Response(200, json={"results": [_work(i, refs=20) for i in range(int(params["per-page"]))]})
+    kind, _, ids = params.get("filter", "").partition(":")
+    if kind == "cites":
+        return httpx.Response(200, json={"results": [_work(5000 + i) for i in range(25)], "meta": {}})
+    works = [_work(int(i.lstrip("W")), refs=3) for i in ids.split("|") if i]
+    return httpx.Response(200, json={"results": works, "meta": {"count": len(works)}})
+
+
+def test_handlers_do_not_block_the_event_loop(knowledge, monkeypatch):
+    monkeypatch.setattr(loop_monitor, "loop_lag_stats", {"last_lag": 0.0, "max_lag": 0.0, "blocked_count": 0})
+
+    async def scenario():
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(_upstream))
+        monitor = asyncio.create_task(loop_monitor.monitor_event_loop(interval=0.01, threshold=LAG_THRESHOLD))
+        try:
+            return await asyncio.gather(
+                knowledge.get_citation_graph("10.1/w1", max_nodes=300, analytics=True, layout="fr"),
+                knowledge.get_citation_graph("10.1/w1", max_nodes=300, depth=2, analytics=True, layout="kk"),
+                knowledge.get_author_network("A1", limit=200, analytics=True, layout="fr"),
+                knowledge.topic_graph("transformers", n=50, keyword_n=200),
+            )
+        finally:
+            monitor.cancel()
+            await http_client.close_async_client()
+
+    citation, multihop, authors, topic = asyncio.run(scenario())
+
+    # The handlers did real work...
+    assert len(citation["nodes"]) > 300 and all("x" in node for node in citation["nodes"])
+    assert {node["meta"]["hop"] for node in multihop["nodes"]} == {0, 1, 2}
+    assert len(authors["nodes"]) > 100 and "pagerank" in json.dumps(authors)
+    assert topic["keywords"]["nodes"]
+    # ...without stalling the loop
+    stats = loop_monitor.loop_lag_stats
+    assert stats["blocked_count"] == 0, f"event loop blocked, worst lag {stats['max_lag'] * 1000:.0f}ms"
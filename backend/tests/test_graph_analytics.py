@@ -0,0 +1,27 @@
+# backend/tests/test_graph_analytics.py
+from services.graph_analytics import analyze_graph
+
+
+def _graph_with_duplicate_node():
+    # COCI lists a work once as citing and once as cited when two works cite each other
+    return {
+        "nodes": [
+            {"id": "10.1/a", "label": "A"},
+            {"id": "10.1/b", "label": "B"},
+            {"id": "10.1/a", "label": "A"},
+        ],
+        "edges": [
+            {"source": "10.1/a", "target": "10.1/b"},
+            {"source": "10.1/b", "target": "10.1/a"},
+        ],
+    }
+
+
+def test_analyze_graph_with_duplicate_node():
+    annotated = analyze_graph(_graph_with_duplicate_node())
+
+    assert len(annotated["nodes"]) == 3
+    first, second, repeated = (node["meta"] for node in annotated["nodes"])
+    assert first == repeated
+    assert first["in_degree"] == first["out_degree"] == 1
+    assert abs(first["pagerank"] - second["pagerank"]) < 1e-6
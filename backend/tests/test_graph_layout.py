@@ -0,0 +1,38 @@
+# backend/tests/test_graph_layout.py
+import pytest
+
+from services import graph_layout
+from services.graph_layout import layout_graph, LayoutTooLargeError
+
+
+@pytest.mark.parametrize("algorithm", ["fr", "kk"])
+def test_layout_with_duplicate_node(algorithm):
+    graph = {
+        "nodes": [{"id": "a"}, {"id": "b"}, {"id": "a"}],
+        "edges": [{"source": "a", "target": "b"}, {"source": "b", "target": "a"}],
+    }
+    nodes = layout_graph(graph, algorithm)["nodes"]
+
+    assert len(nodes) == 3
+    assert (nodes[0]["x"], nodes[0]["y"]) == (nodes[2]["x"], nodes[2]["y"])
+    assert (nodes[0]["x"], nodes[0]["y"]) != (nodes[1]["x"], nodes[1]["y"])
+
+
+def test_large_graph_uses_grid_repulsion(monkeypatch):
+    monkeypatch.setattr(graph_layout, "FR_EXACT_LIMIT", 10)
+    graph = {
+        "nodes": [{"id": str(i)} for i in range(50)],
+        "edges": [{"source": str(i), "target": str(i - 1)} for i in range(1, 50)],
+    }
+    laid_out = layout_graph(graph, "fr")
+
+    positions = {(node["x"], node["y"]) for node in laid_out["nodes"]}
+    assert len(positions) == 50
+
+
+def test_layout_rejects_oversized_graph(monkeypatch):
+    monkeypatch.setattr(graph_layout, "LAYOUT_MAX_NODES", 2)
+    graph = {"nodes": [{"id": "a"}, {"id": "b"}, {"id": "c"}], "edges": []}
+
+    with pytest.raises(LayoutTooLargeError):
+        layout_graph(graph, "fr")
@@ -0,0 +1,122 @@
+# backend/tests/test_graph_store.py
+import sqlite3
+
+import pytest
+
+from services.graph_store import GraphStore
+
+
+def _graph(source):
+    return {
+        "nodes": [
+            {"id": "10.1/center", "label": "Center", "meta": {"doi": "10.1/center", "cited_by": 5}},
+            {"id": "10.1/ref", "label": "Reference", "meta": {"doi": "10.1/ref", "cited_by": 9}},
+            {"id": "10.1/citer", "label": "Citer", "meta": {"doi": "10.1/citer", "cited_by": 1}},
+        ],
+        "edges": [
+            {"source": "10.1/center", "target": "10.1/ref", "type": "cites"},
+            {"source": "10.1/citer", "target": "10.1/center", "type": "cited_by"},
+        ],
+        "source": source,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    graph_store = GraphStore(db_path=str(tmp_path / "graph_store.db"))
+    yield graph_store
+    graph_store.close()
+
+
+def test_neighbourhood_only_matches_its_build_mode(store):
+    store.add_graph(_graph("OpenAlex"), ["10.1/center"], 60, mode="first")
+
+    assert store.neighbourhood("10.1/center", 1, 60, mode="merged") is None
+    assert store.neighbourhood("10.1/center", 1, 60, mode="first") is not None
+
+    store.add_graph(_graph("OpenCitations (COCI) + OpenAlex"), ["10.1/center"], 60, mode="merged")
+    assert store.neighbourhood("10.1/center", 1, 60, mode="merged") is not None
+
+
+def test_neighbourhood_keeps_edge_types(store):
+    store.add_graph(_graph("OpenAlex"), ["10.1/center"], 60)
+    graph = store.neighbourhood("10.1/center", 1, 60)
+
+    types = {(e["source"], e["target"]): e["type"] for e in graph["edges"]}
+    assert types == {("10.1/center", "10.1/ref"): "cites", ("10.1/citer", "10.1/center"): "cited_by"}
+
+
+def test_expansions_without_mode_are_dropped(tmp_path):
+    path = str(tmp_path / "graph_store.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE expanded (id TEXT PRIMARY KEY, provider TEXT, expanded_at REAL, budget INTEGER)")
+    conn.execute("INSERT INTO expanded VALUES ('10.1/center', 'OpenAlex', 0, 60)")
+    conn.commit()
+    conn.close()
+
+    graph_store = GraphStore(db_path=path)
+    try:
+        assert graph_store.stats()["expanded"] == 0
+    finally:
+        graph_store.close()
+
+
+def _star(center, source, refs, citers, prefix="10.1/"):
+    nodes = [{"id": center, "label": "Center", "meta": {"doi": center, "cited_by": 0}}]
+    edges = []
+    for i in range(refs):
+        wid = f"{prefix}ref{i}"
+        nodes.append({"id": wid, "label": wid, "meta": {"doi": wid, "cited_by": i}})
+        edges.append({"source": center, "target": wid, "type": "cites"})
+    for i in range(citers):
+        wid = f"{prefix}citer{i}"
+        nodes.append({"id": wid, "label": wid, "meta": {"doi": wid, "cited_by": i}})
+        edges.append({"source": wid, "target": center, "type": "cited_by"})
+    return {"nodes": nodes, "edges": edges, "source": source}
+
+
+def test_depth1_answer_uses_the_providers_side_limits(store):
+    store.add_graph(_star("10.1/center", "OpenCitations (COCI)", 80, 80), ["10.1/center"], 80)
+    graph = store.neighbourhood("10.1/center", 1, 60)
+    groups = [node["group"] for node in graph["nodes"]]
+    assert (groups.count("reference"), groups.count("cited_by")) == (60, 60)
+
+    store.add_graph(_star("10.1/center", "OpenAlex", 40, 25), ["10.1/center"], 80, mode="first")
+    graph = store.neighbourhood("10.1/center", 1, 60, mode="first")
+    groups = [node["group"] for node in graph["nodes"]]
+    assert (groups.count("reference"), groups.count("cited_by")) == (30, 25)
+
+
+def test_depth1_answer_ignores_edges_from_other_modes_and_providers(store):
+    store.add_graph(_star("10.1/center", "OpenCitations (COCI)", 3, 3), ["10.1/center"], 60)
+    # Same mode, but reported while expanding another work by a provider the center's expansion didn't use
+    store.add_graph({
+        "nodes": [{"id": "10.1/other", "label": "Other", "meta": {"doi": "10.1/other"}},
+                  {"id": "10.1/center", "label": "Center", "meta": {"doi": "10.1/center"}}],
+        "edges": [{"source": "10.1/other", "target": "10.1/center", "type": "cited_by"}],
+        "source": "Lens.org",
+    }, ["10.1/other"], 60)
+    # Another mode
+    store.add_graph(_star("10.1/center", "OpenAlex", 5, 0, prefix="10.2/"), ["10.1/center"], 60, mode="multihop")
+
+    graph = store.neighbourhood("10.1/center", 1, 60)
+    ids = {node["id"] for node in graph["nodes"]}
+    assert "10.1/other" not in ids
+    assert not any(i.startswith("10.2/") for i in ids)
+    assert len(graph["edges"]) == 6
+
+
+def test_old_edge_table_is_dropped(tmp_path):
+    path = str(tmp_path / "graph_store.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE edges (source TEXT, target TEXT, type TEXT, provider TEXT, updated_at REAL, "
+                 "PRIMARY KEY (source, target))")
+    conn.execute("INSERT INTO edges VALUES ('10.1/a', '10.1/b', 'cites', 'OpenAlex', 0)")
+    conn.commit()
+    conn.close()
+
+    graph_store = GraphStore(db_path=path)
+    try:
+        assert graph_store.stats()["edges"] == 0
+    finally:
+        graph_store.close()
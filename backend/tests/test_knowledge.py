@@ -0,0 +1,190 @@
+# backend/tests/test_knowledge.py
+import asyncio
+import json
+
+import httpx
+
+
+def _events(lines):
+    return [json.loads(line) for line in lines]
+
+
+def test_failed_stream_is_not_stored(knowledge, monkeypatch):
+    stored = []
+
+    class FailingOpenAlex:
+        async def stream_citation_graph(self, doi, max_nodes):
+            yield "center", {"nodes": [{"id": "W0", "label": "Center", "type": "center", "doi": doi}],
+                             "edges": []}
+            yield "references", {"nodes": [{"id": "W1", "label": "Ref", "type": "reference"}],
+                                 "edges": [{"source": "W0", "target": "W1", "type": "cites"}]}
+            raise httpx.ConnectError("citing query failed")
+
+    async def record_store(graph, expanded, max_nodes, mode):
+        stored.append(mode)
+
+    monkeypatch.setattr(knowledge, "openalex", FailingOpenAlex())
+    monkeypatch.setattr(knowledge, "_store_graph", record_store)
+
+    async def collect():
+        return [line async for line in knowledge._citation_graph_events("10.1/x", 60, "ndjson")]
+
+    events = _events(asyncio.run(collect()))
+    assert [event["event"] for event in events] == ["center", "references", "error", "done"]
+    assert stored == []
+
+
+def test_complete_stream_is_stored(knowledge, monkeypatch):
+    stored = []
+
+    class OpenAlex:
+        async def stream_citation_graph(self, doi, max_nodes):
+            yield "center", {"nodes": [{"id": "W0", "label": "Center", "type": "center", "doi": doi}],
+                             "edges": []}
+            yield "citing", {"nodes": [{"id": "W2", "label": "Citer", "type": "cited_by"}],
+                             "edges": [{"source": "W2", "target": "W0", "type": "cited_by"}]}
+
+    async def record_store(graph, expanded, max_nodes, mode):
+        stored.append(mode)
+
+    monkeypatch.setattr(knowledge, "openalex", OpenAlex())
+    monkeypatch.setattr(knowledge, "_store_graph", record_store)
+
+    async def collect():
+        return [line async for line in knowledge._citation_graph_events("10.1/x", 60, "ndjson")]
+
+    events = _events(asyncio.run(collect()))
+    assert events[-1] == {"event": "done", "source": "OpenAlex", "nodes": 2, "edges": 1}
+    assert stored == ["first"]
+
+
+def _provider(log, name, delay, edges=True, fail=False):
+    """Citation provider stub recording when it started and whether it was cancelled."""
+    async def fetch():
+        log[name] = {"started": asyncio.get_running_loop().time(), "cancelled": False}
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log[name]["cancelled"] = True
+            raise
+        if fail:
+            raise httpx.ConnectError(f"{name} down")
+        return {
+            "nodes": [{"id": "10.1/x"}, {"id": f"10.1/{name}"}],
+            "edges": [{"source": "10.1/x", "target": f"10.1/{name}"}] if edges else [],
+        }
+    return name, fetch
+
+
+def _race(knowledge, sources, merge_window=0):
+    async def run():
+        started = asyncio.get_running_loop().time()
+        graphs = await knowledge._race_providers("10.1/x", sources, merge_window)
+        await asyncio.sleep(0)  # let cancelled providers record it
+        return started, graphs
+    return asyncio.run(run())
+
+
+def test_race_hedges_starts_and_cancels_losers(knowledge, monkeypatch):
+    monkeypatch.setattr(knowledge, "PROVIDER_HEDGE_DELAY", 0.1)
+    log = {}
+    started, graphs = _race(knowledge, [
+        _provider(log, "slow", 1.0),
+        _provider(log, "fast", 0.05),
+        _provider(log, "late", 0.01),
+    ])
+
+    assert [g["source"] for g in graphs] == ["fast"]
+    assert log["slow"]["started"] - started < 0.05
+    assert 0.09 <= log["fast"]["started"] - started < 0.14
+    assert log["slow"]["cancelled"]
+    assert "late" not in log  # the winner answered before its hedge delay ran out
+
+
+def test_race_starts_next_provider_as_soon_as_one_fails(knowledge, monkeypatch):
+    monkeypatch.setattr(knowledge, "PROVIDER_HEDGE_DELAY", 0.5)
+    log = {}
+    started, graphs = _race(knowledge, [
+        _provider(log, "down", 0, fail=True),
+        _provider(log, "empty", 0, edges=False),
+        _provider(log, "backup", 0.01),
+    ])
+
+    assert [g["source"] for g in graphs] == ["backup"]
+    assert log["empty"]["started"] - started < 0.1
+    assert log["backup"]["started"] - started < 0.1
+
+
+def test_race_merge_window_collects_other_providers(knowledge, monkeypatch):
+    monkeypatch.setattr(knowledge, "PROVIDER_HEDGE_DELAY", 0.02)
+    log = {}
+    _, graphs = _race(knowledge, [
+        _provider(log, "second", 0.15),
+        _provider(log, "first", 0.03),
+        _provider(log, "too-slow", 1.0),
+    ], merge_window=0.3)
+
+    # Preference order, not completion order; the provider outside the window is cancelled
+    assert [g["source"] for g in graphs] == ["second", "first"]
+    assert log["too-slow"]["cancelled"]
+
+
+def test_merge_graphs_resolves_identities_transitively(knowledge):
+    coci = knowledge.normalize_graph({
+        "nodes": [{"id": "10.1/X", "label": "10.1/X"}, {"id": "10.1/REF", "label": "10.1/REF"}],
+        "edges": [{"source": "10.1/X", "target": "10.1/REF"}],
+    }, "10.1/x", "COCI")
+    openalex = knowledge.normalize_graph({
+        "nodes": [
+            {"id": "https://openalex.org/W1", "label": "Center title", "type": "center",
+             "doi": "https://doi.org/10.1/x", "openalex_id": "https://openalex.org/W1"},
+            {"id": "https://openalex.org/W2", "label": "Reference title", "type": "reference",
+             "openalex_id": "https://openalex.org/W2"},
+            {"id": "https://openalex.org/W3", "label": "Other reference", "type": "reference",
+             "doi": "10.1/ref2", "openalex_id": "https://openalex.org/W3"},
+        ],
+        "edges": [
+            {"source": "https://openalex.org/W1", "target": "https://openalex.org/W2", "type": "cites"},
+            {"source": "https://openalex.org/W1", "target": "https://openalex.org/W3", "type": "cites"},
+        ],
+    }, "10.1/x", "OpenAlex")
+    # Lens links OpenAlex's DOI-less W2 to COCI's 10.1/ref
+    lens = knowledge.normalize_graph({
+        "nodes": [
+            {"id": "10.1/x", "label": "Center", "lens_id": "L1"},
+            {"id": "L3", "label": "Reference", "doi": "10.1/ref", "lens_id": "L3",
+             "openalex_id": "https://openalex.org/W2"},
+        ],
+        "edges": [{"source": "10.1/x", "target": "L3"}],
+    }, "10.1/x", "Lens")
+
+    merged = knowledge.merge_graphs([coci, openalex, lens], "10.1/x")
+
+    nodes = {node["id"]: node for node in merged["nodes"]}
+    assert set(nodes) == {"10.1/x", "10.1/ref", "10.1/ref2"}
+    assert nodes["10.1/x"]["group"] == "center"
+    assert nodes["10.1/ref"]["label"] == "Reference title"  # DOI-only labels lose to real titles
+    assert nodes["10.1/ref"]["meta"]["openalex_id"] == "https://openalex.org/W2"
+    assert nodes["10.1/ref"]["meta"]["lens_id"] == "L3"
+    assert nodes["10.1/ref"]["meta"]["sources"] == ["COCI", "OpenAlex", "Lens"]
+
+    edges = {(edge["source"], edge["target"]): edge["sources"] for edge in merged["edges"]}
+    assert edges == {
+        ("10.1/x", "10.1/ref"): ["COCI", "OpenAlex", "Lens"],
+        ("10.1/x", "10.1/ref2"): ["OpenAlex"],
+    }
+    assert merged["source"] == "COCI + OpenAlex + Lens"
+
+
+def test_merge_graphs_drops_self_loops_from_merged_nodes(knowledge):
+    first = knowledge.normalize_graph({
+        "nodes": [{"id": "10.1/x"}, {"id": "https://openalex.org/W1", "doi": "10.1/x"}],
+        "edges": [{"source": "https://openalex.org/W1", "target": "10.1/x"}],
+    }, "10.1/x", "A")
+    second = knowledge.normalize_graph({
+        "nodes": [{"id": "10.1/x"}, {"id": "10.1/y"}],
+        "edges": [{"source": "10.1/x", "target": "10.1/y"}],
+    }, "10.1/x", "B")
+
+    merged = knowledge.merge_graphs([first, second], "10.1/x")
+    assert [(e["source"], e["target"]) for e in merged["edges"]] == [("10.1/x", "10.1/y")]
@@ -0,0 +1,133 @@
+# backend/tests/test_literature_aggregator.py
+import asyncio
+
+import httpx
+
+from models.schemas import LiteratureItem
+from services import http_client
+from services.cache_service import CacheService
+from services.crossref_service import CrossRefService
+from services.literature_aggregator import LiteratureAggregator
+
+
+class FakeSource:
+    def __init__(self, name, fail=False):
+        self.name = name
+        self.fail = fail
+
+    async def search_page_async(self, keyword, limit, cursor=None):
+        if self.fail:
+            raise httpx.ConnectError("unreachable")
+        start = int(cursor or 0)
+        items = [
+            LiteratureItem(title=f"{self.name} {keyword} result number {i}", source=self.name.lower())
+            for i in range(start, start + limit)
+        ]
+        return items, str(start + limit)
+
+
+def _aggregator(tmp_path):
+    aggregator = LiteratureAggregator(cache=CacheService(db_path=str(tmp_path / "cache.db")))
+    aggregator.crossref = FakeSource("crossref")
+    aggregator.arxiv = FakeSource("arxiv")
+    aggregator.openalex = FakeSource("openalex")
+    return aggregator
+
+
+def test_failed_source_is_partial_and_keeps_its_cursor(tmp_path):
+    aggregator = _aggregator(tmp_path)
+
+    async def scroll():
+        _, missing, token = await aggregator.search_page("graphs", 2)
+        assert missing == []
+        aggregator.crossref.fail = True
+        _, missing, token = await aggregator.search_page("graphs", 2, page_token=token)
+        return missing, aggregator._decode_page_token(token, aggregator._search_cache_key("graphs", 2, "all"))
+
+    missing, cursors = asyncio.run(scroll())
+    assert missing == ["CrossRef"]
+    assert cursors == {"CrossRef": "2", "ArXiv": "4", "OpenAlex": "4"}
+
+
+def test_crossref_resumes_rejected_cursor_by_offset():
+    requests = []
+
+    def handler(request):
+        params = dict(request.url.params)
+        requests.append(params)
+        if params.get("cursor") not in (None, "*"):
+            return httpx.Response(400, json={"message": "cursor expired"})
+        start = int(params.get("offset", 0))
+        rows = int(params["rows"])
+        items = [{"DOI": f"10.1/{i}", "title": [f"Work {i}"]} for i in range(start, start + rows)]
+        return httpx.Response(200, json={"message": {"items": items, "next-cursor": "live"}})
+
+    http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        items, cursor = asyncio.run(CrossRefService().search_page_async("graphs", 5, "20:expired"))
+    finally:
+        http_client._client = None
+
+    assert [item.doi for item in items] == [f"10.1/{i}" for i in range(20, 25)]
+    assert requests[-1]["offset"] == "20"
+    assert cursor == "25:"
+
+
+def test_merge_keeps_fields_from_every_record_of_a_source():
+    first = LiteratureItem(title="Attention is all you need", doi="10.1/x", source="openalex")
+    second = LiteratureItem(
+        title="Attention Is All You Need", doi="10.1/x", source="openalex",
+        abstract="The dominant sequence transduction models...", citation_count=90000
+    )
+    merged = LiteratureAggregator._merge_duplicates([first, second])
+
+    assert merged.title == "Attention is all you need"
+    assert merged.abstract == "The dominant sequence transduction models..."
+    assert merged.citation_count == 90000
+    assert merged.sources == ["openalex"]
+
+
+def test_partial_merged_set_is_not_cached(tmp_path):
+    aggregator = _aggregator(tmp_path)
+
+    async def search_twice():
+        aggregator.arxiv.fail = True
+        first = await aggregator.search_all_sources("graphs", 2)
+        aggregator.arxiv.fail = False
+        second = await aggregator.search_all_sources("graphs", 2)
+        return first, second
+
+    first, second = asyncio.run(search_twice())
+    assert "arxiv" not in {paper.source for paper in first}
+    assert "arxiv" in {paper.source for paper in second}
+
+
+def test_first_page_after_a_failed_search_is_still_partial(tmp_path):
+    aggregator = _aggregator(tmp_path)
+
+    async def scenario():
+        aggregator.arxiv.fail = True
+        await aggregator.search_all_sources("graphs", 2)
+        _, missing_while_down, _ = await aggregator.search_page("graphs", 2, deadline_ms=5000)
+        aggregator.arxiv.fail = False
+        results, missing_after, _ = await aggregator.search_page("graphs", 2, deadline_ms=5000)
+        return missing_while_down, missing_after, results
+
+    missing_while_down, missing_after, results = asyncio.run(scenario())
+    assert missing_while_down == ["ArXiv"]
+    assert missing_after == []
+    assert "arxiv" in {paper.source for paper in results}
+
+
+def test_stream_does_not_cache_when_a_source_failed(tmp_path):
+    aggregator = _aggregator(tmp_path)
+    aggregator.openalex.fail = True
+
+    async def stream():
+        return [frame async for frame in aggregator.stream_all_sources("graphs", 2)]
+
+    frames = asyncio.run(stream())
+    assert any(event == "source" and "error" in frame for event, frame in frames)
+    key = aggregator._search_cache_key("graphs", 2, "all")
+    assert aggregator.cache.get(key, "search") is None
+    assert aggregator.cache.get(f"{key}|cursors", "search") is None
@@ -0,0 +1,125 @@
+# backend/tests/test_openalex_graph_service.py
+import asyncio
+
+import httpx
+import pytest
+
+from services import http_client, openalex_graph_service
+from services.cache_service import CacheService
+from services.openalex_graph_service import OpenAlexGraphService, PAGE_CONCURRENCY, PAGE_SIZE
+
+
+def test_paged_query_is_bounded_and_retries_rate_limits(monkeypatch):
+    monkeypatch.setattr(openalex_graph_service, "PAGE_RETRY_BACKOFF", 0.001)
+    total = 12 * PAGE_SIZE
+    state = {"in_flight": 0, "max_in_flight": 0, "throttled": set()}
+
+    async def handler(request):
+        page = int(request.url.params["page"])
+        if page > 1 and page not in state["throttled"]:
+            state["throttled"].add(page)
+            return httpx.Response(429)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        results = [{"id": f"W{page}-{i}"} for i in range(PAGE_SIZE)]
+        return httpx.Response(200, json={"results": results, "meta": {"count": total}})
+
+    async def collect():
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return [work async for page in OpenAlexGraphService()._iter_work_pages({}) for work in page]
+        finally:
+            http_client._client = None
+
+    works = asyncio.run(collect())
+    assert len(works) == total
+    assert state["max_in_flight"] <= PAGE_CONCURRENCY
+    assert len(state["throttled"]) == 11
+
+
+def _citation_world(state, fail_citers=False):
+    """Mock OpenAlex: every work W<n> references 30 works and is cited by 30 works."""
+    def work(n):
+        return {
+            "id": f"https://openalex.org/W{n}", "display_name": f"Work {n}", "doi": None,
+            "cited_by_count": 1000 - n % 1000,
+            "referenced_works": [f"https://openalex.org/W{n * 100 + i}" for i in range(1, 31)],
+        }
+
+    async def handler(request):
+        if request.url.path.startswith("/works/"):
+            return httpx.Response(200, json=work(0))
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.005)
+        state["in_flight"] -= 1
+        kind, _, ids = request.url.params["filter"].partition(":")
+        numbers = [int(i[1:]) for i in ids.split("|")]
+        if kind == "cites":
+            if fail_citers:
+                return httpx.Response(503)
+            results = [work(50000 + n * 100 + i) for n in numbers[:1] for i in range(30)]
+            for w in results:
+                w["referenced_works"] = [f"https://openalex.org/W{n}" for n in numbers]
+        else:
+            results = [work(n) for n in numbers]
+        return httpx.Response(200, json={"results": results, "meta": {"count": len(results)}})
+
+    return handler
+
+
+def _run_with(handler, coro_factory):
+    async def run():
+        http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await coro_factory()
+        finally:
+            http_client._client = None
+    return asyncio.run(run())
+
+
+def test_frontier_expansion_is_bounded_and_reaches_every_depth():
+    state = {"in_flight": 0, "max_in_flight": 0}
+    service = OpenAlexGraphService()
+    graph = _run_with(_citation_world(state), lambda: service.expand_citation_graph("10.1/x", 300, depth=3))
+
+    assert state["max_in_flight"] <= PAGE_CONCURRENCY
+    assert {node["hop"] for node in graph["nodes"]} == {0, 1, 2, 3}
+
+    graph = _run_with(_citation_world(state), lambda: service.expand_citation_graph("10.1/x", 60, depth=2))
+    assert len(graph["nodes"]) <= 60
+    assert {node["hop"] for node in graph["nodes"]} == {0, 1, 2}
+
+
+def test_failed_frontier_batch_is_raised_and_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(openalex_graph_service, "PAGE_RETRY_BACKOFF", 0.001)
+    state = {"in_flight": 0, "max_in_flight": 0}
+    cache = CacheService(db_path=str(tmp_path / "cache.db"))
+    service = OpenAlexGraphService(cache=cache)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _run_with(_citation_world(state, fail_citers=True), lambda: service.expand_citation_graph("10.1/x", 60, 2))
+    assert cache.get("https://openalex.org/W0", "citation_node") is None
+
+
+def test_failed_reference_batch_fails_the_depth1_graph(monkeypatch):
+    monkeypatch.setattr(openalex_graph_service, "PAGE_RETRY_BACKOFF", 0.001)
+    center = {
+        "id": "https://openalex.org/W0", "display_name": "Center", "doi": "https://doi.org/10.1/x",
+        "referenced_works": [f"https://openalex.org/W{i}" for i in range(1, 121)],
+    }
+
+    def handler(request):
+        if request.url.path.startswith("/works/"):
+            return httpx.Response(200, json=center)
+        kind, _, ids = request.url.params["filter"].partition(":")
+        if kind == "openalex" and ids.startswith("W51|"):
+            return httpx.Response(500)  # the second reference batch never succeeds
+        works = [{"id": f"https://openalex.org/{i}", "display_name": i} for i in ids.split("|")]
+        return httpx.Response(200, json={"results": works if kind == "openalex" else [], "meta": {}})
+
+    service = OpenAlexGraphService()
+    with pytest.raises(httpx.HTTPStatusError):
+        _run_with(handler, lambda: service.build_citation_graph("10.1/x", max_nodes=300))
@@ -0,0 +1,35 @@
+# utils/loop_monitor.py
+"""
+Event loop lag monitor.
+
+A background task sleeps for a fixed interval and measures how late it wakes
+up. Lateness beyond the threshold means something ran on the loop without
+yielding (blocking I/O or heavy CPU inside an `async def`), which stalls every
+other request on the worker.
+"""
+import os
+import time
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.5"))
+LOOP_LAG_THRESHOLD = float(os.getenv("LOOP_LAG_THRESHOLD", "0.1"))
+
+# Latest measurements, exposed through /health
+loop_lag_stats = {"last_lag": 0.0, "max_lag": 0.0, "blocked_count": 0}
+
+
+async def monitor_event_loop(interval: float = LOOP_LAG_INTERVAL, threshold: float = LOOP_LAG_THRESHOLD):
+    """Measure event loop lag every `interval` seconds (runs until cancelled)."""
+    logger.info(f"[LoopMonitor] Started - interval={interval}s, threshold={threshold * 1000:.0f}ms")
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = time.perf_counter() - start - interval
+        loop_lag_stats["last_lag"] = lag
+        loop_lag_stats["max_lag"] = max(loop_lag_stats["max_lag"], lag)
+        if lag > threshold:
+            loop_lag_stats["blocked_count"] += 1
+            logger.warning(f"[LoopMonitor] Event loop blocked for {lag * 1000:.0f}ms")